@@ -0,0 +1,58 @@
+"""
+Time connected components on a random undirected graph: the serial
+union-find in Graph.get_connected_components against the shared-memory
+parallel engine with 1..N worker processes.
+
+Usage: python -m benchmarks.bench_components [--vertices N] [--edges M] [--processes P]
+"""
+import argparse
+import os
+import time
+
+import numpy
+
+from graphs.convert import from_edge_arrays
+from graphs.parallel_components import parallel_connected_components
+
+
+def random_graph(num_vertices, num_edges, seed):
+    """Return an undirected graph with uniformly random edges."""
+    rng = numpy.random.default_rng(seed)
+    sources = rng.integers(0, num_vertices, num_edges)
+    targets = rng.integers(0, num_vertices, num_edges)
+    vertex_ids = [str(row) for row in range(num_vertices)]
+    return from_edge_arrays(sources, targets, vertex_ids=vertex_ids, is_directed=False)
+
+
+def timed(function, *args):
+    """Return (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--vertices', type=int, default=200000)
+    parser.add_argument('--edges', type=int, default=300000)
+    parser.add_argument('--processes', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    graph, seconds = timed(random_graph, args.vertices, args.edges, args.seed)
+    print(f'built graph: {args.vertices} vertices, {args.edges} edges in {seconds:.2f}s')
+    graph.get_adjacency() # build the cached CSR outside the timings
+
+    expected, serial_seconds = timed(graph.get_connected_components)
+    print(f'serial union-find: {serial_seconds:.3f}s, {len(expected)} components')
+
+    print('processes  seconds  speedup')
+    for processes in range(1, args.processes + 1):
+        components, seconds = timed(parallel_connected_components, graph, processes)
+        if components != expected:
+            raise AssertionError(f'{processes} processes gave different components')
+        print(f'{processes:9d}  {seconds:7.3f}  {serial_seconds / seconds:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
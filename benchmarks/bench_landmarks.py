@@ -0,0 +1,84 @@
+"""
+Measure the landmark distance oracle on a weighted grid (a stand-in for a
+road network): table precomputation with 1..N processes, O(k) distance
+estimates against exact distances, and ALT A* against the plain
+shortest-path engine on the same random queries.
+
+Usage: python -m benchmarks.bench_landmarks [--side N] [--landmarks K] [--queries Q] [--processes P]
+"""
+import argparse
+import os
+import random
+import time
+
+from graphs.integer_shortest_paths import shortest_path
+from graphs.landmarks import LandmarkOracle
+from graphs.weighted_graph import WeightedGraph
+
+
+def grid_graph(side, seed):
+    """Return an undirected side x side grid with random integer weights 1..10."""
+    rng = random.Random(seed)
+    graph = WeightedGraph(is_directed=False)
+    for row in range(side * side):
+        graph.add_vertex(row)
+    for row in range(side * side):
+        if row % side + 1 < side:
+            graph.add_edge(row, row + 1, rng.randint(1, 10))
+        if row + side < side * side:
+            graph.add_edge(row, row + side, rng.randint(1, 10))
+    return graph
+
+
+def timed(function, *args, **kwargs):
+    """Return (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--side', type=int, default=300)
+    parser.add_argument('--landmarks', type=int, default=16)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--processes', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    graph, seconds = timed(grid_graph, args.side, args.seed)
+    num_vertices = args.side * args.side
+    print(f'built grid: {num_vertices} vertices in {seconds:.2f}s')
+    graph.get_adjacency() # build the cached CSR outside the timings
+
+    print('processes  precompute')
+    for processes in range(1, args.processes + 1):
+        oracle, seconds = timed(LandmarkOracle, graph, args.landmarks, processes=processes, seed=args.seed)
+        print(f'{processes:9d}  {seconds:9.2f}s')
+    print(f'{args.landmarks} landmarks: {oracle.memory_usage() / num_vertices:.0f} B/vertex of tables')
+
+    rng = random.Random(args.seed)
+    pairs = [(rng.randrange(num_vertices), rng.randrange(num_vertices)) for _ in range(args.queries)]
+    estimate_seconds = exact_seconds = alt_seconds = 0
+    error = 0
+    for start_id, target_id in pairs:
+        estimate, seconds = timed(oracle.estimate_distance, start_id, target_id)
+        estimate_seconds += seconds
+        (distance, _), seconds = timed(shortest_path, graph, start_id, target_id)
+        exact_seconds += seconds
+        (alt_distance, _), seconds = timed(oracle.shortest_path, start_id, target_id)
+        alt_seconds += seconds
+        if alt_distance != distance:
+            raise AssertionError(f'ALT found {alt_distance} from {start_id} to {target_id}, expected {distance}')
+        error += (estimate - distance) / distance if distance else 0
+
+    queries = len(pairs)
+    print(f'estimate:      {1e6 * estimate_seconds / queries:9.1f} us/query, '
+          f'{100 * error / queries:.1f}% mean overestimate')
+    print(f'shortest_path: {1e3 * exact_seconds / queries:9.1f} ms/query')
+    print(f'ALT A*:        {1e3 * alt_seconds / queries:9.1f} ms/query '
+          f'({exact_seconds / alt_seconds:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Measure the memory a weighted graph holds per edge before and after
+`compact()`: the component breakdown from `memory_usage()`, checked
+against what tracemalloc sees allocated. A shortest-path query is run on
+both forms to check they agree.
+
+Usage: python -m benchmarks.bench_memory [--vertices N] [--edges M]
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+
+from graphs.weighted_graph import WeightedGraph
+
+
+def random_graph(num_vertices, num_edges, seed):
+    """Return a directed graph with uniformly random edges and float weights."""
+    rng = random.Random(seed)
+    graph = WeightedGraph(is_directed=True)
+    for row in range(num_vertices):
+        graph.add_vertex(str(row))
+    for _ in range(num_edges):
+        graph.add_edge(str(rng.randrange(num_vertices)), str(rng.randrange(num_vertices)), rng.random())
+    return graph
+
+
+def print_report(title, report, num_edges):
+    """Print a memory_usage() report with bytes per edge."""
+    print(title)
+    for component, size in report.items():
+        print(f'  {component:15s} {size:12,d} B  {size / num_edges:7.1f} B/edge')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--vertices', type=int, default=100000)
+    parser.add_argument('--edges', type=int, default=1000000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    graph = random_graph(args.vertices, args.edges, args.seed)
+    num_edges = sum(len(vertex.neighbors_dict) for vertex in graph) # duplicates keep their first weight
+    gc.collect()
+    built = tracemalloc.get_traced_memory()[0]
+    print_report(f'WeightedGraph ({args.vertices} vertices, {num_edges} edges)',
+                 graph.memory_usage(), num_edges)
+
+    expected = graph.find_shortest_path('0', '1')
+    frozen = graph.compact()
+    del graph
+    gc.collect()
+    compacted = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print_report('after compact()', frozen.memory_usage(), num_edges)
+
+    if frozen.find_shortest_path('0', '1') != expected:
+        raise AssertionError('the frozen graph found a different shortest path')
+
+    print(f'tracemalloc: {built / num_edges:.1f} B/edge built, {compacted / num_edges:.1f} B/edge '
+          f'compacted ({built / compacted:.1f}x smaller)')
+
+
+if __name__ == '__main__':
+    main()
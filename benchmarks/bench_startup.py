@@ -0,0 +1,68 @@
+"""
+Time how long a fresh interpreter takes to import the library: the core
+Graph class, the lazy `graphs` package, and the heavier algorithm modules.
+Each import runs in its own process, and the heavy optional modules it
+pulled in are listed, so an import that starts loading NumPy or
+multiprocessing eagerly shows up here.
+
+Usage: python -m benchmarks.bench_startup [--repeat N]
+"""
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+
+STATEMENTS = [
+    'pass',
+    'import graphs',
+    'from graphs.graph import Graph',
+    'from graphs.weighted_graph import WeightedGraph',
+    'from graphs import Graph',
+    'from util import read_graph_from_file',
+    'from graphs import pagerank',
+    'from graphs import triangle_count',
+    'import numpy',
+]
+
+HEAVY_MODULES = ('numpy', 'scipy', 'multiprocessing', 'concurrent.futures')
+
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+print(seconds, ','.join(name for name in {heavy!r} if name in sys.modules))
+'''
+
+
+def time_import(statement, repeat):
+    """Return (best seconds, heavy modules loaded) over `repeat` fresh processes."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    best, loaded = None, ''
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+                                cwd=root, capture_output=True, text=True, check=True).stdout.split()
+        seconds = float(output[0])
+        loaded = output[1] if len(output) > 1 else ''
+        best = seconds if best is None else min(best, seconds)
+    return best, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    # time imports, not compiling source when no bytecode cache was written
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for package in ('graphs', 'util'):
+        compileall.compile_dir(os.path.join(root, package), quiet=1)
+
+    for statement in STATEMENTS:
+        seconds, loaded = time_import(statement, args.repeat)
+        print(f'{statement:50s} {seconds * 1000:8.2f}ms  {loaded or "-"}')
+
+
+if __name__ == '__main__':
+    main()
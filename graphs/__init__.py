@@ -0,0 +1,86 @@
+"""
+Graph data structures and algorithms.
+
+Every public name below is importable from `graphs` directly, but its
+module is only imported the first time the name is used, so importing the
+package (or just `graphs.graph`) doesn't pay for NumPy, multiprocessing or
+algorithms that aren't needed. NumPy-accelerated code falls back to pure
+Python when NumPy is missing; see `graphs.backend`.
+"""
+import importlib
+
+# public name -> submodule that defines it
+_EXPORTS = {
+    'Vertex': 'graph',
+    'Graph': 'graph',
+    'WeightedVertex': 'weighted_graph',
+    'WeightedGraph': 'weighted_graph',
+    'CSRAdjacency': 'csr',
+    'VertexIdTable': 'interning',
+    'FrozenGraph': 'frozen',
+    'WeightedFrozenGraph': 'frozen',
+    'freeze': 'frozen',
+    'SubgraphView': 'subgraph',
+    'WeightedSubgraphView': 'subgraph',
+    'subgraph_view': 'subgraph',
+    'induced_subgraph': 'subgraph',
+    'NegativeCycleError': 'shortest_paths',
+    'bellman_ford_distances': 'shortest_paths',
+    'bellman_ford_path': 'shortest_paths',
+    'find_negative_cycle': 'shortest_paths',
+    'johnson_all_pairs': 'shortest_paths',
+    'k_shortest_paths': 'shortest_paths',
+    'all_shortest_paths': 'shortest_paths',
+    'select_engine': 'integer_shortest_paths',
+    'single_source_distances': 'integer_shortest_paths',
+    'shortest_path': 'integer_shortest_paths',
+    'ShortestPathTree': 'dynamic_shortest_paths',
+    'LandmarkOracle': 'landmarks',
+    'maximum_flow': 'flow',
+    'minimum_cut': 'flow',
+    'pagerank': 'centrality',
+    'degree_centrality': 'centrality',
+    'betweenness_centrality': 'centrality',
+    'triangles': 'clustering',
+    'triangle_count': 'clustering',
+    'clustering_coefficient': 'clustering',
+    'average_clustering': 'clustering',
+    'transitivity': 'clustering',
+    'to_edge_arrays': 'convert',
+    'to_scipy_csr': 'convert',
+    'to_adjacency_matrix': 'convert',
+    'from_edge_arrays': 'convert',
+    'from_scipy_csr': 'convert',
+    'from_adjacency_matrix': 'convert',
+    'Partition': 'partition',
+    'bfs_partition': 'partition',
+    'label_propagation_partition': 'partition',
+    'multilevel_partition': 'partition',
+    'sharded_connected_components': 'partition',
+    'sharded_bfs_distances': 'partition',
+    'parallel_component_labels': 'parallel_components',
+    'parallel_connected_components': 'parallel_components',
+    'write_csr_file': 'out_of_core',
+    'write_sorted_edge_file': 'out_of_core',
+    'CSRFileSource': 'out_of_core',
+    'SortedEdgeFileSource': 'out_of_core',
+    'ExternalTraversal': 'out_of_core',
+    'get_backend': 'backend',
+    'import_numpy': 'backend',
+    'available_backends': 'backend',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule behind a public name on first use."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'{__name__}.{_EXPORTS[name]}'), name)
+    globals()[name] = value # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
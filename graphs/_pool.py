@@ -0,0 +1,63 @@
+"""
+Process pools whose workers all need the same large, read-only state (an
+adjacency, a graph). The state is handed to each worker once, by the pool
+initializer, instead of being pickled into every task; task functions are
+called as `function(state, task)` and must be defined at module level.
+"""
+
+# The state shared by every task of a worker process, set by `_init_worker`.
+_worker_state = None
+
+
+def _init_worker(state):
+    """Store the shared state once per worker instead of once per task."""
+    global _worker_state
+    _worker_state = state
+
+
+def _run_task(item):
+    """Pool task: call one task function on this worker's shared state."""
+    function, task = item
+    return function(_worker_state, task)
+
+
+class SharedPool(object):
+    """
+    A multiprocessing pool whose workers are started with `state`. Use it
+    as a context manager, like `multiprocessing.Pool`, when the pool has to
+    outlive one batch of tasks.
+    """
+
+    def __init__(self, state, processes=None):
+        """
+        Parameters:
+        state (object): What every task function gets as its first argument.
+        processes (integer): Number of worker processes. None means one per CPU.
+        """
+        import multiprocessing # only pays its import cost when a pool is used
+
+        self.__pool = multiprocessing.Pool(processes, _init_worker, (state,))
+
+    def map(self, function, tasks):
+        """Return [function(state, task) for task in tasks], computed by the workers."""
+        return self.__pool.map(_run_task, [(function, task) for task in tasks])
+
+    def imap(self, function, tasks, chunksize=1):
+        """Like `map`, but lazily and in order, `chunksize` tasks at a time."""
+        return self.__pool.imap(_run_task, ((function, task) for task in tasks), chunksize)
+
+    def imap_unordered(self, function, tasks, chunksize=1):
+        """Like `imap`, but yielding results as they finish."""
+        return self.__pool.imap_unordered(_run_task, ((function, task) for task in tasks), chunksize)
+
+    def close(self):
+        """Stop the workers."""
+        self.__pool.terminate()
+        self.__pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
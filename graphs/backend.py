@@ -0,0 +1,60 @@
+import os
+
+# Set to 'python' to skip NumPy even when it is installed, e.g. to check the
+# pure-Python code paths or to keep short-lived worker processes light.
+BACKEND_ENV = 'GRAPHS_BACKEND'
+BACKENDS = ('auto', 'numpy', 'python')
+
+# Modules already looked up, so a missing package is only searched for once.
+_found = {}
+
+
+def _import_optional(name):
+    """Import a module by name, or return None if it isn't installed."""
+    if name not in _found:
+        try:
+            _found[name] = __import__(name, fromlist=['_'])
+        except ImportError:
+            _found[name] = None
+    return _found[name]
+
+
+def get_backend():
+    """
+    Return the backend the accelerated algorithms run on: 'numpy' when
+    NumPy can be imported, else 'python'. The GRAPHS_BACKEND environment
+    variable overrides the choice.
+
+    Raises:
+    ValueError: If GRAPHS_BACKEND is set to an unknown backend, or to
+        'numpy' while NumPy isn't installed.
+    """
+    requested = os.environ.get(BACKEND_ENV, 'auto').lower()
+    if requested not in BACKENDS:
+        raise ValueError(f'{BACKEND_ENV} must be one of {BACKENDS}')
+    if requested == 'python':
+        return 'python'
+    if _import_optional('numpy') is not None:
+        return 'numpy'
+    if requested == 'numpy':
+        raise ValueError(f'{BACKEND_ENV} is numpy but NumPy is not installed')
+    return 'python'
+
+
+def import_numpy():
+    """Return the numpy module, or None if it isn't installed or not wanted."""
+    if get_backend() == 'python':
+        return None
+    return _import_optional('numpy')
+
+
+def available_backends():
+    """
+    Report which optional packages are installed, without importing them.
+
+    Returns:
+    dict<string, boolean>: package name -> whether it is installed.
+    """
+    from importlib.util import find_spec
+
+    return {name: find_spec(name) is not None for name in ('numpy', 'scipy')}
@@ -0,0 +1,304 @@
+from heapq import heappush, heappop
+from itertools import count
+import os
+
+from graphs._pool import SharedPool
+from graphs.backend import import_numpy as _import_numpy
+
+
+def _distribution(csr, values, name):
+    """
+    Turn a {vertex_id: value} dict into a list indexed by row that sums to 1.
+    Returns None when `values` is None.
+    """
+    if values is None:
+        return None
+
+    distribution = [0.0] * csr.num_vertices()
+    for vertex_id, value in values.items():
+        if value < 0:
+            raise ValueError(f'{name} values must not be negative')
+        distribution[csr.get_index(vertex_id)] = float(value)
+
+    total = sum(distribution)
+    if total == 0:
+        raise ValueError(f'{name} values must not all be zero')
+    return [value / total for value in distribution]
+
+
+def pagerank(graph, damping=0.85, personalization=None, weighted=True,
+             tol=1.0e-6, max_iter=100, initial=None):
+    """
+    Return the PageRank of every vertex, computed by power iteration.
+
+    Each iteration is one sparse matrix-vector product over the graph's
+    edge arrays; it is vectorized with NumPy when it is installed and runs
+    in pure Python otherwise. Rank held by vertices without out-edges is
+    spread according to the personalization vector.
+
+    Parameters:
+    graph (Graph): The graph to rank. Undirected edges count both ways.
+    damping (float): Probability of following an edge rather than teleporting.
+    personalization (dict<string, number>): Teleport weight per vertex id.
+        Missing ids get 0. Defaults to uniform.
+    weighted (boolean): Split a vertex's rank across out-edges in proportion
+        to their weights, instead of evenly.
+    tol (float): Stop once the L1 change between iterations is below this.
+    max_iter (integer): Give up after this many iterations.
+    initial (dict<string, number>): Starting scores, e.g. the result of a
+        previous run, to warm-start the iteration.
+
+    Returns:
+    dict<string, float>: vertex id -> score. The scores sum to 1.
+    """
+    csr = graph.get_adjacency()
+    num_vertices = csr.num_vertices()
+    if num_vertices == 0:
+        return {}
+
+    teleport = _distribution(csr, personalization, 'personalization')
+    if teleport is None:
+        teleport = [1.0 / num_vertices] * num_vertices
+    scores = _distribution(csr, initial, 'initial')
+    if scores is None:
+        scores = [1.0 / num_vertices] * num_vertices
+
+    if weighted and any(weight < 0 for weight in csr.weights):
+        raise ValueError('PageRank needs non-negative edge weights')
+
+    numpy = _import_numpy()
+    if numpy is not None:
+        scores = _pagerank_numpy(numpy, csr, damping, teleport, weighted, tol, max_iter, scores)
+    else:
+        scores = _pagerank_python(csr, damping, teleport, weighted, tol, max_iter, scores)
+
+    return dict(zip(csr.vertex_ids, scores))
+
+
+def _pagerank_numpy(numpy, csr, damping, teleport, weighted, tol, max_iter, scores):
+    """Power iteration using bincount as the sparse matrix-vector product."""
+    num_vertices = csr.num_vertices()
+    indptr = numpy.frombuffer(csr.indptr, dtype=numpy.int64)
+    targets = numpy.frombuffer(csr.indices, dtype=numpy.int64)
+    sources = numpy.repeat(numpy.arange(num_vertices), numpy.diff(indptr))
+    if weighted:
+        edge_weights = numpy.asarray(csr.weights, dtype=numpy.float64)
+    else:
+        edge_weights = numpy.ones(len(targets))
+
+    out_weight = numpy.bincount(sources, weights=edge_weights, minlength=num_vertices)
+    dangling = out_weight == 0
+    row_scale = numpy.zeros(num_vertices)
+    row_scale[~dangling] = 1.0 / out_weight[~dangling]
+    transition = edge_weights * row_scale[sources]
+
+    teleport = numpy.array(teleport)
+    scores = numpy.array(scores)
+    for _ in range(max_iter):
+        last_scores = scores
+        spread = numpy.bincount(targets, weights=last_scores[sources] * transition,
+                                minlength=num_vertices)
+        scores = damping * (spread + last_scores[dangling].sum() * teleport) \
+            + (1 - damping) * teleport
+        if numpy.abs(scores - last_scores).sum() < tol:
+            return scores.tolist()
+
+    raise RuntimeError(f'PageRank did not converge in {max_iter} iterations')
+
+
+def _pagerank_python(csr, damping, teleport, weighted, tol, max_iter, scores):
+    """Power iteration over the CSR arrays in pure Python."""
+    num_vertices = csr.num_vertices()
+    indptr, indices = csr.indptr, csr.indices
+    edge_weights = csr.weights if weighted else [1.0] * len(indices)
+
+    row_scale = [0.0] * num_vertices
+    for row in range(num_vertices):
+        out_weight = sum(edge_weights[indptr[row]:indptr[row + 1]])
+        if out_weight > 0:
+            row_scale[row] = 1.0 / out_weight
+
+    for _ in range(max_iter):
+        last_scores = scores
+        spread = [0.0] * num_vertices
+        dangling_sum = 0.0
+        for row in range(num_vertices):
+            if row_scale[row] == 0:
+                dangling_sum += last_scores[row]
+                continue
+            share = last_scores[row] * row_scale[row]
+            for edge in range(indptr[row], indptr[row + 1]):
+                spread[indices[edge]] += share * edge_weights[edge]
+
+        scores = [
+            damping * (spread[row] + dangling_sum * teleport[row]) + (1 - damping) * teleport[row]
+            for row in range(num_vertices)
+        ]
+        if sum(abs(new - old) for new, old in zip(scores, last_scores)) < tol:
+            return scores
+
+    raise RuntimeError(f'PageRank did not converge in {max_iter} iterations')
+
+
+def degree_centrality(graph, direction='both'):
+    """
+    Return each vertex's degree divided by the largest possible degree (V - 1).
+
+    Parameters:
+    graph (Graph): The graph to score.
+    direction (string): For directed graphs, count 'out' edges, 'in' edges,
+        or 'both'. Ignored for undirected graphs.
+
+    Returns:
+    dict<string, float>: vertex id -> degree centrality.
+    """
+    if direction not in ('in', 'out', 'both'):
+        raise ValueError("direction must be 'in', 'out' or 'both'")
+
+    csr = graph.get_adjacency()
+    num_vertices = csr.num_vertices()
+    out_degree = [csr.out_degree(row) for row in range(num_vertices)]
+    if not graph.is_directed or direction == 'out':
+        degree = out_degree
+    else:
+        in_degree = [0] * num_vertices
+        for target in csr.indices:
+            in_degree[target] += 1
+        if direction == 'in':
+            degree = in_degree
+        else:
+            degree = [out + into for out, into in zip(out_degree, in_degree)]
+
+    scale = 1.0 / (num_vertices - 1) if num_vertices > 1 else 1.0
+    return {vertex_id: degree[row] * scale for row, vertex_id in enumerate(csr.vertex_ids)}
+
+
+def _betweenness_chunk(adjacency, sources):
+    """Pool task: partial betweenness for a chunk of source rows."""
+    indptr, indices, weights, weighted = adjacency
+    return _brandes(indptr, indices, weights, weighted, sources)
+
+
+def _brandes(indptr, indices, weights, weighted, sources):
+    """
+    Brandes' dependency accumulation from each source row in `sources`.
+    Returns the (unscaled) betweenness contribution of those sources.
+    """
+    num_vertices = len(indptr) - 1
+    betweenness = [0.0] * num_vertices
+
+    for source in sources:
+        order = [] # vertices in non-decreasing distance from the source
+        predecessors = [[] for _ in range(num_vertices)]
+        path_count = [0] * num_vertices
+        path_count[source] = 1
+
+        if weighted:
+            _brandes_dijkstra(indptr, indices, weights, source, order, predecessors, path_count)
+        else:
+            distance = [-1] * num_vertices
+            distance[source] = 0
+            head = 0
+            order.append(source)
+            while head < len(order):
+                current = order[head]
+                head += 1
+                for edge in range(indptr[current], indptr[current + 1]):
+                    neighbor = indices[edge]
+                    if distance[neighbor] < 0:
+                        distance[neighbor] = distance[current] + 1
+                        order.append(neighbor)
+                    if distance[neighbor] == distance[current] + 1:
+                        path_count[neighbor] += path_count[current]
+                        predecessors[neighbor].append(current)
+
+        dependency = [0.0] * num_vertices
+        while order:
+            current = order.pop()
+            coefficient = (1.0 + dependency[current]) / path_count[current]
+            for predecessor in predecessors[current]:
+                dependency[predecessor] += path_count[predecessor] * coefficient
+            if current != source:
+                betweenness[current] += dependency[current]
+
+    return betweenness
+
+
+def _brandes_dijkstra(indptr, indices, weights, source, order, predecessors, path_count):
+    """Weighted single-source stage of Brandes' algorithm."""
+    num_vertices = len(indptr) - 1
+    done = [False] * num_vertices
+    best = [float('inf')] * num_vertices
+    best[source] = 0
+    tie_breaker = count()
+    heap = [(0, next(tie_breaker), source, source)]
+
+    while heap:
+        distance, _, predecessor, current = heappop(heap)
+        if done[current]:
+            continue
+        done[current] = True
+        if current != source:
+            path_count[current] += path_count[predecessor]
+        order.append(current)
+
+        for edge in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[edge]
+            new_distance = distance + weights[edge]
+            if not done[neighbor] and new_distance < best[neighbor]:
+                best[neighbor] = new_distance
+                heappush(heap, (new_distance, next(tie_breaker), current, neighbor))
+                path_count[neighbor] = 0
+                predecessors[neighbor] = [current]
+            elif new_distance == best[neighbor]:
+                path_count[neighbor] += path_count[current]
+                predecessors[neighbor].append(current)
+
+
+def betweenness_centrality(graph, normalized=True, weighted=None, processes=1):
+    """
+    Use Brandes' Algorithm to return the betweenness centrality of every vertex.
+
+    Every vertex is a source of one BFS (or Dijkstra) pass. With more than one
+    process, sources are dealt out across a process pool and the partial
+    scores are summed.
+
+    Parameters:
+    graph (Graph): The graph to score.
+    normalized (boolean): Divide by (V-1)(V-2), the number of vertex pairs
+        a vertex could sit between.
+    weighted (boolean): Use edge weights as path lengths. Defaults to True
+        for weighted graphs.
+    processes (integer): Number of worker processes. None means one per CPU.
+
+    Returns:
+    dict<string, float>: vertex id -> betweenness centrality.
+    """
+    csr = graph.get_adjacency()
+    num_vertices = csr.num_vertices()
+    if weighted is None:
+        weighted = graph.is_weighted()
+    if weighted and any(weight < 0 for weight in csr.weights):
+        raise ValueError('Betweenness needs non-negative edge weights')
+
+    sources = list(range(num_vertices))
+    if processes == 1 or num_vertices < 2:
+        betweenness = _brandes(csr.indptr, csr.indices, csr.weights, weighted, sources)
+    else:
+        adjacency = (csr.indptr, csr.indices, csr.weights, weighted)
+        with SharedPool(adjacency, processes) as pool:
+            num_chunks = 4 * (processes or os.cpu_count())
+            chunks = [sources[start::num_chunks] for start in range(num_chunks)]
+            betweenness = [0.0] * num_vertices
+            for partial in pool.imap_unordered(_betweenness_chunk, chunks):
+                for row in range(num_vertices):
+                    betweenness[row] += partial[row]
+
+    if normalized:
+        scale = 1.0 / ((num_vertices - 1) * (num_vertices - 2)) if num_vertices > 2 else None
+    else:
+        scale = 0.5 if not graph.is_directed else None
+    if scale is not None:
+        betweenness = [value * scale for value in betweenness]
+
+    return dict(zip(csr.vertex_ids, betweenness))
@@ -0,0 +1,198 @@
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+
+
+def _weight_dtype(csr):
+    """Return int64 for integer-weighted (or unweighted) adjacencies, float64 otherwise."""
+    import numpy
+
+    return numpy.int64 if csr.weights.typecode == 'q' else numpy.float64
+
+
+def to_edge_arrays(graph):
+    """
+    Export the edges of `graph` as NumPy arrays. Requires NumPy.
+
+    Row i in the arrays below stands for vertex_ids[i]. Undirected edges are
+    listed once in each direction.
+
+    Parameters:
+    graph (Graph): The graph (weighted or not) to export.
+
+    Returns:
+    tuple: (sources, targets, weights, vertex_ids) where the first three are
+    equal-length arrays of int64 rows, int64 rows and the weights: int64
+    when every weight is an integer, float64 otherwise. They are copies, so
+    editing them doesn't change the graph.
+    """
+    import numpy
+
+    csr = graph.get_adjacency()
+    indptr = numpy.frombuffer(csr.indptr, dtype=numpy.int64)
+    sources = numpy.repeat(numpy.arange(csr.num_vertices(), dtype=numpy.int64), numpy.diff(indptr))
+    targets = numpy.array(csr.indices, dtype=numpy.int64)
+    weights = numpy.array(csr.weights, dtype=_weight_dtype(csr))
+    return sources, targets, weights, list(csr.vertex_ids)
+
+
+def to_scipy_csr(graph):
+    """
+    Export `graph` as a SciPy sparse matrix. Requires SciPy.
+
+    The matrix is built from copies of the graph's cached CSR arrays, so
+    editing it doesn't change the graph. Entry (i, j) is the weight of the
+    edge from vertex_ids[i] to vertex_ids[j] (1 for unweighted graphs),
+    with an int64 dtype when every weight is an integer.
+
+    Returns:
+    tuple: (csr_matrix, vertex_ids)
+    """
+    import numpy
+    from scipy.sparse import csr_matrix
+
+    csr = graph.get_adjacency()
+    num_vertices = csr.num_vertices()
+    matrix = csr_matrix(
+        (numpy.array(csr.weights, dtype=_weight_dtype(csr)),
+         numpy.array(csr.indices, dtype=numpy.int64),
+         numpy.array(csr.indptr, dtype=numpy.int64)),
+        shape=(num_vertices, num_vertices), copy=False)
+    return matrix, list(csr.vertex_ids)
+
+
+def to_adjacency_matrix(graph):
+    """
+    Export `graph` as a dense V x V NumPy array. Requires NumPy.
+
+    Entry (i, j) is the weight of the edge from vertex_ids[i] to
+    vertex_ids[j], or 0 where there is no edge. The dtype follows the
+    weights, as in `to_edge_arrays`.
+
+    Returns:
+    tuple: (matrix, vertex_ids)
+    """
+    import numpy
+
+    sources, targets, weights, vertex_ids = to_edge_arrays(graph)
+    matrix = numpy.zeros((len(vertex_ids), len(vertex_ids)), dtype=weights.dtype)
+    matrix[sources, targets] = weights
+    return matrix, vertex_ids
+
+
+def from_edge_arrays(sources, targets, weights=None, vertex_ids=None, is_directed=True,
+                     duplicate_edges='first'):
+    """
+    Build a graph from parallel arrays (or lists) of edge endpoints.
+
+    Parameters:
+    sources (sequence<integer>): The source row of every edge.
+    targets (sequence<integer>): The target row of every edge.
+    weights (sequence<number>): The weight of every edge. If None, an
+        unweighted Graph is built, otherwise a WeightedGraph.
+    vertex_ids (list<string>): The id of each row. Defaults to '0', '1', ...
+        covering every row used by an edge.
+    is_directed (boolean): Whether the new graph is directed.
+    duplicate_edges (string): Which weight a WeightedGraph keeps for an edge
+        listed more than once: 'first', 'last' or 'min'.
+
+    Returns:
+    Graph: A new Graph or WeightedGraph.
+
+    Raises:
+    ValueError: If the arrays differ in length, or a row is negative or has
+        no vertex id.
+    """
+    sources = sources.tolist() if hasattr(sources, 'tolist') else list(sources)
+    targets = targets.tolist() if hasattr(targets, 'tolist') else list(targets)
+    if weights is not None:
+        weights = weights.tolist() if hasattr(weights, 'tolist') else list(weights)
+    if len(sources) != len(targets) or (weights is not None and len(weights) != len(sources)):
+        raise ValueError('Edge arrays must all have the same length')
+
+    if any(row < 0 for row in sources) or any(row < 0 for row in targets):
+        raise ValueError('Edge rows must not be negative')
+    if vertex_ids is None:
+        num_vertices = max(sources + targets) + 1 if sources else 0
+        vertex_ids = [str(row) for row in range(num_vertices)]
+    elif any(row >= len(vertex_ids) for row in sources) or any(row >= len(vertex_ids) for row in targets):
+        raise ValueError(f'Edge rows must be less than the number of vertex ids ({len(vertex_ids)})')
+
+    if weights is None:
+        graph = Graph(is_directed=is_directed)
+    else:
+        graph = WeightedGraph(is_directed=is_directed, duplicate_edges=duplicate_edges)
+    for vertex_id in vertex_ids:
+        graph.add_vertex(vertex_id)
+
+    # add adjacency entries straight to the vertex objects, by row
+    vertices = [graph.get_vertex(vertex_id) for vertex_id in vertex_ids]
+    for edge in range(len(sources)):
+        vertex_obj1 = vertices[sources[edge]]
+        vertex_obj2 = vertices[targets[edge]]
+        if weights is None:
+            vertex_obj1.add_neighbor(vertex_obj2)
+            if not is_directed:
+                vertex_obj2.add_neighbor(vertex_obj1)
+        else:
+            vertex_obj1.add_neighbor(vertex_obj2, weights[edge], duplicate_edges)
+            if not is_directed:
+                vertex_obj2.add_neighbor(vertex_obj1, weights[edge], duplicate_edges)
+
+    return graph
+
+
+def from_scipy_csr(matrix, vertex_ids=None, is_directed=True, weighted=True):
+    """
+    Build a graph from a SciPy sparse matrix. Every stored entry is an edge,
+    including explicitly stored zeros.
+
+    Parameters:
+    matrix (scipy.sparse matrix): A square matrix; other formats are
+        converted to CSR first.
+    vertex_ids (list<string>): The id of each row. Defaults to '0', '1', ...
+    is_directed (boolean): Whether the new graph is directed.
+    weighted (boolean): Build a WeightedGraph using the entries as weights,
+        or an unweighted Graph.
+
+    Returns:
+    Graph: A new Graph or WeightedGraph.
+    """
+    import numpy
+
+    matrix = matrix.tocsr()
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError('Adjacency matrix must be square')
+    if vertex_ids is None:
+        vertex_ids = [str(row) for row in range(matrix.shape[0])]
+
+    sources = numpy.repeat(numpy.arange(matrix.shape[0]), numpy.diff(matrix.indptr))
+    weights = matrix.data if weighted else None
+    return from_edge_arrays(sources, matrix.indices, weights, vertex_ids, is_directed)
+
+
+def from_adjacency_matrix(matrix, vertex_ids=None, is_directed=True, weighted=True):
+    """
+    Build a graph from a dense square matrix (NumPy array or nested lists).
+    Every nonzero entry is an edge.
+
+    Parameters:
+    matrix (array): A V x V matrix of edge weights.
+    vertex_ids (list<string>): The id of each row. Defaults to '0', '1', ...
+    is_directed (boolean): Whether the new graph is directed.
+    weighted (boolean): Build a WeightedGraph using the entries as weights,
+        or an unweighted Graph.
+
+    Returns:
+    Graph: A new Graph or WeightedGraph.
+    """
+    import numpy
+
+    matrix = numpy.asarray(matrix)
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError('Adjacency matrix must be square')
+    if vertex_ids is None:
+        vertex_ids = [str(row) for row in range(matrix.shape[0])]
+
+    sources, targets = numpy.nonzero(matrix)
+    weights = matrix[sources, targets] if weighted else None
+    return from_edge_arrays(sources, targets, weights, vertex_ids, is_directed)
@@ -0,0 +1,203 @@
+from array import array
+import sys
+
+
+class CSRAdjacency(object):
+    """
+    Compressed sparse row copy of a graph's adjacency.
+
+    Row `i` is the vertex interned as `i` in the graph's VertexIdTable, and
+    has out-edges to `indices[indptr[i]:indptr[i + 1]]`, with matching
+    `weights`. Algorithms that touch every edge can loop over these flat
+    arrays with plain integer indexing instead of hashing Vertex objects or ids.
+    """
+
+    def __init__(self, id_table, indptr, indices, weights, is_directed=True):
+        """
+        Initialize the adjacency from already-built arrays.
+
+        Parameters:
+        id_table (VertexIdTable): Maps vertex ids to rows.
+        indptr (array<int>): Row offsets, one more than the number of rows.
+        indices (array<int>): The target row of every edge.
+        weights (array<number>): The weight of every edge; typecode 'q' when
+            every weight is an integer, 'd' otherwise.
+        is_directed (boolean): Whether the source graph was directed.
+        """
+        self.id_table = id_table
+        self.vertex_ids = id_table.get_ids()[:len(indptr) - 1]
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.is_directed = is_directed
+        self.__weight_range = None # (min, max), computed on first use
+        self.__edge_slots = None # row * V + target row -> edge slot, built on first lookup
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Build the adjacency of `graph` in O(V+E). Unweighted edges get weight 1.
+        Integer weights are kept as integers, so results come back in the
+        same type the graph was built with.
+
+        Parameters:
+        graph (Graph): Any Graph, WeightedGraph or view.
+
+        Returns:
+        CSRAdjacency: The flattened adjacency.
+        """
+        id_table = graph.get_id_table()
+        index_of = id_table.get_index
+
+        indptr = array('q', [0])
+        indices = array('q')
+        weights = []
+        is_weighted = graph.is_weighted()
+
+        for vertex_id in id_table.get_ids():
+            vertex = graph.get_vertex(vertex_id)
+            if is_weighted:
+                for neighbor, weight in vertex.get_neighbors_with_weights():
+                    indices.append(index_of(neighbor.get_id()))
+                    weights.append(weight)
+            else:
+                for neighbor in vertex.get_neighbors():
+                    indices.append(index_of(neighbor.get_id()))
+                    weights.append(1)
+            indptr.append(len(indices))
+
+        if all(type(weight) is int for weight in weights):
+            weights = array('q', weights)
+        else:
+            weights = array('d', weights)
+        return cls(id_table, indptr, indices, weights, graph.is_directed)
+
+    def num_vertices(self):
+        """Return the number of rows."""
+        return len(self.vertex_ids)
+
+    def num_edges(self):
+        """Return the number of stored (directed) edges."""
+        return len(self.indices)
+
+    def get_index(self, vertex_id):
+        """Return the row of the given vertex id."""
+        index = self.id_table.get_index(vertex_id)
+        if index >= len(self.vertex_ids):
+            raise KeyError("Vertex was added after this adjacency was built!")
+        return index
+
+    def get_vertex_id(self, index):
+        """Return the vertex id of the given row."""
+        return self.vertex_ids[index]
+
+    def neighbors(self, index):
+        """Return the target rows of the out-edges of row `index`."""
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def neighbor_weights(self, index):
+        """Return the weights of the out-edges of row `index`."""
+        return self.weights[self.indptr[index]:self.indptr[index + 1]]
+
+    def out_degree(self, index):
+        """Return the number of out-edges of row `index`."""
+        return self.indptr[index + 1] - self.indptr[index]
+
+    def find_edge(self, index1, index2):
+        """
+        Return the slot in `indices`/`weights` of the edge from row `index1`
+        to row `index2`, or -1 if there is none. O(1) after a one-off O(E)
+        pass that hashes every edge.
+        """
+        num_vertices = self.num_vertices()
+        if self.__edge_slots is None:
+            edge_slots = {}
+            for row in range(num_vertices):
+                for slot in range(self.indptr[row], self.indptr[row + 1]):
+                    edge_slots.setdefault(row * num_vertices + self.indices[slot], slot)
+            self.__edge_slots = edge_slots
+        return self.__edge_slots.get(index1 * num_vertices + index2, -1)
+
+    def has_edge(self, index1, index2):
+        """Return True if there is an edge from row `index1` to row `index2`."""
+        return self.find_edge(index1, index2) >= 0
+
+    def get_weight(self, index1, index2):
+        """Return the weight of the edge from row `index1` to row `index2`."""
+        slot = self.find_edge(index1, index2)
+        if slot < 0:
+            raise KeyError("Edge is not in the graph!")
+        return self.weights[slot]
+
+    def set_weight(self, index1, index2, weight):
+        """Change the weight of the existing edge from row `index1` to row `index2`."""
+        slot = self.find_edge(index1, index2)
+        if slot < 0:
+            raise KeyError("Edge is not in the graph!")
+        if self.weights.typecode == 'q' and type(weight) is not int:
+            self.weights = array('d', self.weights)
+        self.weights[slot] = weight
+        self.__weight_range = None
+
+    def copy_weights(self):
+        """
+        Return an adjacency that shares this one's rows and edges but has a
+        copy of the weights of its own, so `set_weight` on it leaves this
+        one, and anything holding it, unchanged. The copy is a single O(E)
+        memcpy; the edge hash is shared rather than rebuilt.
+        """
+        adjacency = CSRAdjacency(self.id_table, self.indptr, self.indices,
+                                 array(self.weights.typecode, self.weights), self.is_directed)
+        adjacency.__weight_range = self.__weight_range
+        adjacency.__edge_slots = self.__edge_slots
+        return adjacency
+
+    def weight_range(self):
+        """Return the (smallest, largest) edge weight, or (0, 0) with no edges (computed once)."""
+        if self.__weight_range is None:
+            if len(self.weights):
+                self.__weight_range = (min(self.weights), max(self.weights))
+            else:
+                self.__weight_range = (0, 0)
+        return self.__weight_range
+
+    def has_integer_weights(self):
+        """Return True if every edge weight is an integer."""
+        return self.weights.typecode == 'q'
+
+    def has_negative_weights(self):
+        """Return True if any edge weight is below zero."""
+        return self.weight_range()[0] < 0
+
+    def memory_usage(self):
+        """
+        Return the bytes held by the arrays, the row -> id list and the edge
+        hash if `find_edge` has built it (the ids themselves aren't counted).
+        """
+        total = sum(sys.getsizeof(values) for values in (self.indptr, self.indices, self.weights, self.vertex_ids))
+        if self.__edge_slots is not None:
+            total += sys.getsizeof(self.__edge_slots)
+        return total
+
+    def transpose(self):
+        """Return the adjacency with every edge reversed, built in O(V+E)."""
+        num_vertices = self.num_vertices()
+        counts = [0] * (num_vertices + 1)
+        for target in self.indices:
+            counts[target + 1] += 1
+        for index in range(num_vertices):
+            counts[index + 1] += counts[index]
+
+        indptr = array('q', counts)
+        next_slot = counts[:-1]
+        indices = array('q', bytes(8 * len(self.indices)))
+        weights = array(self.weights.typecode, bytes(8 * len(self.weights)))
+        for source in range(num_vertices):
+            for edge in range(self.indptr[source], self.indptr[source + 1]):
+                target = self.indices[edge]
+                slot = next_slot[target]
+                indices[slot] = source
+                weights[slot] = self.weights[edge]
+                next_slot[target] = slot + 1
+
+        return CSRAdjacency(self.id_table, indptr, indices, weights, self.is_directed)
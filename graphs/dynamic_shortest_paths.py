@@ -0,0 +1,134 @@
+from heapq import heappush, heappop
+from itertools import count
+
+from graphs.integer_shortest_paths import _run_engine
+from graphs.shortest_paths import INFINITY, _run_spfa
+
+
+class ShortestPathTree(object):
+    """
+    A single-source shortest-path tree over a WeightedGraph that is kept
+    up to date as edges are added, so distance queries from the source are
+    O(1) and path queries O(path length) between updates.
+
+    Made through `WeightedGraph.track_shortest_paths`, which reports every
+    `add_edge` and `set_weight` to the tree. An edge that shortens some
+    distance only re-settles the vertices whose distance actually drops,
+    with a Dijkstra search started at the edge's head (the insertion half
+    of Ramalingam and Reps' algorithm). Changes that can lengthen paths,
+    i.e. a raised weight on a tree edge, and any negative weights make the
+    tree rebuild itself in full on its next query instead.
+
+    Edges added behind the graph's back (straight onto vertex objects) are
+    not seen; call `rebuild()` after them.
+    """
+
+    def __init__(self, graph, source_id):
+        """
+        Compute the tree from scratch.
+
+        Parameters:
+        graph (WeightedGraph): The graph to follow.
+        source_id (string): The id of the source vertex.
+        """
+        if not graph.contains_id(source_id):
+            raise KeyError("Vertex is not in the graph!")
+        self.graph = graph
+        self.source_id = source_id
+        self.distance = {} # id -> distance, for vertices reachable from the source
+        self.parent = {} # id -> id of the previous vertex on its shortest path
+        self.stale = False # rebuild before the next query
+        self.has_negative_weights = False # no local updates while any weight is negative
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute every distance from scratch on the graph's adjacency."""
+        csr = self.graph.get_adjacency()
+        source = csr.get_index(self.source_id)
+        self.has_negative_weights = csr.has_negative_weights()
+        if self.has_negative_weights:
+            distance, parent = _run_spfa(csr, [source])
+        else:
+            distance, parent = _run_engine(csr, source)
+
+        vertex_ids = csr.vertex_ids
+        self.distance = {vertex_ids[row]: distance[row]
+                         for row in range(len(distance)) if distance[row] != INFINITY}
+        self.parent = {vertex_ids[row]: vertex_ids[parent[row]]
+                       for row in range(len(parent)) if parent[row] >= 0 and row != source}
+        self.stale = False
+
+    def edge_changed(self, vertex_id1, vertex_id2, old_weight, new_weight):
+        """
+        Update the tree for the edge `vertex_id1` -> `vertex_id2` going from
+        `old_weight` (None if it is new) to `new_weight`.
+        """
+        if self.stale:
+            return
+        if new_weight < 0:
+            self.has_negative_weights = True
+        if self.has_negative_weights:
+            self.stale = True
+            return
+
+        if old_weight is not None and new_weight > old_weight:
+            # only a tree edge getting longer can lengthen a shortest path
+            if self.parent.get(vertex_id2) == vertex_id1:
+                self.stale = True
+            return
+
+        start_distance = self.distance.get(vertex_id1)
+        if start_distance is None or start_distance + new_weight >= self.distance.get(vertex_id2, INFINITY):
+            return
+        self.distance[vertex_id2] = start_distance + new_weight
+        self.parent[vertex_id2] = vertex_id1
+        self.__settle(vertex_id2)
+
+    def __settle(self, vertex_id):
+        """
+        Dijkstra from a vertex whose distance just dropped, relaxing only
+        the neighbors it makes closer, so the search stays inside the part
+        of the tree that changed.
+        """
+        distance, parent, vertex_dict = self.distance, self.parent, self.graph.vertex_dict
+        tiebreak = count() # ids needn't be comparable
+        queue = [(distance[vertex_id], next(tiebreak), vertex_id)]
+        while queue:
+            current_distance, _, current = heappop(queue)
+            if current_distance != distance[current]: # stale entry
+                continue
+            for neighbor_id, (_, weight) in vertex_dict[current].neighbors_dict.items():
+                new_distance = current_distance + weight
+                if new_distance < distance.get(neighbor_id, INFINITY):
+                    distance[neighbor_id] = new_distance
+                    parent[neighbor_id] = current
+                    heappush(queue, (new_distance, next(tiebreak), neighbor_id))
+
+    def get_distance(self, target_id):
+        """
+        Return the shortest distance from the source to `target_id`, or
+        infinity if it can't be reached.
+        """
+        if self.stale:
+            self.rebuild()
+        if not self.graph.contains_id(target_id):
+            raise KeyError("Vertex is not in the graph!")
+        return self.distance.get(target_id, INFINITY)
+
+    def get_path(self, target_id):
+        """
+        Return the shortest path from the source to `target_id` as a list of
+        vertex ids, or None if it can't be reached.
+        """
+        if self.get_distance(target_id) == INFINITY:
+            return None
+        path = [target_id]
+        while path[-1] != self.source_id:
+            path.append(self.parent[path[-1]])
+        return path[::-1]
+
+    def get_distances(self):
+        """Return a copy of the id -> distance dict of every reachable vertex."""
+        if self.stale:
+            self.rebuild()
+        return dict(self.distance)
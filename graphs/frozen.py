@@ -0,0 +1,299 @@
+from array import array
+import sys
+
+from graphs.csr import CSRAdjacency
+from graphs.graph import Graph
+from graphs.interning import VertexIdTable
+from graphs.weighted_graph import WeightedGraph
+
+
+class FrozenVertex(object):
+    """
+    Read-only stand-in for one row of a frozen graph. Made on demand and
+    not kept, so the frozen graph stores no per-vertex objects.
+    """
+
+    def __init__(self, graph, index):
+        """
+        Initialize a frozen vertex.
+
+        Parameters:
+        graph (FrozenGraph): The frozen graph this vertex belongs to.
+        index (integer): The vertex's row in the graph's adjacency.
+        """
+        self.__graph = graph
+        self.__index = index
+
+    def get_id(self):
+        """Return the id of this vertex."""
+        return self.__graph.get_adjacency().vertex_ids[self.__index]
+
+    def get_neighbors(self):
+        """Return the neighbors of this vertex."""
+        adjacency = self.__graph.get_adjacency()
+        return [FrozenVertex(self.__graph, neighbor) for neighbor in adjacency.neighbors(self.__index)]
+
+    def get_neighbors_with_weights(self):
+        """Return (neighbor, weight) tuples for the edges out of this vertex."""
+        adjacency = self.__graph.get_adjacency()
+        return [(FrozenVertex(self.__graph, neighbor), weight)
+                for neighbor, weight in zip(adjacency.neighbors(self.__index),
+                                            adjacency.neighbor_weights(self.__index))]
+
+    def __find(self, vertex_id):
+        """Return the slot of the edge to `vertex_id`, or -1. O(out-degree)."""
+        adjacency = self.__graph.get_adjacency()
+        if vertex_id not in adjacency.id_table:
+            return -1
+        target = adjacency.get_index(vertex_id)
+        start, end = adjacency.indptr[self.__index], adjacency.indptr[self.__index + 1]
+        for slot in range(start, end):
+            if adjacency.indices[slot] == target:
+                return slot
+        return -1
+
+    def has_neighbor(self, vertex_id):
+        """Return True if there is an edge to the vertex with the given id."""
+        return self.__find(vertex_id) >= 0
+
+    def get_weight(self, vertex_id):
+        """Return the weight of the edge to the vertex with the given id."""
+        slot = self.__find(vertex_id)
+        if slot < 0:
+            raise KeyError("Edge is not in the graph!")
+        return self.__graph.get_adjacency().weights[slot]
+
+    def __eq__(self, other):
+        return isinstance(other, FrozenVertex) and (self.__graph, self.__index) == (other.__graph, other.__index)
+
+    def __hash__(self):
+        return hash(self.__index)
+
+    def __str__(self):
+        """Output the list of neighbors of this vertex."""
+        neighbor_ids = [neighbor.get_id() for neighbor in self.get_neighbors()]
+        return f'{self.get_id()} adjacent to {neighbor_ids}'
+
+    def __repr__(self):
+        """Output the list of neighbors of this vertex."""
+        return self.__str__()
+
+
+class FrozenGraph(Graph):
+    """ FrozenGraph Class
+    A read-only graph held entirely in flat CSR arrays, for the query phase
+    after a graph has been built. There are no Vertex objects, neighbor
+    dicts or weight tuples, so each edge costs 16 bytes (target and
+    weight), and every traversal defined on Graph runs on it unchanged.
+
+    Made by `Graph.compact()`; `thaw()` turns it back into a mutable graph.
+    """
+
+    def __init__(self, adjacency):
+        """
+        Initialize a frozen graph over an adjacency it takes ownership of.
+
+        Parameters:
+        adjacency (CSRAdjacency): The arrays to serve queries from. Its id
+            table must not be shared with a graph that can still change.
+        """
+        self.__adjacency = adjacency
+        self.__transposed = None # CSRAdjacency of the reversed edges, built on first use
+
+    @property
+    def is_directed(self):
+        """Return True if edges go in only one direction."""
+        return self.__adjacency.is_directed
+
+    def is_weighted(self):
+        """Return True if edges carry weights."""
+        return False
+
+    def get_vertex(self, vertex_id):
+        """Return a FrozenVertex for the vertex if it exists."""
+        if not self.contains_id(vertex_id):
+            return None
+        return FrozenVertex(self, self.__adjacency.get_index(vertex_id))
+
+    def get_vertices(self):
+        """
+        Return all vertices in the graph.
+
+        Returns:
+        List<FrozenVertex>: Stand-ins for the vertices, in row order.
+        """
+        return [FrozenVertex(self, index) for index in range(self.__adjacency.num_vertices())]
+
+    def contains_id(self, vertex_id):
+        """Return True if a vertex with the given id is in the graph."""
+        return vertex_id in self.__adjacency.id_table
+
+    def get_id_table(self):
+        """Return the table mapping this graph's vertex ids to dense integers."""
+        return self.__adjacency.id_table
+
+    def get_version(self):
+        """A frozen graph never changes, so its version is always 0."""
+        return 0
+
+    def get_adjacency(self):
+        """Return the CSRAdjacency the graph is stored in."""
+        return self.__adjacency
+
+    def has_in_edge_index(self):
+        """Return True once the reversed adjacency has been built."""
+        return self.__transposed is not None
+
+    def enable_in_edge_index(self):
+        """Build the reversed adjacency that answers predecessor queries, in O(V+E)."""
+        if self.__transposed is None:
+            self.__transposed = self.__adjacency.transpose()
+
+    def get_in_neighbors_with_weights(self, vertex_id):
+        """
+        Return (predecessor, weight) tuples for the edges pointing to the
+        given vertex, from the reversed adjacency (built on first use).
+        """
+        if not self.contains_id(vertex_id):
+            raise KeyError("Vertex is not in the graph!")
+        if not self.is_directed:
+            return self.get_vertex(vertex_id).get_neighbors_with_weights()
+        self.enable_in_edge_index()
+        index = self.__transposed.get_index(vertex_id)
+        return [(FrozenVertex(self, predecessor), weight)
+                for predecessor, weight in zip(self.__transposed.neighbors(index),
+                                               self.__transposed.neighbor_weights(index))]
+
+    def get_in_neighbors(self, vertex_id):
+        """Return the vertices that have an edge pointing to the given vertex."""
+        return [vertex for (vertex, weight) in self.get_in_neighbors_with_weights(vertex_id)]
+
+    def transpose(self):
+        """Return a frozen graph with every edge reversed, built in O(V+E)."""
+        return type(self)(self.__adjacency.transpose())
+
+    def add_vertex(self, vertex_id):
+        """Frozen graphs are read-only."""
+        raise TypeError('Cannot add a vertex to a frozen graph; thaw() it first')
+
+    def add_edge(self, vertex_id1, vertex_id2, weight=None):
+        """Frozen graphs are read-only."""
+        raise TypeError('Cannot add an edge to a frozen graph; thaw() it first')
+
+    def set_weight(self, vertex_id1, vertex_id2, weight):
+        """Frozen graphs are read-only."""
+        raise TypeError('Cannot change an edge of a frozen graph; thaw() it first')
+
+    def track_shortest_paths(self, source_id):
+        """A frozen graph never changes, so there is nothing to track."""
+        raise TypeError('Cannot track shortest paths on a frozen graph')
+
+    def compact(self):
+        """A frozen graph is already compact."""
+        return self
+
+    def thaw(self):
+        """
+        Return a new mutable Graph (or WeightedGraph) with the same vertices,
+        edges and options: `duplicate_edges`, and the in-edge index if this
+        graph has one.
+        """
+        adjacency = self.__adjacency
+        if self.is_weighted():
+            graph = WeightedGraph(is_directed=self.is_directed, duplicate_edges=self.duplicate_edges)
+        else:
+            graph = Graph(is_directed=self.is_directed)
+        for vertex_id in adjacency.vertex_ids:
+            graph.add_vertex(vertex_id)
+
+        # add each stored direction on its own, exactly as the arrays list them
+        vertices = [graph.get_vertex(vertex_id) for vertex_id in adjacency.vertex_ids]
+        for row, vertex_obj in enumerate(vertices):
+            for slot in range(adjacency.indptr[row], adjacency.indptr[row + 1]):
+                if self.is_weighted():
+                    vertex_obj.add_neighbor(vertices[adjacency.indices[slot]], adjacency.weights[slot])
+                else:
+                    vertex_obj.add_neighbor(vertices[adjacency.indices[slot]])
+
+        if self.has_in_edge_index():
+            graph.enable_in_edge_index()
+        return graph
+
+    def memory_usage(self):
+        """
+        Return the bytes held by the graph, by component (see
+        `Graph.memory_usage`).
+
+        Returns:
+        dict<string, integer>: component -> bytes, plus 'total'.
+        """
+        adjacency = self.__adjacency
+        report = {
+            'vertex_ids': sum(sys.getsizeof(vertex_id) for vertex_id in adjacency.vertex_ids),
+            'id_table': adjacency.id_table.memory_usage(),
+            'adjacency': adjacency.memory_usage(),
+            'in_edge_index': self.__transposed.memory_usage() if self.__transposed is not None else 0,
+        }
+        report['total'] = sum(report.values())
+        return report
+
+    def __str__(self):
+        """Return a string representation of the graph."""
+        return f'FrozenGraph with vertices: {self.get_vertices()}'
+
+
+class WeightedFrozenGraph(FrozenGraph, WeightedGraph):
+    """ WeightedFrozenGraph Class
+    A FrozenGraph of a weighted graph, on which every WeightedGraph
+    algorithm can be run directly.
+    """
+
+    def __init__(self, adjacency, duplicate_edges='first'):
+        """
+        Initialize a frozen weighted graph.
+
+        Parameters:
+        adjacency (CSRAdjacency): The arrays to serve queries from.
+        duplicate_edges (string): The policy of the graph it was frozen
+            from, kept for `thaw()`: 'first', 'last' or 'min'.
+        """
+        FrozenGraph.__init__(self, adjacency)
+        self.duplicate_edges = duplicate_edges
+
+    def transpose(self):
+        """Return a frozen graph with every edge reversed, built in O(V+E)."""
+        return WeightedFrozenGraph(self.get_adjacency().transpose(), self.duplicate_edges)
+
+    def is_weighted(self):
+        """Return True if edges carry weights."""
+        return True
+
+    def __iter__(self):
+        """Iterate over the frozen vertices."""
+        return iter(self.get_vertices())
+
+    def __str__(self):
+        """Return a string representation of the graph."""
+        return f'WeightedFrozenGraph with vertices: {self.get_vertices()}'
+
+
+def freeze(graph):
+    """
+    Return a FrozenGraph (WeightedFrozenGraph for weighted graphs) with the
+    vertices and edges `graph` has now. Later changes to `graph` don't
+    reach it. Its `duplicate_edges` policy and in-edge index carry over, so
+    `thaw()` gives back a graph with the same options.
+    """
+    adjacency = graph.get_adjacency()
+    # copies of its own, since `graph` may still grow or patch its cached
+    # arrays in place
+    frozen = CSRAdjacency(VertexIdTable(adjacency.vertex_ids), array('q', adjacency.indptr),
+                          array('q', adjacency.indices), array(adjacency.weights.typecode, adjacency.weights),
+                          adjacency.is_directed)
+    if graph.is_weighted():
+        frozen_graph = WeightedFrozenGraph(frozen, graph.duplicate_edges)
+    else:
+        frozen_graph = FrozenGraph(frozen)
+    if graph.has_in_edge_index():
+        frozen_graph.enable_in_edge_index()
+    return frozen_graph
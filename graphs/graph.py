@@ -1,29 +1,45 @@
 from collections import deque
-import random
+import sys
+
+from graphs.csr import CSRAdjacency
+from graphs.interning import VertexIdTable
+from graphs.shortest_paths import all_shortest_paths, k_shortest_paths
 
 class Vertex(object):
     """
     Defines a single vertex and its neighbors.
     """
 
-    def __init__(self, vertex_id):
+    def __init__(self, vertex_id, graph=None):
         """
         Initialize a vertex and its neighbors dictionary.
         
         Parameters:
         vertex_id (string): A unique identifier to identify this vertex.
+        graph (Graph): The graph the vertex belongs to, told about every
+            change so its cached adjacency is rebuilt.
         """
         self.__id = vertex_id
         self.__neighbors_dict = {} # id -> object
+        self.__graph = graph
 
     def add_neighbor(self, vertex_obj):
         """
         Add a neighbor by storing it in the neighbors dictionary.
 
+        Edges added here show up in the graph's traversals, but not in its
+        incoming-edge index; use `Graph.add_edge` to keep that up to date.
+
         Parameters:
         vertex_obj (Vertex): An instance of Vertex to be stored as a neighbor.
         """
         self.__neighbors_dict[vertex_obj.__id] = vertex_obj
+        if self.__graph is not None:
+            self.__graph.mark_changed()
+
+    def has_neighbor(self, vertex_id):
+        """Return True if there is an edge to the vertex with the given id."""
+        return vertex_id in self.__neighbors_dict
 
     def __str__(self):
         """Output the list of neighbors of this vertex."""
@@ -42,20 +58,80 @@ class Vertex(object):
         """Return the id of this vertex."""
         return self.__id
 
+    def memory_usage(self):
+        """
+        Return the bytes held by this vertex, by component (see
+        `Graph.memory_usage`). The neighbors themselves aren't counted.
+        """
+        return {
+            'vertex_objects': sys.getsizeof(self),
+            'neighbor_dicts': sys.getsizeof(self.__neighbors_dict),
+            'weight_tuples': 0,
+        }
+
+
+def _memory_report(vertex_dict, in_neighbors_dict, id_table, adjacency):
+    """
+    Add up `Graph.memory_usage` from a graph's parts; `adjacency` is its
+    cached CSRAdjacency, or None.
+    """
+    report = {
+        'vertex_dict': sys.getsizeof(vertex_dict),
+        'vertex_ids': sum(sys.getsizeof(vertex_id) for vertex_id in vertex_dict),
+        'vertex_objects': 0,
+        'neighbor_dicts': 0,
+        'weight_tuples': 0,
+        'id_table': id_table.memory_usage(),
+        'in_edge_index': 0,
+        'adjacency': adjacency.memory_usage() if adjacency is not None else 0,
+    }
+    for vertex in vertex_dict.values():
+        for component, size in vertex.memory_usage().items():
+            report[component] += size
+
+    if in_neighbors_dict is not None:
+        report['in_edge_index'] = sys.getsizeof(in_neighbors_dict)
+        for predecessors in in_neighbors_dict.values():
+            report['in_edge_index'] += sys.getsizeof(predecessors)
+            # weighted graphs index (vertex, weight) tuples of their own
+            report['in_edge_index'] += sum(sys.getsizeof(entry) for entry in predecessors.values()
+                                           if type(entry) is tuple)
+    report['total'] = sum(report.values())
+    return report
+
 
 class Graph:
     """ Graph Class
     Represents a directed or undirected graph.
     """
-    def __init__(self, is_directed=True):
+    def __init__(self, is_directed=True, track_in_edges=False):
         """
         Initialize a graph object with an empty vertex dictionary.
 
         Parameters:
         is_directed (boolean): Whether the graph is directed (edges go in only one direction).
+        track_in_edges (boolean): Whether to keep an index of incoming edges,
+            so that predecessor queries don't need to scan the whole graph.
         """
         self.__vertex_dict = {} # id -> object
         self.__is_directed = is_directed
+        self.__in_neighbors_dict = {} if track_in_edges else None # id -> {id -> object}
+        self.__id_table = VertexIdTable() # id <-> dense int, shared by all algorithms
+        self.__version = 0 # bumped on every change, so cached adjacency can be rebuilt
+        self.__adjacency = None
+
+    @property
+    def is_directed(self):
+        """Return True if edges go in only one direction."""
+        return self.__is_directed
+
+    @is_directed.setter
+    def is_directed(self, is_directed):
+        self.__is_directed = is_directed
+
+    def is_weighted(self):
+        """Return True if edges carry weights."""
+        return False
 
     def add_vertex(self, vertex_id):
         """
@@ -67,8 +143,12 @@ class Graph:
         Returns:
         Vertex: The new vertex object.
         """
-        new_vertex = Vertex(vertex_id)
+        new_vertex = Vertex(vertex_id, self)
         self.__vertex_dict[vertex_id] = new_vertex
+        self.__id_table.intern(vertex_id)
+        self.__version += 1
+        if self.__in_neighbors_dict is not None:
+            self.__in_neighbors_dict.setdefault(vertex_id, {})
         return new_vertex      
 
     def get_vertex(self, vertex_id):
@@ -88,10 +168,24 @@ class Graph:
         vertex_id2 (string): The unique identifier of the second vertex.
         """
         self.__vertex_dict[vertex_id1].add_neighbor(self.__vertex_dict[vertex_id2])
+        self.__version += 1
 
         if self.__is_directed is False:
             self.__vertex_dict[vertex_id2].add_neighbor(self.__vertex_dict[vertex_id1])
+
+        if self.__in_neighbors_dict is not None:
+            self.__in_neighbors_dict[vertex_id2][vertex_id1] = self.__vertex_dict[vertex_id1]
+            if self.__is_directed is False:
+                self.__in_neighbors_dict[vertex_id1][vertex_id2] = self.__vertex_dict[vertex_id2]
         
+    def has_edge(self, vertex_id1, vertex_id2):
+        """
+        Return True if there is an edge from `vertex_id1` to `vertex_id2`,
+        in O(1). Missing vertices just mean there is no edge.
+        """
+        vertex_obj1 = self.get_vertex(vertex_id1)
+        return vertex_obj1 is not None and vertex_obj1.has_neighbor(vertex_id2)
+
     def get_vertices(self):
         """
         Return all vertices in the graph.
@@ -102,8 +196,175 @@ class Graph:
         return list(self.__vertex_dict.values())
 
     def contains_id(self, vertex_id):
+        """Return True if a vertex with the given id is in the graph."""
         return vertex_id in self.__vertex_dict
 
+    def get_id_table(self):
+        """Return the table mapping this graph's vertex ids to dense integers."""
+        return self.__id_table
+
+    def get_version(self):
+        """Return a counter that changes whenever the vertices or edges do."""
+        return self.__version
+
+    def mark_changed(self):
+        """Note that vertices or edges changed, so the cached adjacency is rebuilt on next use."""
+        self.__version += 1
+
+    def get_adjacency(self):
+        """
+        Return a CSRAdjacency of the graph, indexed by the id table.
+
+        The arrays are cached and only rebuilt after the graph, or one of
+        its vertices, has changed, so back-to-back queries share them.
+        """
+        if self.__adjacency is None or self.__adjacency[0] != self.__version:
+            self.__adjacency = (self.__version, CSRAdjacency.from_graph(self))
+        return self.__adjacency[1]
+
+    def memory_usage(self):
+        """
+        Return an estimate of the bytes the graph holds, broken down by
+        component. Sizes are shallow `sys.getsizeof` figures added up over
+        every object the graph owns, so they are approximate, but they show
+        where the memory of a large graph goes. Compare with `compact()`.
+
+        Returns:
+        dict<string, integer>: Bytes held by the vertex dict, the vertex
+        ids, the Vertex objects, their neighbor dicts, the (neighbor,
+        weight) tuples of weighted graphs, the id table, the incoming-edge
+        index and the cached CSR adjacency, plus the 'total'.
+        """
+        adjacency = self.__adjacency[1] if self.__adjacency is not None else None
+        return _memory_report(self.__vertex_dict, self.__in_neighbors_dict, self.__id_table, adjacency)
+
+    def compact(self):
+        """
+        Return a read-only FrozenGraph with the vertices and edges the graph
+        has now, stored in flat arrays instead of Vertex objects and
+        neighbor dicts, for a query phase that no longer adds edges. Drop
+        the last reference to this graph to get the memory back.
+        """
+        from graphs.frozen import freeze
+        return freeze(self)
+
+    def has_in_edge_index(self):
+        """Return True if incoming edges are indexed as they are added."""
+        return self.__in_neighbors_dict is not None
+
+    def enable_in_edge_index(self):
+        """
+        Build the incoming-edge index from the current edges in O(V+E), and
+        keep it up to date in `add_edge` from now on.
+        """
+        in_neighbors_dict = {vertex.get_id(): {} for vertex in self.get_vertices()}
+        for vertex in self.get_vertices():
+            for neighbor in vertex.get_neighbors():
+                in_neighbors_dict[neighbor.get_id()][vertex.get_id()] = vertex
+        self.__in_neighbors_dict = in_neighbors_dict
+
+    def get_in_neighbors(self, vertex_id):
+        """
+        Return the vertices that have an edge pointing to the given vertex.
+
+        This is O(in-degree) when the incoming-edge index is enabled, and
+        falls back to scanning every edge in the graph otherwise.
+
+        Parameters:
+        vertex_id (string): The id of the vertex to look up.
+
+        Returns:
+        List<Vertex>: The predecessors of the vertex.
+        """
+        if not self.contains_id(vertex_id):
+            raise KeyError("Vertex is not in the graph!")
+
+        if not self.is_directed:
+            return self.get_vertex(vertex_id).get_neighbors()
+
+        if self.__in_neighbors_dict is not None:
+            return list(self.__in_neighbors_dict[vertex_id].values())
+
+        return [
+            vertex for vertex in self.get_vertices()
+            if any(neighbor.get_id() == vertex_id for neighbor in vertex.get_neighbors())
+        ]
+
+    def get_in_degree(self, vertex_id):
+        """Return the number of edges pointing to the given vertex."""
+        return len(self.get_in_neighbors(vertex_id))
+
+    def transpose(self):
+        """
+        Return a new graph with every edge reversed, built in O(V+E).
+
+        Returns:
+        Graph: The transposed graph. It indexes incoming edges if this one does.
+        """
+        transposed = Graph(is_directed=self.is_directed)
+        for vertex in self.get_vertices():
+            transposed.add_vertex(vertex.get_id())
+
+        for vertex in self.get_vertices():
+            for neighbor in vertex.get_neighbors():
+                transposed.get_vertex(neighbor.get_id()).add_neighbor(
+                    transposed.get_vertex(vertex.get_id()))
+
+        if self.has_in_edge_index():
+            transposed.enable_in_edge_index()
+        return transposed
+
+    def strongly_connected_components(self):
+        """
+        Use Kosaraju's Algorithm to return the strongly connected components,
+        each represented as a list of vertex ids.
+        """
+        adjacency = self.get_adjacency()
+        num_vertices = adjacency.num_vertices()
+
+        # First pass: record vertices in order of DFS finishing time
+        indptr, indices = adjacency.indptr, adjacency.indices
+        finished = []
+        visited = bytearray(num_vertices)
+        for root in range(num_vertices):
+            if visited[root]:
+                continue
+            visited[root] = 1
+            stack = [(root, iter(indices[indptr[root]:indptr[root + 1]]))]
+            while stack:
+                current, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        stack.append((neighbor, iter(indices[indptr[neighbor]:indptr[neighbor + 1]])))
+                        break
+                else:
+                    stack.pop()
+                    finished.append(current)
+
+        # Second pass: in reverse finishing order, collect everything that
+        # can reach each unassigned vertex by walking edges backwards
+        transposed = adjacency.transpose()
+        indptr, indices = transposed.indptr, transposed.indices
+        components = []
+        assigned = bytearray(num_vertices)
+        for root in reversed(finished):
+            if assigned[root]:
+                continue
+            assigned[root] = 1
+            component = []
+            stack = [root]
+            while stack:
+                current = stack.pop()
+                component.append(adjacency.vertex_ids[current])
+                for predecessor in indices[indptr[current]:indptr[current + 1]]:
+                    if not assigned[predecessor]:
+                        assigned[predecessor] = 1
+                        stack.append(predecessor)
+            components.append(component)
+
+        return components
+
     def __str__(self):
         """Return a string representation of the graph."""
         return f'Graph with vertices: {self.get_vertices()}'
@@ -119,25 +380,28 @@ class Graph:
         if not self.contains_id(start_id):
             raise KeyError("One or both vertices are not in the graph!")
 
-        # Keep a set to denote which vertices we've seen before
-        seen = set()
-        seen.add(start_id)
+        adjacency = self.get_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
+        start = adjacency.get_index(start_id)
+
+        # Keep a flag per vertex index to denote which vertices we've seen before
+        seen = bytearray(adjacency.num_vertices())
+        seen[start] = 1
 
         # Keep a queue so that we visit vertices in the appropriate order
         queue = deque()
-        queue.append(self.get_vertex(start_id))
+        queue.append(start)
 
         while queue:
-            current_vertex_obj = queue.popleft()
-            current_vertex_id = current_vertex_obj.get_id()
+            current = queue.popleft()
 
             # Process current node
-            print('Processing vertex {}'.format(current_vertex_id))
+            print('Processing vertex {}'.format(adjacency.vertex_ids[current]))
 
             # Add its neighbors to the queue
-            for neighbor in current_vertex_obj.get_neighbors():
-                if neighbor.get_id() not in seen:
-                    seen.add(neighbor.get_id())
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
                     queue.append(neighbor)
 
         return # everything has been processed
@@ -156,38 +420,67 @@ class Graph:
         if not self.contains_id(start_id) or not self.contains_id(target_id):
             raise KeyError("One or both vertices are not in the graph!")
 
-        # vertex keys we've seen before and their paths from the start vertex
-        vertex_id_to_path = {
-            start_id: [start_id] # only one thing in the path
-        }
+        adjacency = self.get_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
+        start = adjacency.get_index(start_id)
+        target = adjacency.get_index(target_id)
+
+        # index of the vertex each vertex was first reached from (-1 = not seen)
+        parent = [-1] * adjacency.num_vertices()
+        parent[start] = start
 
         # queue of vertices to visit next
-        queue = deque() 
-        queue.append(self.get_vertex(start_id))
+        queue = deque()
+        queue.append(start)
 
         # while queue is not empty
         while queue:
-            current_vertex_obj = queue.pop() # vertex obj to visit next
-            current_vertex_id = current_vertex_obj.get_id()
+            current = queue.popleft() # vertex to visit next
 
             # found target, can stop the loop early
-            if current_vertex_id == target_id:
+            if current == target:
                 break
 
-            neighbors = current_vertex_obj.get_neighbors()
-            for neighbor in neighbors:
-                if neighbor.get_id() not in vertex_id_to_path:
-                    current_path = vertex_id_to_path[current_vertex_id]
-                    # extend the path by 1 vertex
-                    next_path = current_path + [neighbor.get_id()]
-                    vertex_id_to_path[neighbor.get_id()] = next_path
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                if parent[neighbor] < 0:
+                    parent[neighbor] = current
                     queue.append(neighbor)
-                    # print(vertex_id_to_path)
 
-        if target_id not in vertex_id_to_path: # path not found
+        if parent[target] < 0: # path not found
             return None
 
-        return vertex_id_to_path[target_id]
+        return self.__path_to(adjacency, parent, start, target)
+
+    def find_k_shortest_paths(self, start_id, target_id, k=None):
+        """
+        Lazily generate the shortest loopless paths from start_id to target_id,
+        best first (Yen's Algorithm). Fallback routes cost nothing until asked for.
+
+        Parameters:
+        start_id (string): The id of the start vertex.
+        target_id (string): The id of the target (end) vertex.
+        k (integer): The most paths to generate. None means every path.
+
+        Returns:
+        generator: Yields (distance, path) tuples, path being a list of ids.
+        """
+        return k_shortest_paths(self, start_id, target_id, k)
+
+    def find_all_shortest_paths(self, start_id, target_id):
+        """
+        Lazily generate every path from start_id to target_id that ties for shortest.
+
+        Returns:
+        generator: Yields each path as a list of vertex ids.
+        """
+        return all_shortest_paths(self, start_id, target_id)
+
+    def __path_to(self, adjacency, parent, start, target):
+        """Follow parent indices back from target to start; return the ids in order."""
+        path = [target]
+        while path[-1] != start:
+            path.append(parent[path[-1]])
+        return [adjacency.vertex_ids[index] for index in reversed(path)]
 
     def find_vertices_n_away(self, start_id, target_distance):
         """
@@ -202,63 +495,49 @@ class Graph:
         if not self.contains_id(start_id):
             raise KeyError("One or both vertices are not in the graph!")
 
-        # data type containing the vertex items
-        queue = deque() 
-        queue.append((start_id, 0))
+        adjacency = self.get_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
 
         # Take note of vetices that were already visited; don't visit again
-        visit = set()
-        visit.add(start_id)
-        
-        # List of vertex items that are `target_distance` away from the start vertex
-        vertex_target_list = []
-
-        # While searching through queue
-        while queue:
-            current_vertex_obj = queue.pop() # vertex obj to visit next
-
-            # Define the neighbors of current vertex item
-            vertex_neighbors = self.get_vertex(current_vertex_obj[0]).get_neighbors()
-
-            # If the target distance is the same as the current vertex item, append item to new list
-            if current_vertex_obj[1] == target_distance:
-                vertex_target_list.append(current_vertex_obj[0])
-
-            # When checking the neighbors of current vertex item
-            for neighbor in vertex_neighbors:
-                if neighbor.get_id() not in visit:
-                    queue.append((neighbor.get_id(), current_vertex_obj[1] + 1))
-                    visit.add(neighbor.get_id())
-
-        return vertex_target_list
+        visit = bytearray(adjacency.num_vertices())
+        level = [adjacency.get_index(start_id)]
+        visit[level[0]] = 1
+
+        # Expand one whole level of the search at a time
+        for _ in range(target_distance):
+            next_level = []
+            for current in level:
+                for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                    if not visit[neighbor]:
+                        visit[neighbor] = 1
+                        next_level.append(neighbor)
+            level = next_level
+
+        return [adjacency.vertex_ids[index] for index in level]
 
     def is_bipartite(self):
         """
         Return True if the graph is bipartite, and False otherwise.
         """
-        queue = deque()
-        visited = {}
-
-        keys = list(self.__vertex_dict.keys())
-        current = random.choice(keys)
-        color = 0
-
-        queue.append(current)
-        visited[current] = color
-
-        while queue:
-            current = queue.pop()
-    
-            color = (color + 1) % 2
-
-            neighbors = self.get_vertex(current).get_neighbors()
-
-            for neighbor in neighbors:
-                if neighbor.get_id() not in visited.keys():
-                    visited[neighbor.get_id()] = color
-                    queue.append(neighbor.get_id())
-                else:
-                    if visited[current] == visited[neighbor.get_id()]:
+        adjacency = self.get_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
+
+        # color of each vertex index: -1 = not visited yet, else 0 or 1
+        color = [-1] * adjacency.num_vertices()
+
+        for root in range(adjacency.num_vertices()):
+            if color[root] >= 0:
+                continue
+            color[root] = 0
+            queue = deque([root])
+
+            while queue:
+                current = queue.popleft()
+                for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                    if color[neighbor] < 0:
+                        color[neighbor] = 1 - color[current]
+                        queue.append(neighbor)
+                    elif color[neighbor] == color[current]:
                         return False
         return True
 
@@ -266,193 +545,164 @@ class Graph:
         """
         Return a list of all connected components, with each connected component
         represented as a list of vertex ids.
-        """
-        
-        # seen = set()
-        # current_vertex_id = random.choice(list(self.__vertex_dict.keys()))
-        # neighbors = self.get_vertex(current_vertex_id).get_neighbors()
-        
-        # def component(node):
-        #     nodes = set([node])
-        #     while nodes:
-        #         node = nodes.pop()
-        #         seen.add(node)
-                
-        # for node in neighbors:
-        #     if node not in seen:
-        #         yield component(node)
-
-        visited = [] 
-        connected_components = [] 
-        queue = deque()
 
-        keys = list(self.__vertex_dict.keys())
-        current = random.choice(keys)
-        visited.append(current)
-        queue.append(current)
-
-        while queue:
-            current = queue.pop()
-            connected_components.append(current)
-
-            neighbors = self.get_vertex(current).get_neighbors()
-
-            for neighbor in neighbors:
-                if neighbor.get_id() not in visited:
-                    visited.append(neighbor.get_id())
-                    connected_components.append(neighbor.get_id())
-
-            if len(visited) == len(keys):
-                return connected_components
-            
-            not_visited = [vertex for vertex in keys if vertex not in visited]
-
-            current = random.choice(not_visited)
-
-            visited.append(current)
-            queue.append(current)
+        Edge direction is ignored, so directed graphs get their weakly
+        connected components.
+        """
+        adjacency = self.get_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
+        num_vertices = adjacency.num_vertices()
+
+        # union-find over vertex indices
+        parent = list(range(num_vertices))
+
+        def find(index):
+            while parent[index] != index:
+                parent[index] = parent[parent[index]] # path halving
+                index = parent[index]
+            return index
+
+        for current in range(num_vertices):
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                root1, root2 = find(current), find(neighbor)
+                if root1 != root2:
+                    parent[max(root1, root2)] = min(root1, root2)
+
+        root_to_component = {}
+        connected_components = []
+        for index in range(num_vertices):
+            root = find(index)
+            if root not in root_to_component:
+                root_to_component[root] = []
+                connected_components.append(root_to_component[root])
+            root_to_component[root].append(adjacency.vertex_ids[index])
 
         return connected_components
 
-        # for _ in range(current_vertex_id): 
-        #     visited.append(False) 
-        # for v in range(current_vertex_id): 
-        #     if visited[v] == False: 
-        #         connected_components.append(current_vertex_id) 
-        # return connected_components 
-
     def find_path_dfs_iter(self, start_id, target_id):
         """
         Use DFS with a stack to find a path from start_id to target_id.
         """
-        # stack = set()
-        # stack = stack + [start_id]
-        # while stack:
-        #     current = stack.pop
-        #     neighbors = self.get_vertex(current).get_neighbors()
-        #     if start_id == target_id:
-        #         break
-
-        #     if not self.__vertex_dict.keys(start_id):
-        #         return
-            
-        #     for neighbor in neighbors(start_id):
-        #         if neighbor not in stack:
-        #             for new_path in self.__vertex_dict.keys():
-        #                 if new_path:
-        #                     yield new_path
-
-        visited = {start_id: [start_id]}  
-  
-        # Create a stack for DFS  
-        stack = set()
-        stack.add(self.get_vertex(start_id)) 
-  
-        while stack:  
-            current_vertex_obj = stack.pop() # vertex obj to visit next
-            current_vertex_id = current_vertex_obj.get_id()
-  
-            neighbors = current_vertex_obj.get_neighbors()
-            if current_vertex_id == target_id:
-                break
+        if not self.contains_id(start_id) or not self.contains_id(target_id):
+            raise KeyError("One or both vertices are not in the graph!")
 
-            for neighbor in neighbors:  
-                if neighbor.get_id not in visited:  
-                    stack.add(neighbor) 
-                    
-                    current_path = visited[current_vertex_id]
-                    new_path = current_path + [neighbor.get_id()]
-                    visited[neighbor.get_id()] = new_path
+        adjacency = self.get_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
+        start = adjacency.get_index(start_id)
+        target = adjacency.get_index(target_id)
 
-        return visited[target_id]
+        parent = [-1] * adjacency.num_vertices()
+        parent[start] = start
 
+        # Create a stack for DFS
+        stack = [start]
 
-    def dfs_traversal(self, start_id):
-        """Visit each vertex, starting with start_id, in DFS order."""
+        while stack:
+            current = stack.pop() # vertex to visit next
+            if current == target:
+                return self.__path_to(adjacency, parent, start, target)
 
-        visited = set() # set of vertices we've visited so far
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                if parent[neighbor] < 0:
+                    parent[neighbor] = current
+                    stack.append(neighbor)
 
-        def dfs_traversal_recursive(start_vertex):
-            print(f'Visiting vertex {start_vertex.get_id()}')
+        return None
 
-            # recurse for each vertex in neighbors
-            for neighbor in start_vertex.get_neighbors():
-                if neighbor.get_id() not in visited:
-                    visited.add(neighbor.get_id())
-                    dfs_traversal_recursive(neighbor)
-            return
+    def dfs_traversal(self, start_id):
+        """Visit each vertex, starting with start_id, in DFS order."""
+        adjacency = self.get_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
+        start = adjacency.get_index(start_id)
+
+        visited = bytearray(adjacency.num_vertices()) # vertices we've visited so far
+        visited[start] = 1
+        print(f'Visiting vertex {start_id}')
+
+        # an explicit stack of neighbor iterators stands in for the recursion
+        stack = [iter(indices[indptr[start]:indptr[start + 1]])]
+        while stack:
+            for neighbor in stack[-1]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    print(f'Visiting vertex {adjacency.vertex_ids[neighbor]}')
+                    stack.append(iter(indices[indptr[neighbor]:indptr[neighbor + 1]]))
+                    break
+            else:
+                stack.pop()
 
-        visited.add(start_id)
-        start_vertex = self.get_vertex(start_id)
-        dfs_traversal_recursive(start_vertex)
+    def contains_cycle(self):
+        """
+        Return True if the graph contains a cycle.
+
+        In a directed graph that means an edge back to a vertex still on the
+        DFS stack; in an undirected graph, an edge to any visited vertex other
+        than the one we just came from.
+        """
+        adjacency = self.get_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
+        num_vertices = adjacency.num_vertices()
+
+        # 0 = not visited, 1 = on the DFS stack, 2 = finished
+        state = bytearray(num_vertices)
+        parent = [-1] * num_vertices
+
+        for root in range(num_vertices):
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, iter(indices[indptr[root]:indptr[root + 1]]))]
+            while stack:
+                current, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if state[neighbor] == 0:
+                        state[neighbor] = 1
+                        parent[neighbor] = current
+                        stack.append((neighbor, iter(indices[indptr[neighbor]:indptr[neighbor + 1]])))
+                        break
+                    if self.is_directed:
+                        if state[neighbor] == 1:
+                            return True
+                    elif neighbor != parent[current]:
+                        return True
+                else:
+                    stack.pop()
+                    state[current] = 2
 
-    def cycleHelper(self, vertex, visited, stack): 
-        
-        cycle = False
-        visited.add(vertex)
-        stack.append(vertex)
-        neighbors = vertex.get_neighbors()
-
-        for neighbor in neighbors: 
-            if neighbor not in visited: 
-                cycle = self.cycleHelper(neighbor, visited, stack)
-            elif neighbor in stack: 
-                return True
-
-        stack.remove(vertex)
-  
-        if cycle == True:
-            return True
-  
-    def contains_cycle(self): 
-        visited = set()
-        values = self.__vertex_dict.values()
-        stack = []
-        for vertex in values: 
-            if vertex in visited:
-                return False
-            else:
-                if self.cycleHelper(vertex, visited, stack) == True: 
-                    return True
         return False
 
-    def topological_helper(self, vertex, visited, stack): 
-  
-        # Mark the current node as visited. 
-        visited.add(vertex)
-        neighbors = vertex.get_neighbors()
-  
-        # Recur for all the vertices adjacent to this vertex 
-        for neighbor in neighbors: 
-            if neighbor not in visited: 
-                self.topological_helper(neighbor,visited,stack) 
-  
-        # Push current vertex to stack which stores result 
-        stack.append(vertex)
-        return stack
-  
     def topological_sort(self):
         """
         Return a valid ordering of vertices in a directed acyclic graph.
         If the graph contains a cycle, throw a ValueError.
         """
-        # TODO: Create a stack to hold the vertex ordering.
-        # TODO: For each unvisited vertex, execute a DFS from that vertex.
-        # TODO: On the way back up the recursion tree (that is, after visiting a 
-        # vertex's neighbors), add the vertex to the stack.
-        # TODO: Reverse the contents of the stack and return it as a valid ordering. 
-        # Mark all the vertices as not visited 
-
-        visited = set()
-        stack = []
-        values = self.__vertex_dict.values()
-  
-        for vertex in values: 
-            if vertex not in visited: 
-                self.topological_helper(vertex, visited, stack) == True 
-  
-        solution = list()
-        for _ in range(len(self.__vertex_dict)):
-            solution.append(stack.pop().get_id())
-        return solution
+        adjacency = self.get_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
+        num_vertices = adjacency.num_vertices()
+
+        # 0 = not visited, 1 = on the DFS stack, 2 = finished
+        state = bytearray(num_vertices)
+        # vertices in the order their DFS finishes
+        finished = []
+
+        for root in range(num_vertices):
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, iter(indices[indptr[root]:indptr[root + 1]]))]
+            while stack:
+                current, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if state[neighbor] == 1:
+                        raise ValueError('Graph contains a cycle')
+                    if state[neighbor] == 0:
+                        state[neighbor] = 1
+                        stack.append((neighbor, iter(indices[indptr[neighbor]:indptr[neighbor + 1]])))
+                        break
+                else:
+                    stack.pop()
+                    state[current] = 2
+                    finished.append(current)
 
+        # Reverse the finishing order to get a valid ordering
+        return [adjacency.vertex_ids[index] for index in reversed(finished)]
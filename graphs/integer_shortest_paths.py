@@ -0,0 +1,293 @@
+import os
+
+from graphs._pool import SharedPool
+from graphs.shortest_paths import INFINITY, _dijkstra, bellman_ford_path
+
+# Largest edge weight for which Dial's Algorithm is picked automatically: it
+# keeps max weight + 1 buckets and steps through every distance up to the
+# answer, so it only pays off while weights are small.
+DIAL_MAX_WEIGHT = 1024
+
+ENGINES = ('auto', 'heap', 'dial', 'radix', 'delta')
+
+
+def _dial(indptr, indices, weights, source, max_weight, target=-1):
+    """
+    Dial's Algorithm: Dijkstra with a circular array of max_weight + 1
+    buckets instead of a heap. Only for non-negative integer weights.
+    Every tentative distance lies within max_weight of the one being
+    settled, so each bucket holds a single distance at a time.
+
+    Returns:
+    tuple: (distance, parent) lists indexed by row, as `_dijkstra`.
+    """
+    num_vertices = len(indptr) - 1
+    distance = [INFINITY] * num_vertices
+    parent = [-1] * num_vertices
+    num_buckets = max_weight + 1
+    buckets = [[] for _ in range(num_buckets)]
+    distance[source] = 0
+    buckets[0].append(source)
+    pending = 1
+    current_distance = 0
+
+    while pending:
+        bucket = buckets[current_distance % num_buckets]
+        while bucket: # zero-weight edges can refill the bucket being emptied
+            current = bucket.pop()
+            pending -= 1
+            if distance[current] != current_distance: # stale entry
+                continue
+            if current == target:
+                return distance, parent
+
+            for edge in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[edge]
+                new_distance = current_distance + weights[edge]
+                if new_distance < distance[neighbor]:
+                    distance[neighbor] = new_distance
+                    parent[neighbor] = current
+                    buckets[new_distance % num_buckets].append(neighbor)
+                    pending += 1
+        current_distance += 1
+
+    return distance, parent
+
+
+def _radix_dijkstra(indptr, indices, weights, source, max_weight, target=-1):
+    """
+    Dijkstra with a radix heap, for non-negative integer weights of any
+    size. Bucket i holds keys that first differ from the last key popped
+    at bit i - 1, so each key only moves down O(log C) times.
+
+    Returns:
+    tuple: (distance, parent) lists indexed by row, as `_dijkstra`.
+    """
+    num_vertices = len(indptr) - 1
+    distance = [INFINITY] * num_vertices
+    parent = [-1] * num_vertices
+    # no distance can exceed max_weight * (V - 1)
+    buckets = [[] for _ in range((max_weight * num_vertices).bit_length() + 2)]
+    distance[source] = 0
+    buckets[0].append((0, source))
+    last = 0
+    size = 1
+
+    while size:
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            items = buckets[index]
+            buckets[index] = []
+            last = min(items)[0]
+            for item in items:
+                buckets[(item[0] ^ last).bit_length()].append(item)
+
+        current_distance, current = buckets[0].pop()
+        size -= 1
+        if current_distance != distance[current]: # stale entry
+            continue
+        if current == target:
+            break
+
+        for edge in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[edge]
+            new_distance = current_distance + weights[edge]
+            if new_distance < distance[neighbor]:
+                distance[neighbor] = new_distance
+                parent[neighbor] = current
+                buckets[(new_distance ^ last).bit_length()].append((new_distance, neighbor))
+                size += 1
+
+    return distance, parent
+
+
+def _relax_requests(indptr, indices, weights, delta, frontier, light):
+    """
+    Return the best (neighbor, distance, parent) offer per neighbor over the
+    light (weight <= delta) or heavy edges out of `frontier`, a list of
+    (row, distance) pairs.
+    """
+    best = {}
+    for current, current_distance in frontier:
+        for edge in range(indptr[current], indptr[current + 1]):
+            weight = weights[edge]
+            if (weight <= delta) == light:
+                neighbor = indices[edge]
+                new_distance = current_distance + weight
+                if neighbor not in best or new_distance < best[neighbor][0]:
+                    best[neighbor] = (new_distance, current)
+    return [(neighbor, new_distance, current) for neighbor, (new_distance, current) in best.items()]
+
+
+def _delta_slice(adjacency, task):
+    """Pool task: relaxation offers for one slice of a bucket."""
+    frontier, light = task
+    indptr, indices, weights, delta = adjacency
+    return _relax_requests(indptr, indices, weights, delta, frontier, light)
+
+
+def _delta_stepping(indptr, indices, weights, source, delta, target=-1, pool=None, num_workers=1,
+                    min_parallel=2048):
+    """
+    Delta-stepping: buckets of width `delta`, emptied in order. Within a
+    bucket, light edges are relaxed in rounds until it stays empty; heavy
+    edges, which can't land in the same bucket, are relaxed once after.
+    Each round's relaxations are independent, so with a `pool` frontiers
+    of at least `min_parallel` vertices are split across its `num_workers`
+    workers.
+
+    Returns:
+    tuple: (distance, parent) lists indexed by row, as `_dijkstra`.
+    """
+    num_vertices = len(indptr) - 1
+    distance = [INFINITY] * num_vertices
+    parent = [-1] * num_vertices
+    buckets = {0: {source}}
+    distance[source] = 0
+
+    def requests(frontier, light):
+        if pool is None or len(frontier) < min_parallel:
+            return _relax_requests(indptr, indices, weights, delta, frontier, light)
+        slice_size = -(-len(frontier) // (4 * num_workers))
+        slices = [(frontier[start:start + slice_size], light)
+                  for start in range(0, len(frontier), slice_size)]
+        return [offer for offers in pool.map(_delta_slice, slices) for offer in offers]
+
+    def relax(offers):
+        for neighbor, new_distance, current in offers:
+            if new_distance < distance[neighbor]:
+                if distance[neighbor] != INFINITY:
+                    old = buckets.get(distance[neighbor] // delta)
+                    if old is not None:
+                        old.discard(neighbor)
+                distance[neighbor] = new_distance
+                parent[neighbor] = current
+                buckets.setdefault(new_distance // delta, set()).add(neighbor)
+
+    while buckets:
+        index = min(buckets)
+        settled = []
+        while buckets.get(index):
+            frontier = [(row, distance[row]) for row in buckets.pop(index)]
+            settled.extend(frontier)
+            relax(requests(frontier, light=True))
+        buckets.pop(index, None)
+
+        # everything in this bucket is final now
+        if any(row == target for row, _ in settled):
+            break
+        relax(requests(settled, light=False))
+
+    return distance, parent
+
+
+def select_engine(csr, processes=1):
+    """
+    Pick the fastest single-source engine for an adjacency's weights:
+    'delta' (delta-stepping) when more than one process is asked for and
+    the weights are non-negative integers, 'dial' for small non-negative
+    integer weights, 'radix' for larger ones, and 'heap' (binary-heap
+    Dijkstra) for anything else.
+    """
+    smallest, largest = csr.weight_range()
+    if not csr.has_integer_weights() or smallest < 0:
+        return 'heap'
+    if processes != 1:
+        return 'delta'
+    if largest <= DIAL_MAX_WEIGHT:
+        return 'dial'
+    return 'radix'
+
+
+def _run_engine(csr, source, target=-1, engine='auto', processes=1, delta=None):
+    """Run one single-source engine on an adjacency; returns (distance, parent)."""
+    if engine not in ENGINES:
+        raise ValueError(f'engine must be one of {ENGINES}')
+    if engine == 'auto':
+        engine = select_engine(csr, processes)
+    smallest, largest = csr.weight_range()
+    if smallest < 0:
+        raise ValueError('Edge weights must not be negative; use bellman_ford_distances')
+    if engine in ('dial', 'radix') and not csr.has_integer_weights():
+        raise ValueError(f"The '{engine}' engine needs integer edge weights")
+
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    if engine == 'heap':
+        return _dijkstra(indptr, indices, weights, source, target)
+    if engine == 'dial':
+        return _dial(indptr, indices, weights, source, largest, target)
+    if engine == 'radix':
+        return _radix_dijkstra(indptr, indices, weights, source, largest, target)
+
+    if delta is None:
+        # about the mean weight: most edges are light, buckets stay small
+        delta = max(1, sum(weights) // len(weights)) if len(weights) else 1
+    if processes == 1:
+        return _delta_stepping(indptr, indices, weights, source, delta, target)
+    adjacency = (indptr, indices, weights, delta)
+    num_workers = processes or os.cpu_count()
+    with SharedPool(adjacency, num_workers) as pool:
+        return _delta_stepping(indptr, indices, weights, source, delta, target, pool, num_workers)
+
+
+def single_source_distances(graph, start_id, engine='auto', processes=1, delta=None):
+    """
+    Return the shortest path length from `start_id` to every vertex it can
+    reach, for non-negative edge weights.
+
+    Parameters:
+    graph (Graph): The graph to search. Unweighted edges have length 1.
+    start_id (string): The id of the start vertex.
+    engine (string): 'heap' for binary-heap Dijkstra, 'dial' or 'radix' for
+        integer weights, 'delta' for delta-stepping, or 'auto' (the default)
+        to let `select_engine` choose from the weight range.
+    processes (integer): Worker processes for delta-stepping. None means
+        one per CPU.
+    delta (number): Bucket width for delta-stepping. Defaults to the mean
+        edge weight.
+
+    Returns:
+    dict<string, number>: vertex id -> distance, for reachable vertices.
+    """
+    if not graph.contains_id(start_id):
+        raise KeyError("One or both vertices are not in the graph!")
+
+    csr = graph.get_adjacency()
+    distance, _ = _run_engine(csr, csr.get_index(start_id), -1, engine, processes, delta)
+    return {csr.vertex_ids[row]: distance[row]
+            for row in range(len(distance)) if distance[row] != INFINITY}
+
+
+def shortest_path(graph, start_id, target_id, engine='auto'):
+    """
+    Return the shortest path from `start_id` to `target_id` with its length.
+    Graphs with negative edge weights are searched with `bellman_ford_path`.
+
+    Parameters:
+    graph (Graph): The graph to search. Unweighted edges have length 1.
+    start_id (string): The id of the start vertex.
+    target_id (string): The id of the target vertex.
+    engine (string): The single-source engine, as in `single_source_distances`.
+
+    Returns:
+    tuple: (distance, path) where path is the list of vertex ids from start
+    to target, or (inf, None) if the target can't be reached.
+    """
+    if not graph.contains_id(start_id) or not graph.contains_id(target_id):
+        raise KeyError("One or both vertices are not in the graph!")
+
+    csr = graph.get_adjacency()
+    if csr.has_negative_weights():
+        return bellman_ford_path(graph, start_id, target_id)
+
+    start, target = csr.get_index(start_id), csr.get_index(target_id)
+    distance, parent = _run_engine(csr, start, target, engine)
+    if distance[target] == INFINITY:
+        return INFINITY, None
+
+    path = [target]
+    while path[-1] != start:
+        path.append(parent[path[-1]])
+    return distance[target], [csr.vertex_ids[row] for row in reversed(path)]
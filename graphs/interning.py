@@ -0,0 +1,60 @@
+import sys
+
+
+class VertexIdTable(object):
+    """
+    Two-way mapping between vertex ids and dense integers 0..n-1.
+
+    A graph interns each id once, when the vertex is added, so algorithms
+    can keep their state in flat lists indexed by integer instead of in
+    dicts and sets keyed by ids or Vertex objects.
+    """
+
+    def __init__(self, vertex_ids=()):
+        """
+        Initialize the table, interning `vertex_ids` in order.
+
+        Parameters:
+        vertex_ids (iterable<string>): Ids to intern up front.
+        """
+        self.__index_of = {} # id -> index
+        self.__ids = [] # index -> id
+        for vertex_id in vertex_ids:
+            self.intern(vertex_id)
+
+    def intern(self, vertex_id):
+        """
+        Return the index of `vertex_id`, assigning the next free one if it is new.
+        """
+        index = self.__index_of.get(vertex_id)
+        if index is None:
+            index = len(self.__ids)
+            self.__index_of[vertex_id] = index
+            self.__ids.append(vertex_id)
+        return index
+
+    def get_index(self, vertex_id):
+        """Return the index of `vertex_id`, or raise KeyError if it was never interned."""
+        if vertex_id not in self.__index_of:
+            raise KeyError("Vertex is not in the graph!")
+        return self.__index_of[vertex_id]
+
+    def get_id(self, index):
+        """Return the vertex id stored at `index`."""
+        return self.__ids[index]
+
+    def get_ids(self):
+        """Return a list of all interned ids, in index order."""
+        return list(self.__ids)
+
+    def __contains__(self, vertex_id):
+        """Return True if `vertex_id` has been interned."""
+        return vertex_id in self.__index_of
+
+    def __len__(self):
+        """Return the number of interned ids."""
+        return len(self.__ids)
+
+    def memory_usage(self):
+        """Return the bytes held by the table's dict and list (the ids themselves aren't counted)."""
+        return sys.getsizeof(self.__index_of) + sys.getsizeof(self.__ids)
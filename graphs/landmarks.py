@@ -0,0 +1,262 @@
+from array import array
+from heapq import heappush, heappop, nlargest
+import os
+import random
+
+from graphs._pool import SharedPool
+from graphs.integer_shortest_paths import _run_engine, select_engine
+from graphs.shortest_paths import INFINITY
+
+STRATEGIES = ('farthest', 'degree', 'random')
+
+
+def _landmark_table(adjacency, task):
+    """
+    Pool task: one single-source search for a (row, reverse) task. `adjacency` is
+    (forward CSR, reversed CSR or None, engine). Returns the distances as a
+    flat array of doubles, INFINITY where unreached.
+    """
+    csr, transposed, engine = adjacency
+    row, reverse = task
+    distance, _ = _run_engine(transposed if reverse else csr, row, -1, engine)
+    return array('d', distance)
+
+
+class LandmarkOracle(object):
+    """
+    Approximate distance oracle over a set of landmark vertices.
+
+    From every landmark L it stores d(L, v) for every vertex v, and on
+    directed graphs also d(v, L), in flat arrays of doubles (8 bytes per
+    vertex and table). The triangle inequality then bounds any distance in
+    O(k) for k landmarks:
+
+        max |d(L, t) - d(L, s)|  <=  d(s, t)  <=  min d(s, L) + d(L, t)
+
+    The lower bound is also an admissible, consistent A* heuristic (ALT),
+    which `shortest_path` uses to answer exact queries while settling far
+    fewer vertices than Dijkstra.
+
+    The tables describe the graph as it was when the oracle was built; make
+    a new oracle after changing the graph.
+    """
+
+    def __init__(self, graph, num_landmarks=16, strategy='farthest', processes=1, seed=0):
+        """
+        Pick the landmarks and precompute their distance tables.
+
+        Parameters:
+        graph (Graph): The graph to answer queries on. Unweighted edges have
+            length 1, and weights must not be negative.
+        num_landmarks (integer): How many landmarks to keep (at most one per
+            vertex). More landmarks tighten the bounds at k * V * 8 bytes
+            per direction.
+        strategy (string): How landmarks are picked: 'farthest' (the
+            default) repeatedly adds the vertex farthest from every landmark
+            so far, which spreads them over the edges of the graph; 'degree'
+            takes the hubs with the most out-edges; 'random' samples them.
+        processes (integer): Worker processes for the searches. None means
+            one per CPU. 'farthest' picks a batch of one landmark per
+            process at a time.
+        seed (integer): Seed for 'random' and for the start of 'farthest'.
+
+        Raises:
+        ValueError: For an unknown strategy or negative edge weights.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f'strategy must be one of {STRATEGIES}')
+        csr = graph.get_adjacency()
+        if csr.has_negative_weights():
+            raise ValueError('Edge weights must not be negative')
+
+        self.__csr = csr
+        self.__is_integer = csr.has_integer_weights()
+        self.__landmarks = [] # landmark rows
+        self.__from_tables = [] # table i: d(landmark i, v) by row
+        self.__to_tables = [] # table i: d(v, landmark i) by row; the same arrays when undirected
+
+        num_vertices = csr.num_vertices()
+        num_landmarks = min(num_landmarks, num_vertices)
+        if num_landmarks <= 0:
+            return
+        transposed = csr.transpose() if csr.is_directed else None
+        adjacency = (csr, transposed, select_engine(csr))
+        rng = random.Random(seed)
+
+        if processes is None:
+            processes = os.cpu_count()
+        if processes == 1:
+            self.__pick(rng, strategy, num_landmarks, 1,
+                        lambda tasks: [_landmark_table(adjacency, task) for task in tasks])
+            return
+
+        with SharedPool(adjacency, processes) as pool:
+            self.__pick(rng, strategy, num_landmarks, processes,
+                        lambda tasks: pool.map(_landmark_table, tasks))
+
+    def __pick(self, rng, strategy, num_landmarks, batch, map_tasks):
+        """
+        Choose landmarks and fill their tables. `map_tasks` runs
+        `_landmark_table` on a list of (row, reverse) tasks, serially or in
+        a pool, and `batch` landmarks are searched per call.
+        """
+        csr = self.__csr
+        num_vertices = csr.num_vertices()
+        if strategy == 'degree':
+            rows = sorted(range(num_vertices), key=lambda row: -csr.out_degree(row))[:num_landmarks]
+            self.__add_landmarks(rows, map_tasks)
+            return
+        if strategy == 'random':
+            self.__add_landmarks(rng.sample(range(num_vertices), num_landmarks), map_tasks)
+            return
+
+        # the first landmark is the vertex farthest from a random start
+        start, = map_tasks([(rng.randrange(num_vertices), False)])
+        rows = [max(range(num_vertices), key=lambda row: start[row] if start[row] != INFINITY else -1)]
+        closest = [INFINITY] * num_vertices # distance to or from the nearest landmark
+        while True:
+            self.__add_landmarks(rows, map_tasks)
+            if len(self.__landmarks) == num_landmarks:
+                return
+            for from_table, to_table in zip(self.__from_tables[-len(rows):], self.__to_tables[-len(rows):]):
+                closest = list(map(min, closest, from_table, to_table))
+            # vertices no landmark connects to come first, so every component gets one
+            chosen = set(self.__landmarks)
+            candidates = [row for row in range(num_vertices) if row not in chosen]
+            count = min(batch, num_landmarks - len(self.__landmarks))
+            rows = nlargest(count, candidates, key=closest.__getitem__)
+
+    def __add_landmarks(self, rows, map_tasks):
+        """Search from (and, if directed, to) each row and keep the tables."""
+        is_directed = self.__csr.is_directed
+        tasks = [(row, False) for row in rows]
+        if is_directed:
+            tasks += [(row, True) for row in rows]
+        tables = map_tasks(tasks)
+        self.__landmarks.extend(rows)
+        self.__from_tables.extend(tables[:len(rows)])
+        self.__to_tables.extend(tables[len(rows):] if is_directed else tables)
+
+    def get_landmarks(self):
+        """Return the ids of the landmarks, in the order they were picked."""
+        return [self.__csr.vertex_ids[row] for row in self.__landmarks]
+
+    def memory_usage(self):
+        """Return the bytes held by the distance tables."""
+        tables = self.__from_tables if not self.__csr.is_directed else self.__from_tables + self.__to_tables
+        return sum(table.itemsize * len(table) for table in tables)
+
+    def __number(self, distance):
+        """Return a table distance as an int on integer-weighted graphs."""
+        if self.__is_integer and distance != INFINITY:
+            return int(distance)
+        return distance
+
+    def __rows(self, start_id, target_id):
+        """Return the rows of two vertex ids."""
+        csr = self.__csr
+        if start_id not in csr.id_table or target_id not in csr.id_table:
+            raise KeyError("One or both vertices are not in the graph!")
+        return csr.get_index(start_id), csr.get_index(target_id)
+
+    def __lower_bound(self, row, target):
+        """The largest triangle-inequality lower bound on d(row, target)."""
+        bound = 0
+        for from_table, to_table in zip(self.__from_tables, self.__to_tables):
+            # d(L, t) <= d(L, v) + d(v, t)
+            if from_table[row] != INFINITY and from_table[target] - from_table[row] > bound:
+                bound = from_table[target] - from_table[row]
+            # d(v, L) <= d(v, t) + d(t, L)
+            if to_table[target] != INFINITY and to_table[row] - to_table[target] > bound:
+                bound = to_table[row] - to_table[target]
+        return bound
+
+    def distance_bounds(self, start_id, target_id):
+        """
+        Bound the shortest path length from `start_id` to `target_id` in
+        O(k), without searching the graph.
+
+        Returns:
+        tuple: (lower, upper). The upper bound is the length of a real path
+        through a landmark, and inf if no landmark links the two. A lower
+        bound of inf proves the target can't be reached.
+        """
+        start, target = self.__rows(start_id, target_id)
+        if start == target:
+            return 0, 0
+        upper = min((to_table[start] + from_table[target]
+                     for from_table, to_table in zip(self.__from_tables, self.__to_tables)),
+                    default=INFINITY)
+        return self.__number(self.__lower_bound(start, target)), self.__number(upper)
+
+    def estimate_distance(self, start_id, target_id):
+        """
+        Return an approximate shortest path length in O(k): the upper bound
+        of `distance_bounds`, which is never shorter than the true distance
+        and is exact whenever a shortest path passes through a landmark.
+        """
+        return self.distance_bounds(start_id, target_id)[1]
+
+    def shortest_path(self, start_id, target_id):
+        """
+        Find an exact shortest path with A*, using the landmark lower bounds
+        as the heuristic (ALT). The search is steered towards the target,
+        so it settles a fraction of the vertices plain Dijkstra would.
+
+        Returns:
+        tuple: (distance, path) where path is the list of vertex ids from start
+        to target, or (inf, None) if the target can't be reached.
+        """
+        start, target = self.__rows(start_id, target_id)
+        csr = self.__csr
+        indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+        num_vertices = csr.num_vertices()
+        tables = [(from_table, from_table[target], to_table, to_table[target])
+                  for from_table, to_table in zip(self.__from_tables, self.__to_tables)]
+
+        estimates = [-1] * num_vertices # heuristic of each row, computed on first use
+
+        def heuristic(row):
+            if estimates[row] >= 0:
+                return estimates[row]
+            bound = 0
+            for from_table, from_target, to_table, to_target in tables:
+                if from_table[row] != INFINITY and from_target - from_table[row] > bound:
+                    bound = from_target - from_table[row]
+                if to_target != INFINITY and to_table[row] - to_target > bound:
+                    bound = to_table[row] - to_target
+            estimates[row] = bound
+            return bound
+
+        distance = [INFINITY] * num_vertices
+        parent = [-1] * num_vertices
+        done = bytearray(num_vertices)
+        distance[start] = 0
+        heap = [(heuristic(start), start)]
+
+        while heap:
+            _, current = heappop(heap)
+            if done[current]:
+                continue
+            done[current] = 1
+            if current == target:
+                break
+
+            current_distance = distance[current]
+            for edge in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[edge]
+                new_distance = current_distance + weights[edge]
+                if new_distance < distance[neighbor]:
+                    estimate = heuristic(neighbor)
+                    if estimate == INFINITY: # the target can't be reached from there
+                        continue
+                    distance[neighbor] = new_distance
+                    parent[neighbor] = current
+                    heappush(heap, (new_distance + estimate, neighbor))
+
+        if distance[target] == INFINITY:
+            return INFINITY, None
+        path = [target]
+        while path[-1] != start:
+            path.append(parent[path[-1]])
+        return distance[target], [csr.vertex_ids[row] for row in reversed(path)]
@@ -0,0 +1,652 @@
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, deque
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+
+# On-disk CSR layout (little-endian):
+#   header: magic, format version, num_vertices, num_edges
+#   indptr: num_vertices + 1 int64 row offsets
+#   indices: num_edges int64 target rows
+#   id_offsets: num_vertices + 1 int64 byte offsets into the id blob
+#   id_order: num_vertices int64 rows, sorted by vertex id (for lookups)
+#   id_blob: the UTF-8 vertex ids, back to back
+CSR_MAGIC = b'GCSR'
+CSR_VERSION = 1
+CSR_HEADER = struct.Struct('<4sIqq')
+INT64 = 8
+
+# Sorted edge file layout: little-endian int64 (source, target) pairs,
+# sorted by source. Vertex ids are the integers themselves.
+EDGE_RECORD = 2 * INT64
+
+
+def write_csr_file(graph, path):
+    """
+    Write the adjacency of `graph` to `path` in the on-disk CSR format read
+    by CSRFileSource.
+
+    Parameters:
+    graph (Graph): The graph to write. Vertex ids are stored as strings.
+    path (string): The file to create.
+    """
+    adjacency = graph.get_adjacency()
+    id_bytes = [str(vertex_id).encode('utf-8') for vertex_id in adjacency.vertex_ids]
+    id_offsets = array('q', [0])
+    for encoded in id_bytes:
+        id_offsets.append(id_offsets[-1] + len(encoded))
+    id_order = array('q', sorted(range(len(id_bytes)), key=lambda row: str(adjacency.vertex_ids[row])))
+
+    with open(path, 'wb') as f:
+        f.write(CSR_HEADER.pack(CSR_MAGIC, CSR_VERSION, adjacency.num_vertices(), adjacency.num_edges()))
+        f.write(array('q', adjacency.indptr).tobytes())
+        f.write(array('q', adjacency.indices).tobytes())
+        f.write(id_offsets.tobytes())
+        f.write(id_order.tobytes())
+        f.write(b''.join(id_bytes))
+
+
+def write_sorted_edge_file(graph, path):
+    """
+    Write the edges of `graph` to `path` as a sorted edge file read by
+    SortedEdgeFileSource. Vertices are numbered by the graph's id table.
+    """
+    adjacency = graph.get_adjacency()
+    records = array('q')
+    for row in range(adjacency.num_vertices()):
+        for target in sorted(adjacency.neighbors(row)):
+            records.append(row)
+            records.append(target)
+
+    with open(path, 'wb') as f:
+        f.write(records.tobytes())
+
+
+class BlockCache(object):
+    """
+    A bounded cache of adjacency blocks, evicting the least recently used
+    block once `capacity` blocks are held.
+    """
+
+    def __init__(self, load_block, capacity):
+        """
+        Parameters:
+        load_block (function): Reads block number `n` from disk.
+        capacity (integer): The most blocks to keep in memory at once.
+        """
+        if capacity < 1:
+            raise ValueError('Block cache needs room for at least one block')
+        self.__load_block = load_block
+        self.__capacity = capacity
+        self.__blocks = OrderedDict() # block number -> block, oldest use first
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, block_number):
+        """Return the block, loading it (and evicting another) if it isn't cached."""
+        block = self.__blocks.get(block_number)
+        if block is not None:
+            self.hits += 1
+            self.__blocks.move_to_end(block_number)
+            return block
+
+        self.misses += 1
+        block = self.__load_block(block_number)
+        self.__blocks[block_number] = block
+        if len(self.__blocks) > self.__capacity:
+            self.__blocks.popitem(last=False)
+        return block
+
+    def __len__(self):
+        """Return the number of blocks currently held."""
+        return len(self.__blocks)
+
+
+class CSRFileSource(object):
+    """
+    Adjacency read on demand from a memory-mapped CSR file written by
+    `write_csr_file`. Rows are decoded a block at a time through a
+    BlockCache, so memory use is bounded by the cache, not the graph.
+    """
+
+    def __init__(self, path, rows_per_block=4096, cache_blocks=64):
+        """
+        Parameters:
+        path (string): The CSR file.
+        rows_per_block (integer): How many rows are paged in together.
+        cache_blocks (integer): How many blocks the cache may hold.
+        """
+        self.__file = open(path, 'rb')
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, num_vertices, num_edges = CSR_HEADER.unpack_from(self.__map, 0)
+        if magic != CSR_MAGIC or version != CSR_VERSION:
+            raise ValueError(f'{path} is not a CSR graph file')
+
+        self.__num_vertices = num_vertices
+        self.__indptr_offset = CSR_HEADER.size
+        self.__indices_offset = self.__indptr_offset + (num_vertices + 1) * INT64
+        self.__id_offsets_offset = self.__indices_offset + num_edges * INT64
+        self.__id_order_offset = self.__id_offsets_offset + (num_vertices + 1) * INT64
+        self.__id_blob_offset = self.__id_order_offset + num_vertices * INT64
+        self.__rows_per_block = rows_per_block
+        self.cache = BlockCache(self.__load_block, cache_blocks)
+
+    def __int64_at(self, offset, index):
+        """Read one int64 from the section starting at `offset`."""
+        return struct.unpack_from('<q', self.__map, offset + index * INT64)[0]
+
+    def __load_block(self, block_number):
+        """Decode the row offsets and targets of one block of rows."""
+        first_row = block_number * self.__rows_per_block
+        last_row = min(first_row + self.__rows_per_block, self.__num_vertices)
+        start = self.__indptr_offset + first_row * INT64
+        indptr = array('q', self.__map[start:start + (last_row - first_row + 1) * INT64])
+
+        start = self.__indices_offset + indptr[0] * INT64
+        indices = array('q', self.__map[start:start + (indptr[-1] - indptr[0]) * INT64])
+        return indptr, indices
+
+    def num_vertices(self):
+        """Return the number of vertices in the file."""
+        return self.__num_vertices
+
+    def neighbors(self, index):
+        """Return the target indices of the out-edges of vertex `index`."""
+        indptr, indices = self.cache.get(index // self.__rows_per_block)
+        row = index % self.__rows_per_block
+        return indices[indptr[row] - indptr[0]:indptr[row + 1] - indptr[0]]
+
+    def get_id(self, index):
+        """Return the vertex id stored for `index`."""
+        start = self.__int64_at(self.__id_offsets_offset, index)
+        end = self.__int64_at(self.__id_offsets_offset, index + 1)
+        offset = self.__id_blob_offset
+        return self.__map[offset + start:offset + end].decode('utf-8')
+
+    def get_index(self, vertex_id):
+        """Return the index of `vertex_id`, by binary search over the sorted id order."""
+        vertex_id = str(vertex_id)
+        low, high = 0, self.__num_vertices
+        while low < high:
+            middle = (low + high) // 2
+            if self.get_id(self.__int64_at(self.__id_order_offset, middle)) < vertex_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.__num_vertices:
+            index = self.__int64_at(self.__id_order_offset, low)
+            if self.get_id(index) == vertex_id:
+                return index
+        raise KeyError("Vertex is not in the graph!")
+
+    def close(self):
+        """Release the memory map and the file."""
+        self.__map.close()
+        self.__file.close()
+
+
+class SortedEdgeFileSource(object):
+    """
+    Adjacency read on demand from a sorted edge file. A vertex's edges are
+    found by binary search over the records, reading fixed-size blocks of
+    records through a BlockCache.
+    """
+
+    def __init__(self, path, edges_per_block=8192, cache_blocks=64):
+        """
+        Parameters:
+        path (string): The edge file.
+        edges_per_block (integer): How many edge records are paged in together.
+        cache_blocks (integer): How many blocks the cache may hold.
+        """
+        self.__file = open(path, 'rb')
+        size = os.fstat(self.__file.fileno()).st_size
+        if size % EDGE_RECORD:
+            raise ValueError(f'{path} is not a sorted edge file')
+        self.__num_edges = size // EDGE_RECORD
+        self.__edges_per_block = edges_per_block
+        self.cache = BlockCache(self.__load_block, cache_blocks)
+
+    def __load_block(self, block_number):
+        """Read one block of records, split into sources and targets."""
+        self.__file.seek(block_number * self.__edges_per_block * EDGE_RECORD)
+        records = array('q', self.__file.read(self.__edges_per_block * EDGE_RECORD))
+        return records[0::2], records[1::2]
+
+    def __record(self, position):
+        """Return the (sources, targets, offset) of the block holding record `position`."""
+        sources, targets = self.cache.get(position // self.__edges_per_block)
+        return sources, targets, position % self.__edges_per_block
+
+    def num_vertices(self):
+        """The number of vertices isn't stored in an edge file."""
+        return None
+
+    def neighbors(self, index):
+        """Return the targets of the edges whose source is `index`."""
+        # binary search for the first record with this source
+        low, high = 0, self.__num_edges
+        while low < high:
+            middle = (low + high) // 2
+            sources, _, offset = self.__record(middle)
+            if sources[offset] < index:
+                low = middle + 1
+            else:
+                high = middle
+
+        neighbors = array('q')
+        position = low
+        while position < self.__num_edges:
+            sources, targets, offset = self.__record(position)
+            # take the rest of this block's run of records in one slice
+            end = bisect_left(sources, index + 1, offset)
+            neighbors.extend(targets[offset:end])
+            if end < len(sources):
+                break
+            position += end - offset
+        return neighbors
+
+    def get_id(self, index):
+        """Vertex ids in an edge file are the integers themselves."""
+        return index
+
+    def get_index(self, vertex_id):
+        """Vertex ids in an edge file are the integers themselves."""
+        return int(vertex_id)
+
+    def close(self):
+        """Release the file."""
+        self.__file.close()
+
+
+class SpillQueue(object):
+    """
+    A FIFO queue of integers that keeps at most about `max_in_memory` of them
+    in memory, writing the rest to temporary segment files.
+    """
+
+    def __init__(self, max_in_memory=1 << 20, spill_dir=None):
+        self.__max_in_memory = max_in_memory
+        self.__spill_dir = spill_dir
+        self.__head = deque() # oldest items, ready to pop
+        self.__segments = deque() # spilled files, oldest first
+        self.__tail = array('q') # newest items, not yet spilled
+        self.__length = 0
+
+    def append(self, item):
+        """Add an item at the back of the queue."""
+        self.__tail.append(item)
+        self.__length += 1
+        if len(self.__tail) >= self.__max_in_memory:
+            self.__segments.append(_spill(self.__tail, self.__spill_dir))
+            self.__tail = array('q')
+
+    def popleft(self):
+        """Remove and return the item at the front of the queue."""
+        if not self.__head:
+            if self.__segments:
+                self.__head = deque(_unspill(self.__segments.popleft()))
+            else:
+                self.__head, self.__tail = deque(self.__tail), array('q')
+        self.__length -= 1
+        return self.__head.popleft()
+
+    def __iter__(self):
+        """Iterate over the items front to back without removing them."""
+        yield from self.__head
+        for path in self.__segments:
+            yield from _read_segment(path)
+        yield from self.__tail
+
+    def __len__(self):
+        return self.__length
+
+    def checkpoint(self, directory):
+        """
+        Return the queue's state for a checkpoint. Spilled segments are
+        linked (or copied) into `directory` instead of being read back, so
+        only the in-memory head and tail are held in the returned dict.
+        """
+        return {
+            'head': array('q', self.__head).tobytes(),
+            'segments': [_keep_segment(path, directory) for path in self.__segments],
+            'tail': self.__tail.tobytes(),
+            'length': self.__length,
+        }
+
+    def restore(self, saved):
+        """Take over the state `checkpoint` returned; the saved segments stay in place."""
+        self.close()
+        self.__head = deque(array('q', saved['head']))
+        self.__segments = deque(_attach_segment(path, self.__spill_dir) for path in saved['segments'])
+        self.__tail = array('q', saved['tail'])
+        self.__length = saved['length']
+
+    def close(self):
+        """Delete any segment files."""
+        while self.__segments:
+            os.remove(self.__segments.popleft())
+
+
+class SpillStack(object):
+    """
+    A LIFO stack of integers that keeps at most about `max_in_memory` of them
+    in memory, writing the bottom of the stack to temporary segment files.
+    """
+
+    def __init__(self, max_in_memory=1 << 20, spill_dir=None):
+        self.__max_in_memory = max_in_memory
+        self.__spill_dir = spill_dir
+        self.__segments = [] # spilled files, bottom of the stack first
+        self.__top = array('q')
+        self.__length = 0
+
+    def append(self, item):
+        """Push an item."""
+        self.__top.append(item)
+        self.__length += 1
+        if len(self.__top) >= self.__max_in_memory:
+            half = len(self.__top) // 2
+            self.__segments.append(_spill(self.__top[:half], self.__spill_dir))
+            self.__top = self.__top[half:]
+
+    def pop(self):
+        """Remove and return the most recently pushed item."""
+        if not self.__top:
+            self.__top = _unspill(self.__segments.pop())
+        self.__length -= 1
+        return self.__top.pop()
+
+    def __iter__(self):
+        """Iterate over the items bottom to top without removing them."""
+        for path in self.__segments:
+            yield from _read_segment(path)
+        yield from self.__top
+
+    def __len__(self):
+        return self.__length
+
+    def checkpoint(self, directory):
+        """Return the stack's state for a checkpoint, as `SpillQueue.checkpoint`."""
+        return {
+            'segments': [_keep_segment(path, directory) for path in self.__segments],
+            'top': self.__top.tobytes(),
+            'length': self.__length,
+        }
+
+    def restore(self, saved):
+        """Take over the state `checkpoint` returned; the saved segments stay in place."""
+        self.close()
+        self.__segments = [_attach_segment(path, self.__spill_dir) for path in saved['segments']]
+        self.__top = array('q', saved['top'])
+        self.__length = saved['length']
+
+    def close(self):
+        """Delete any segment files."""
+        while self.__segments:
+            os.remove(self.__segments.pop())
+
+
+def _spill(items, spill_dir):
+    """Write an array of int64 to a new temporary file; return its path."""
+    descriptor, path = tempfile.mkstemp(prefix='graph-spill-', dir=spill_dir)
+    with os.fdopen(descriptor, 'wb') as f:
+        f.write(items.tobytes())
+        f.flush()
+        os.fsync(f.fileno()) # it may end up in a checkpoint
+    return path
+
+
+def _link_or_copy(path, destination):
+    """
+    Give a segment file a second name. Segments are never changed after
+    they are written, so a hard link is as good as a copy; the copy (made
+    in chunks, never in memory whole) is for directories on another device.
+    """
+    try:
+        os.link(path, destination)
+    except OSError:
+        shutil.copyfile(path, destination)
+
+
+def _keep_segment(path, directory):
+    """Make sure a checkpoint directory holds the segment at `path`; return its path there."""
+    destination = os.path.join(directory, os.path.basename(path))
+    if not os.path.exists(destination): # already kept by an earlier checkpoint
+        _link_or_copy(path, destination)
+    return destination
+
+
+def _attach_segment(path, spill_dir):
+    """
+    Return a new spill file with the contents of a checkpointed segment, so
+    the traversal can consume it while the checkpoint keeps its own copy.
+    """
+    descriptor, destination = tempfile.mkstemp(prefix='graph-spill-', dir=spill_dir)
+    os.close(descriptor)
+    os.remove(destination)
+    _link_or_copy(path, destination)
+    return destination
+
+
+def _read_segment(path):
+    """Return the int64 array stored in a segment file."""
+    with open(path, 'rb') as f:
+        return array('q', f.read())
+
+
+def _unspill(path):
+    """Read a segment file back and delete it."""
+    items = _read_segment(path)
+    os.remove(path)
+    return items
+
+
+class VisitedBitmap(object):
+    """One bit per vertex index, growing as larger indices are marked."""
+
+    def __init__(self, num_vertices=0, bits=None):
+        self.bits = bytearray(bits) if bits is not None else bytearray((num_vertices + 7) // 8)
+
+    def add(self, index):
+        """Mark `index` as visited."""
+        byte = index >> 3
+        if byte >= len(self.bits):
+            self.bits.extend(bytes(byte + 1 - len(self.bits)))
+        self.bits[byte] |= 1 << (index & 7)
+
+    def __contains__(self, index):
+        """Return True if `index` has been marked."""
+        byte = index >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] & (1 << (index & 7)))
+
+
+class ExternalTraversal(object):
+    """
+    BFS and DFS over an on-disk adjacency source (CSRFileSource or
+    SortedEdgeFileSource).
+
+    Visited vertices are kept in a bitmap and the frontier in a queue or
+    stack that spills to disk, so memory stays bounded. If a checkpoint
+    path is given, the traversal state is written there (atomically) every
+    `checkpoint_every` vertices, and `resume` continues from it after a
+    crash. Spilled frontier segments are kept by linking them into the
+    `<checkpoint path>.segments` directory, so neither checkpoints nor
+    `resume` read the whole frontier into memory. Vertices yielded after
+    the last checkpoint are yielded again on resume, so consumers should
+    tolerate repeats.
+    """
+
+    def __init__(self, source, checkpoint_path=None, checkpoint_every=100000,
+                 max_in_memory=1 << 20, spill_dir=None):
+        """
+        Parameters:
+        source (CSRFileSource): Where adjacency is read from.
+        checkpoint_path (string): Where to save traversal state, or None.
+        checkpoint_every (integer): Vertices processed between checkpoints.
+        max_in_memory (integer): Frontier entries kept in memory before spilling.
+        spill_dir (string): Directory for spill files (default: system temp).
+        """
+        self.__source = source
+        self.__checkpoint_path = checkpoint_path
+        self.__checkpoint_every = checkpoint_every
+        self.__max_in_memory = max_in_memory
+        self.__spill_dir = spill_dir
+
+    def bfs(self, start_id, max_depth=None):
+        """
+        Traverse breadth-first from `start_id`.
+
+        Returns:
+        generator: Yields (vertex_id, depth) in BFS order, up to `max_depth`.
+        """
+        start = self.__source.get_index(start_id)
+        visited = VisitedBitmap(self.__source.num_vertices() or 0)
+        visited.add(start)
+        current_level = self.__new_queue()
+        current_level.append(start)
+        state = {'kind': 'bfs', 'max_depth': max_depth, 'depth': 0, 'processed': 0}
+        return self.__run_bfs(state, visited, current_level, self.__new_queue())
+
+    def dfs(self, start_id):
+        """
+        Traverse depth-first from `start_id`.
+
+        Returns:
+        generator: Yields vertex ids in DFS preorder.
+        """
+        stack = self.__new_stack()
+        stack.append(self.__source.get_index(start_id))
+        visited = VisitedBitmap(self.__source.num_vertices() or 0)
+        state = {'kind': 'dfs', 'processed': 0}
+        return self.__run_dfs(state, visited, stack)
+
+    def find_vertices_n_away(self, start_id, target_distance):
+        """
+        Return all vertex ids exactly `target_distance` edges away from `start_id`.
+        """
+        return [vertex_id for vertex_id, depth in self.bfs(start_id, target_distance)
+                if depth == target_distance]
+
+    def resume(self):
+        """
+        Continue the traversal saved at the checkpoint path.
+
+        Returns:
+        generator: The rest of the saved BFS or DFS, in the same form as
+        `bfs` or `dfs` return.
+        """
+        with open(self.__checkpoint_path, 'rb') as f:
+            saved = pickle.load(f)
+        state = saved['state']
+        visited = VisitedBitmap(bits=saved['visited'])
+
+        if state['kind'] == 'dfs':
+            stack = self.__new_stack()
+            stack.restore(saved['stack'])
+            return self.__run_dfs(state, visited, stack)
+
+        current_level, next_level = self.__new_queue(), self.__new_queue()
+        current_level.restore(saved['current_level'])
+        next_level.restore(saved['next_level'])
+        return self.__run_bfs(state, visited, current_level, next_level)
+
+    def __new_queue(self):
+        return SpillQueue(self.__max_in_memory, self.__spill_dir)
+
+    def __new_stack(self):
+        return SpillStack(self.__max_in_memory, self.__spill_dir)
+
+    def __run_bfs(self, state, visited, current_level, next_level):
+        """Level-by-level BFS; checkpoints between vertices."""
+        source = self.__source
+        try:
+            while current_level:
+                current = current_level.popleft()
+                yield source.get_id(current), state['depth']
+
+                if state['max_depth'] is None or state['depth'] < state['max_depth']:
+                    for neighbor in source.neighbors(current):
+                        if neighbor not in visited:
+                            visited.add(neighbor)
+                            next_level.append(neighbor)
+
+                if not current_level:
+                    current_level, next_level = next_level, current_level
+                    state['depth'] += 1
+
+                state['processed'] += 1
+                if self.__checkpoint_due(state):
+                    self.__save(state, visited, current_level=current_level, next_level=next_level)
+        finally:
+            current_level.close()
+            next_level.close()
+
+        self.__finish()
+
+    def __run_dfs(self, state, visited, stack):
+        """Iterative DFS (vertices are marked when popped); checkpoints between vertices."""
+        source = self.__source
+        try:
+            while stack:
+                current = stack.pop()
+                if current in visited:
+                    continue
+                visited.add(current)
+                yield source.get_id(current)
+
+                # push in reverse so the first neighbor is explored first
+                for neighbor in reversed(source.neighbors(current)):
+                    if neighbor not in visited:
+                        stack.append(neighbor)
+
+                state['processed'] += 1
+                if self.__checkpoint_due(state):
+                    self.__save(state, visited, stack=stack)
+        finally:
+            stack.close()
+
+        self.__finish()
+
+    def __checkpoint_due(self, state):
+        return (self.__checkpoint_path is not None
+                and state['processed'] % self.__checkpoint_every == 0)
+
+    def __segment_dir(self):
+        return self.__checkpoint_path + '.segments'
+
+    def __save(self, state, visited, **frontier):
+        """
+        Atomically replace the checkpoint file with the current state. The
+        segments it names are linked in first, and the ones only the
+        previous checkpoint used are removed after the switch.
+        """
+        segment_dir = self.__segment_dir()
+        os.makedirs(segment_dir, exist_ok=True)
+        saved = {'state': state, 'visited': bytes(visited.bits)}
+        for name, items in frontier.items():
+            saved[name] = items.checkpoint(segment_dir)
+
+        temporary_path = self.__checkpoint_path + '.tmp'
+        with open(temporary_path, 'wb') as f:
+            pickle.dump(saved, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, self.__checkpoint_path)
+
+        kept = {path for items in saved.values() if isinstance(items, dict) and 'segments' in items
+                for path in items['segments']}
+        for name in os.listdir(segment_dir):
+            if os.path.join(segment_dir, name) not in kept:
+                os.remove(os.path.join(segment_dir, name))
+
+    def __finish(self):
+        """A completed traversal has nothing left to resume."""
+        if self.__checkpoint_path is not None and os.path.exists(self.__checkpoint_path):
+            os.remove(self.__checkpoint_path)
+        if self.__checkpoint_path is not None and os.path.isdir(self.__segment_dir()):
+            shutil.rmtree(self.__segment_dir())
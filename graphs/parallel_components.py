@@ -0,0 +1,187 @@
+import os
+
+from graphs.backend import import_numpy
+
+
+# Shared-memory arrays attached once per worker process by the initializer.
+_worker_arrays = None
+
+
+def _init_components_worker(names, num_edges, num_vertices):
+    """Map the shared sources, targets and labels into this worker."""
+    import numpy
+    from multiprocessing import shared_memory
+
+    global _worker_arrays
+    # pool workers share the parent's resource tracker, so attaching here
+    # doesn't hand ownership over; the parent still unlinks the blocks
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    sources = numpy.ndarray(num_edges, dtype=numpy.int64, buffer=blocks[0].buf)
+    targets = numpy.ndarray(num_edges, dtype=numpy.int64, buffer=blocks[1].buf)
+    labels = numpy.ndarray(num_vertices, dtype=numpy.int64, buffer=blocks[2].buf)
+    # keep the blocks referenced, or their memory is unmapped under the arrays
+    _worker_arrays = (blocks, sources, targets, labels)
+
+
+def _components_worker(chunk):
+    """Pool task: hook proposals for one chunk of the shared edge arrays."""
+    _, sources, targets, labels = _worker_arrays
+    return _hook_chunk(sources, targets, labels, *chunk)
+
+
+def _hook_chunk(sources, targets, labels, start, length):
+    """
+    Look at the edges sources/targets[start:start + length] under the
+    current labels. Edges already inside one component are dropped for
+    good by compacting the chunk in place (each chunk belongs to one task,
+    so no two processes write the same slots).
+
+    Returns:
+    tuple: (edges left, labels to hook, label to hook each onto) with every
+    label to hook listed once, paired with the smallest label offered.
+    """
+    import numpy
+
+    end = start + length
+    source_labels = labels[sources[start:end]]
+    target_labels = labels[targets[start:end]]
+    crossing = source_labels != target_labels
+    left = int(numpy.count_nonzero(crossing))
+    sources[start:start + left] = sources[start:end][crossing]
+    targets[start:start + left] = targets[start:end][crossing]
+
+    high = numpy.maximum(source_labels[crossing], target_labels[crossing])
+    low = numpy.minimum(source_labels[crossing], target_labels[crossing])
+    if left == 0:
+        return 0, high, low
+    order = numpy.lexsort((low, high))
+    high, low = high[order], low[order]
+    first = numpy.flatnonzero(numpy.r_[True, high[1:] != high[:-1]])
+    return left, high[first], low[first]
+
+
+def _shortcut(labels):
+    """Pointer jumping: point every vertex straight at the root of its tree."""
+    import numpy
+
+    while True:
+        grandparents = labels[labels]
+        if numpy.array_equal(grandparents, labels):
+            return
+        labels[:] = grandparents
+
+
+def parallel_component_labels(graph, processes=None, chunks_per_process=4):
+    """
+    Label every vertex with the smallest row in its connected component,
+    using Shiloach-Vishkin style hooking and pointer jumping over NumPy
+    edge arrays. Requires NumPy.
+
+    The edge and label arrays live in shared memory, so pool workers read
+    them without copying. Each round, the workers scan their chunk of
+    edges in parallel and propose hooking the larger label of each edge
+    onto the smaller one; the main process applies the proposals and
+    shortcuts every tree to its root. Edges that end up inside a component
+    are dropped, so later rounds get cheaper.
+
+    Edge direction is ignored, as in `Graph.get_connected_components`.
+
+    Parameters:
+    graph (Graph): The graph to label.
+    processes (integer): Number of worker processes. None means one per
+        CPU, and 1 runs the same rounds without a pool.
+    chunks_per_process (integer): Edge chunks handed out per worker and round.
+
+    Returns:
+    tuple: (labels, vertex_ids) where labels is an int64 array with the
+    component label of each row and vertex_ids lists the id of each row.
+    """
+    import numpy
+    from graphs.convert import to_edge_arrays
+
+    sources, targets, _, vertex_ids = to_edge_arrays(graph)
+    keep = sources < targets if not graph.is_directed else sources != targets
+    sources, targets = sources[keep], targets[keep]
+    num_edges, num_vertices = len(sources), len(vertex_ids)
+
+    if processes is None:
+        processes = os.cpu_count()
+    num_chunks = max(1, processes * chunks_per_process)
+    chunk_size = -(-num_edges // num_chunks)
+    chunks = [[start, min(chunk_size, num_edges - start)]
+              for start in range(0, num_edges, max(chunk_size, 1))]
+
+    if processes == 1 or num_edges == 0:
+        labels = numpy.arange(num_vertices, dtype=numpy.int64)
+        sources, targets = sources.copy(), targets.copy()
+        _label_rounds(labels, chunks,
+                      lambda chunks: [_hook_chunk(sources, targets, labels, *chunk) for chunk in chunks])
+        return labels, vertex_ids
+
+    import multiprocessing # only pays its import cost when a pool is used
+    from multiprocessing import shared_memory
+
+    sizes = [8 * num_edges, 8 * num_edges, 8 * num_vertices]
+    blocks = [shared_memory.SharedMemory(create=True, size=max(size, 1)) for size in sizes]
+    try:
+        shared_sources = numpy.ndarray(num_edges, dtype=numpy.int64, buffer=blocks[0].buf)
+        shared_targets = numpy.ndarray(num_edges, dtype=numpy.int64, buffer=blocks[1].buf)
+        labels = numpy.ndarray(num_vertices, dtype=numpy.int64, buffer=blocks[2].buf)
+        shared_sources[:] = sources
+        shared_targets[:] = targets
+        labels[:] = numpy.arange(num_vertices)
+
+        names = [block.name for block in blocks]
+        with multiprocessing.Pool(processes, _init_components_worker, (names, num_edges, num_vertices)) as pool:
+            _label_rounds(labels, chunks, lambda chunks: pool.map(_components_worker, chunks))
+        labels = labels.copy()
+        del shared_sources, shared_targets
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return labels, vertex_ids
+
+
+def _label_rounds(labels, chunks, map_chunks):
+    """
+    Hook and shortcut until no edge joins two labels. `map_chunks` runs
+    `_hook_chunk` on every chunk in a list, serially or in a pool.
+    """
+    import numpy
+
+    while chunks:
+        active = []
+        for chunk, (left, high, low) in zip(chunks, map_chunks(chunks)):
+            if left:
+                numpy.minimum.at(labels, high, low)
+                active.append([chunk[0], left])
+        chunks = active
+        _shortcut(labels)
+
+
+def parallel_connected_components(graph, processes=None):
+    """
+    Return the connected components of `graph`, computed in parallel by
+    `parallel_component_labels`. The result is the same as
+    `graph.get_connected_components()`, which is used instead when NumPy
+    isn't available (see `graphs.backend`).
+
+    Parameters:
+    graph (Graph): The graph to split into components.
+    processes (integer): Number of worker processes. None means one per CPU.
+
+    Returns:
+    list<list<string>>: The connected components as lists of vertex ids.
+    """
+    numpy = import_numpy()
+    if numpy is None:
+        return graph.get_connected_components()
+
+    labels, vertex_ids = parallel_component_labels(graph, processes)
+    # labels are the smallest row of each component, so sorting the rows by
+    # label keeps components in the serial order and rows in order inside them
+    order = numpy.argsort(labels, kind='stable')
+    boundaries = numpy.flatnonzero(numpy.diff(labels[order])) + 1
+    return [[vertex_ids[row] for row in component]
+            for component in numpy.split(order, boundaries) if len(component)]
@@ -0,0 +1,544 @@
+from collections import deque
+from heapq import heappush, heappop
+import random
+
+from graphs._pool import SharedPool
+from graphs.subgraph import induced_subgraph
+
+
+class Partition(object):
+    """
+    An assignment of every vertex of a graph to one of `num_parts` shards.
+
+    Rows follow the graph's adjacency, so `assignment[i]` is the part of
+    the vertex interned as `i`. Edges whose ends lie in different parts
+    are cut edges; the vertices at their ends are boundary vertices.
+    """
+
+    def __init__(self, graph, assignment, num_parts):
+        """
+        Initialize the partition.
+
+        Parameters:
+        graph (Graph): The partitioned graph.
+        assignment (list<integer>): The part of each row, 0..num_parts-1.
+        num_parts (integer): The number of parts.
+        """
+        self.graph = graph
+        self.adjacency = graph.get_adjacency()
+        self.assignment = assignment
+        self.num_parts = num_parts
+
+    def get_part(self, vertex_id):
+        """Return the part the given vertex belongs to."""
+        return self.assignment[self.adjacency.get_index(vertex_id)]
+
+    def get_parts(self):
+        """Return a list with the vertex ids of each part."""
+        parts = [[] for _ in range(self.num_parts)]
+        for row, part in enumerate(self.assignment):
+            parts[part].append(self.adjacency.vertex_ids[row])
+        return parts
+
+    def get_part_sizes(self):
+        """Return the number of vertices in each part."""
+        sizes = [0] * self.num_parts
+        for part in self.assignment:
+            sizes[part] += 1
+        return sizes
+
+    def get_imbalance(self):
+        """Return the largest part size over the average part size (1.0 is perfect)."""
+        num_vertices = len(self.assignment)
+        if num_vertices == 0:
+            return 1.0
+        return max(self.get_part_sizes()) * self.num_parts / num_vertices
+
+    def cut_size(self):
+        """Return the number of edges between different parts."""
+        csr, assignment = self.adjacency, self.assignment
+        cut = 0
+        for row in range(csr.num_vertices()):
+            for neighbor in csr.neighbors(row):
+                if assignment[neighbor] != assignment[row]:
+                    cut += 1
+        # undirected edges are stored once in each direction
+        return cut if csr.is_directed else cut // 2
+
+    def get_boundary_table(self):
+        """
+        Return, for each part, the vertices that have an edge (in either
+        direction) to another part.
+
+        Returns:
+        list<dict<string, list<integer>>>: One dict per part, mapping each of
+        its boundary vertex ids to the sorted other parts it is linked to.
+        """
+        csr, assignment = self.adjacency, self.assignment
+        touching = {}
+        for row in range(csr.num_vertices()):
+            for neighbor in csr.neighbors(row):
+                if assignment[neighbor] != assignment[row]:
+                    touching.setdefault(row, set()).add(assignment[neighbor])
+                    touching.setdefault(neighbor, set()).add(assignment[row])
+
+        table = [{} for _ in range(self.num_parts)]
+        for row in sorted(touching):
+            table[assignment[row]][csr.vertex_ids[row]] = sorted(touching[row])
+        return table
+
+    def get_shard(self, part):
+        """Return a new graph holding one part and the edges inside it."""
+        return induced_subgraph(self.graph, self.get_parts()[part])
+
+
+def _undirected_links(csr):
+    """
+    Return one {neighbor row: edge count} dict per row, ignoring edge
+    direction and self-loops. Partitioning only cares which vertices are
+    linked, not which way.
+    """
+    links = [{} for _ in range(csr.num_vertices())]
+    for row in range(csr.num_vertices()):
+        for neighbor in csr.neighbors(row):
+            if neighbor != row:
+                links[row][neighbor] = links[row].get(neighbor, 0) + 1
+                links[neighbor][row] = links[neighbor].get(row, 0) + 1
+    return links
+
+
+def _grow_regions(links, vertex_weight, num_parts, order):
+    """
+    Grow the parts one at a time by BFS until each holds its share of the
+    total vertex weight. The next part starts from the previous part's
+    leftover frontier, so neighboring regions end up next to each other.
+    `order` gives the vertices to restart from when a frontier runs dry.
+    """
+    assignment = [-1] * len(links)
+    remaining = sum(vertex_weight)
+    queue = deque()
+    next_start = 0
+
+    for part in range(num_parts):
+        target = remaining / (num_parts - part)
+        size = 0
+        while size < target or part == num_parts - 1:
+            if not queue:
+                while next_start < len(order) and assignment[order[next_start]] >= 0:
+                    next_start += 1
+                if next_start == len(order):
+                    break
+                queue.append(order[next_start])
+
+            row = queue.popleft()
+            if assignment[row] >= 0:
+                continue
+            assignment[row] = part
+            size += vertex_weight[row]
+            for neighbor in links[row]:
+                if assignment[neighbor] < 0:
+                    queue.append(neighbor)
+        remaining -= size
+
+    return assignment
+
+
+def _refine(links, vertex_weight, assignment, num_parts, capacity, max_passes, rng):
+    """
+    Balanced label propagation: move each vertex to the part most of its
+    links point into, as long as that part stays within `capacity`. Moves
+    out of an overweight part are made even when they cut more edges.
+    Stops after a pass with no moves.
+    """
+    size = [0] * num_parts
+    for row, part in enumerate(assignment):
+        size[part] += vertex_weight[row]
+
+    order = list(range(len(links)))
+    for _ in range(max_passes):
+        rng.shuffle(order)
+        moved = False
+        for row in order:
+            current = assignment[row]
+            weight = vertex_weight[row]
+            link_weight = {}
+            for neighbor, count in links[row].items():
+                link_weight[assignment[neighbor]] = link_weight.get(assignment[neighbor], 0) + count
+
+            best, best_gain = -1, None
+            here = link_weight.get(current, 0)
+            for part, count in link_weight.items():
+                if part != current and size[part] + weight <= capacity:
+                    gain = count - here
+                    if best_gain is None or gain > best_gain or (gain == best_gain and size[part] < size[best]):
+                        best, best_gain = part, gain
+            if best < 0:
+                continue
+
+            overweight = size[current] > capacity
+            evens_out = best_gain == 0 and size[best] + weight < size[current]
+            if best_gain > 0 or evens_out or overweight:
+                assignment[row] = best
+                size[current] -= weight
+                size[best] += weight
+                moved = True
+        if not moved:
+            break
+    return assignment
+
+
+def _check_num_parts(num_parts):
+    if num_parts < 1:
+        raise ValueError('Number of parts must be at least 1')
+
+
+def _capacity(total_weight, num_parts, imbalance, vertex_weight):
+    """Return the most vertex weight one part may hold."""
+    heaviest = max(vertex_weight) if vertex_weight else 0
+    return max(int(total_weight * imbalance / num_parts) + 1, heaviest)
+
+
+def bfs_partition(graph, num_parts, seed=None):
+    """
+    Split `graph` into `num_parts` parts of (nearly) equal size by growing
+    each part outward from a start vertex with BFS. Edge direction is
+    ignored. Fast, and parts are connected where the graph allows, but
+    nothing is done to reduce the cut afterwards.
+
+    Parameters:
+    graph (Graph): The graph to split.
+    num_parts (integer): The number of parts.
+    seed (integer): If given, start vertices are picked in a random order
+        from this seed; otherwise in vertex order.
+
+    Returns:
+    Partition: The parts.
+    """
+    _check_num_parts(num_parts)
+    csr = graph.get_adjacency()
+    links = _undirected_links(csr)
+    order = list(range(csr.num_vertices()))
+    if seed is not None:
+        random.Random(seed).shuffle(order)
+
+    assignment = _grow_regions(links, [1] * len(links), num_parts, order)
+    return Partition(graph, assignment, num_parts)
+
+
+def label_propagation_partition(graph, num_parts, imbalance=1.05, max_passes=20, seed=None):
+    """
+    Split `graph` into `num_parts` balanced parts with few cut edges.
+
+    Starts from BFS-grown regions, then runs balanced label propagation:
+    every vertex repeatedly moves to the part most of its neighbors are in,
+    unless that would push the part past its size limit.
+
+    Parameters:
+    graph (Graph): The graph to split.
+    num_parts (integer): The number of parts.
+    imbalance (float): How far above the average size a part may grow.
+    max_passes (integer): The most propagation passes over all vertices.
+    seed (integer): Seed for the random visiting order.
+
+    Returns:
+    Partition: The parts.
+    """
+    _check_num_parts(num_parts)
+    csr = graph.get_adjacency()
+    links = _undirected_links(csr)
+    vertex_weight = [1] * len(links)
+    rng = random.Random(seed)
+
+    assignment = _grow_regions(links, vertex_weight, num_parts, list(range(len(links))))
+    capacity = _capacity(len(links), num_parts, imbalance, vertex_weight)
+    _refine(links, vertex_weight, assignment, num_parts, capacity, max_passes, rng)
+    return Partition(graph, assignment, num_parts)
+
+
+def _coarsen(links, vertex_weight, rng):
+    """
+    Merge each vertex with the unmatched neighbor it shares the heaviest
+    link with (heavy-edge matching).
+
+    Returns:
+    tuple: (coarse links, coarse vertex weights, coarse row of each row)
+    """
+    num_vertices = len(links)
+    match = [-1] * num_vertices
+    order = list(range(num_vertices))
+    rng.shuffle(order)
+    for row in order:
+        if match[row] >= 0:
+            continue
+        best, best_weight = row, 0
+        for neighbor, count in links[row].items():
+            if match[neighbor] < 0 and count > best_weight:
+                best, best_weight = neighbor, count
+        match[row] = best
+        match[best] = row
+
+    coarse_of = [-1] * num_vertices
+    coarse_weight = []
+    for row in range(num_vertices):
+        if coarse_of[row] < 0:
+            coarse_of[row] = coarse_of[match[row]] = len(coarse_weight)
+            coarse_weight.append(vertex_weight[row] + (vertex_weight[match[row]] if match[row] != row else 0))
+
+    coarse_links = [{} for _ in coarse_weight]
+    for row in range(num_vertices):
+        coarse_row = coarse_of[row]
+        for neighbor, count in links[row].items():
+            coarse_neighbor = coarse_of[neighbor]
+            if coarse_neighbor != coarse_row:
+                coarse_links[coarse_row][coarse_neighbor] = coarse_links[coarse_row].get(coarse_neighbor, 0) + count
+    return coarse_links, coarse_weight, coarse_of
+
+
+def multilevel_partition(graph, num_parts, imbalance=1.05, max_passes=10, seed=None):
+    """
+    Split `graph` into `num_parts` balanced parts with few cut edges, in the
+    multilevel style of METIS.
+
+    The graph is repeatedly coarsened by merging heavily linked pairs of
+    vertices, the small coarsest graph is split with weighted BFS growing,
+    and the split is projected back level by level, with balanced label
+    propagation refining the boundary at every level.
+
+    Parameters:
+    graph (Graph): The graph to split.
+    num_parts (integer): The number of parts.
+    imbalance (float): How far above the average size a part may grow.
+    max_passes (integer): The most refinement passes per level.
+    seed (integer): Seed for the random matching and visiting orders.
+
+    Returns:
+    Partition: The parts.
+    """
+    _check_num_parts(num_parts)
+    csr = graph.get_adjacency()
+    rng = random.Random(seed)
+    num_vertices = csr.num_vertices()
+
+    levels = [(_undirected_links(csr), [1] * num_vertices, None)]
+    while len(levels[-1][0]) > 20 * num_parts:
+        links, vertex_weight, _ = levels[-1]
+        coarse_links, coarse_weight, coarse_of = _coarsen(links, vertex_weight, rng)
+        if len(coarse_weight) > 0.95 * len(links): # matching has stalled
+            break
+        levels.append((coarse_links, coarse_weight, coarse_of))
+
+    links, vertex_weight, _ = levels[-1]
+    capacity = _capacity(num_vertices, num_parts, imbalance, vertex_weight)
+    order = sorted(range(len(links)), key=lambda row: -vertex_weight[row])
+    assignment = _grow_regions(links, vertex_weight, num_parts, order)
+    _refine(links, vertex_weight, assignment, num_parts, capacity, max_passes, rng)
+
+    for level in range(len(levels) - 1, 0, -1):
+        coarse_of = levels[level][2]
+        links, vertex_weight, _ = levels[level - 1]
+        assignment = [assignment[coarse_of[row]] for row in range(len(links))]
+        _refine(links, vertex_weight, assignment, num_parts, capacity, max_passes, rng)
+
+    return Partition(graph, assignment, num_parts)
+
+
+def _shard_payloads(partition):
+    """
+    Cut the adjacency into one picklable payload per part:
+    (rows, indptr, indices) with `rows` the global rows of the part and
+    indptr/indices its internal edges in local rows. Also returns the cut
+    edges as {global row: [global rows in other parts]}.
+    """
+    csr, assignment = partition.adjacency, partition.assignment
+    rows = [[] for _ in range(partition.num_parts)]
+    local_of = [0] * csr.num_vertices()
+    for row, part in enumerate(assignment):
+        local_of[row] = len(rows[part])
+        rows[part].append(row)
+
+    payloads = []
+    cut_edges = {}
+    for part in range(partition.num_parts):
+        indptr, indices = [0], []
+        for row in rows[part]:
+            for neighbor in csr.neighbors(row):
+                if assignment[neighbor] == part:
+                    indices.append(local_of[neighbor])
+                else:
+                    cut_edges.setdefault(row, []).append(neighbor)
+            indptr.append(len(indices))
+        payloads.append((rows[part], indptr, indices))
+    return payloads, cut_edges
+
+
+def _components_shard(payloads, part):
+    """Pool task: label each row of a shard with the smallest row in its local component."""
+    rows, indptr, indices = payloads[part]
+    parent = list(range(len(rows)))
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for local in range(len(rows)):
+        for neighbor in indices[indptr[local]:indptr[local + 1]]:
+            root1, root2 = find(local), find(neighbor)
+            if root1 != root2:
+                parent[max(root1, root2)] = min(root1, root2)
+
+    # local rows are in global order, so the smallest local root is the smallest global row
+    return [rows[find(local)] for local in range(len(rows))]
+
+
+def sharded_connected_components(partition, processes=1):
+    """
+    Find connected components shard by shard, then stitch them together
+    across the cut edges. Gives the same result as
+    `partition.graph.get_connected_components()`.
+
+    Parameters:
+    partition (Partition): How to split the graph.
+    processes (integer): Number of worker processes. None means one per CPU.
+
+    Returns:
+    list<list<string>>: The connected components as lists of vertex ids.
+    """
+    payloads, cut_edges = _shard_payloads(partition)
+    num_vertices = partition.adjacency.num_vertices()
+
+    parts = range(partition.num_parts)
+    if processes == 1 or partition.num_parts < 2:
+        results = [_components_shard(payloads, part) for part in parts]
+    else:
+        with SharedPool(payloads, processes) as pool:
+            results = pool.map(_components_shard, parts)
+
+    label = list(range(num_vertices))
+    for payload, labels in zip(payloads, results):
+        for row, row_label in zip(payload[0], labels):
+            label[row] = row_label
+
+    # union-find over the local component labels, joined by the cut edges
+    parent = list(range(num_vertices))
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for row, neighbors in cut_edges.items():
+        for neighbor in neighbors:
+            root1, root2 = find(label[row]), find(label[neighbor])
+            if root1 != root2:
+                parent[max(root1, root2)] = min(root1, root2)
+
+    root_to_component = {}
+    connected_components = []
+    for row in range(num_vertices):
+        root = find(label[row])
+        if root not in root_to_component:
+            root_to_component[root] = []
+            connected_components.append(root_to_component[root])
+        root_to_component[root].append(partition.adjacency.vertex_ids[row])
+    return connected_components
+
+
+def _bfs_shard(payloads, task):
+    """
+    Pool task: multi-source BFS inside one shard. `task` is (part, known,
+    seeds): the depths the shard already has, and seeds that carry their
+    own starting depth, both as (local row, depth) pairs. Only rows whose
+    depth improves are returned.
+    """
+    part, known, seeds = task
+    rows, indptr, indices = payloads[part]
+    depth = dict(known)
+    infinity = float('inf')
+    improved = {}
+    heap = []
+    for local, seed_depth in seeds:
+        if seed_depth < depth.get(local, infinity):
+            depth[local] = improved[local] = seed_depth
+            heappush(heap, (seed_depth, local))
+
+    while heap:
+        current_depth, current = heappop(heap)
+        if current_depth > depth[current]:
+            continue
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if current_depth + 1 < depth.get(neighbor, infinity):
+                depth[neighbor] = improved[neighbor] = current_depth + 1
+                heappush(heap, (current_depth + 1, neighbor))
+
+    return [(local, local_depth) for local, local_depth in improved.items()]
+
+
+def sharded_bfs_distances(partition, start_id, processes=1):
+    """
+    Find the number of edges on the shortest path from `start_id` to every
+    reachable vertex, running BFS one shard at a time in supersteps.
+
+    In each superstep every shard with new seeds explores as far as it can
+    on its own; depths that cross a cut edge become the seeds of the next
+    superstep. The number of supersteps grows with how often shortest
+    paths cross between shards, which a good partition keeps small.
+
+    Parameters:
+    partition (Partition): How to split the graph.
+    start_id (string): The id of the start vertex.
+    processes (integer): Number of worker processes. None means one per CPU.
+
+    Returns:
+    dict<string, integer>: vertex id -> depth, for every reachable vertex.
+    """
+    csr = partition.adjacency
+    start = csr.get_index(start_id)
+    payloads, cut_edges = _shard_payloads(partition)
+    assignment = partition.assignment
+
+    local_of = {}
+    for rows, _, _ in payloads:
+        for local, row in enumerate(rows):
+            local_of[row] = local
+
+    infinity = float('inf')
+    depth = [infinity] * csr.num_vertices()
+    known = [{} for _ in range(partition.num_parts)] # part -> {local row: depth} of the rows reached so far
+    seeds = {assignment[start]: {start: 0}}
+
+    # the shards go to every worker once; a superstep only sends the seeds
+    # and the depths its shards have already reached
+    pool = None
+    if processes != 1 and partition.num_parts > 1:
+        pool = SharedPool(payloads, processes)
+    try:
+        while seeds:
+            parts = sorted(seeds)
+            tasks = [(part, list(known[part].items()),
+                      [(local_of[row], row_depth) for row, row_depth in seeds[part].items()])
+                     for part in parts]
+            results = pool.map(_bfs_shard, tasks) if pool else [_bfs_shard(payloads, task) for task in tasks]
+
+            seeds = {}
+            for part, updates in zip(parts, results):
+                rows = payloads[part][0]
+                known[part].update(updates)
+                for local, row_depth in updates:
+                    depth[rows[local]] = row_depth
+            for part, updates in zip(parts, results):
+                rows = payloads[part][0]
+                for local, row_depth in updates:
+                    for neighbor in cut_edges.get(rows[local], ()):
+                        if row_depth + 1 < depth[neighbor]:
+                            part_seeds = seeds.setdefault(assignment[neighbor], {})
+                            if row_depth + 1 < part_seeds.get(neighbor, infinity):
+                                part_seeds[neighbor] = row_depth + 1
+    finally:
+        if pool:
+            pool.close()
+
+    return {csr.vertex_ids[row]: row_depth
+            for row, row_depth in enumerate(depth) if row_depth != infinity}
@@ -0,0 +1,500 @@
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+
+from graphs._pool import SharedPool
+from graphs.csr import CSRAdjacency
+
+INFINITY = float('inf')
+
+
+class NegativeCycleError(ValueError):
+    """
+    Raised when a negative-weight cycle makes shortest paths undefined.
+    """
+
+    def __init__(self, cycle):
+        """
+        Parameters:
+        cycle (list<string>): Vertex ids around one negative cycle, in edge
+            order, with the first id repeated at the end.
+        """
+        super().__init__(f'Graph contains a negative-weight cycle: {cycle}')
+        self.cycle = cycle
+
+
+def _dijkstra(indptr, indices, weights, source, target=-1):
+    """
+    Heap-based Dijkstra over CSR arrays from row `source`. Stops early once
+    row `target` is settled.
+
+    Returns:
+    tuple: (distance, parent) lists indexed by row. Unreached rows have
+    distance INFINITY and parent -1.
+    """
+    num_vertices = len(indptr) - 1
+    distance = [INFINITY] * num_vertices
+    parent = [-1] * num_vertices
+    done = [False] * num_vertices
+    distance[source] = 0
+    heap = [(0, source)]
+
+    while heap:
+        current_distance, current = heappop(heap)
+        if done[current]:
+            continue
+        done[current] = True
+        if current == target:
+            break
+
+        for edge in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[edge]
+            new_distance = current_distance + weights[edge]
+            if new_distance < distance[neighbor]:
+                distance[neighbor] = new_distance
+                parent[neighbor] = current
+                heappush(heap, (new_distance, neighbor))
+
+    return distance, parent
+
+
+def _find_parent_cycle(parent, start):
+    """
+    Return a cycle of rows in the parent-pointer graph, checking the walk
+    from `start` first, or None if the parent pointers form a forest.
+    Any such cycle built by edge relaxation has negative total weight.
+    """
+    num_vertices = len(parent)
+    walk_number = [0] * num_vertices
+    for number, origin in enumerate([start] + list(range(num_vertices)), 1):
+        row = origin
+        while row >= 0 and walk_number[row] == 0:
+            walk_number[row] = number
+            row = parent[row]
+        if row >= 0 and walk_number[row] == number:
+            cycle = [row]
+            current = parent[row]
+            while current != row:
+                cycle.append(current)
+                current = parent[current]
+            cycle.append(row)
+            cycle.reverse()
+            return cycle
+    return None
+
+
+def _spfa(indptr, indices, weights, sources):
+    """
+    Bellman-Ford with the SPFA queue optimization: only vertices whose
+    distance just improved are rescanned, and the search ends as soon as
+    the queue empties, i.e. as soon as a pass would change nothing.
+
+    Parameters:
+    sources (list<integer>): Rows that start at distance 0.
+
+    Returns:
+    tuple: (distance, parent) lists indexed by row.
+
+    Raises:
+    NegativeCycleError: With the cycle as rows, if one is reachable from
+    the sources. The caller translates the rows into ids.
+    """
+    num_vertices = len(indptr) - 1
+    distance = [INFINITY] * num_vertices
+    parent = [-1] * num_vertices
+    # edges on the current best path; reaching V edges means a cycle
+    path_length = [0] * num_vertices
+    in_queue = bytearray(num_vertices)
+    queue = deque()
+    for source in sources:
+        distance[source] = 0
+        in_queue[source] = 1
+        queue.append(source)
+
+    while queue:
+        current = queue.popleft()
+        in_queue[current] = 0
+        current_distance = distance[current]
+
+        for edge in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[edge]
+            new_distance = current_distance + weights[edge]
+            if new_distance < distance[neighbor]:
+                distance[neighbor] = new_distance
+                parent[neighbor] = current
+                path_length[neighbor] = path_length[current] + 1
+                if path_length[neighbor] >= num_vertices:
+                    cycle = _find_parent_cycle(parent, neighbor)
+                    if cycle is not None:
+                        raise NegativeCycleError(cycle)
+                if not in_queue[neighbor]:
+                    in_queue[neighbor] = 1
+                    queue.append(neighbor)
+
+    return distance, parent
+
+
+def _run_spfa(csr, sources):
+    """Run `_spfa` on an adjacency, reporting any cycle by vertex id."""
+    try:
+        return _spfa(csr.indptr, csr.indices, csr.weights, sources)
+    except NegativeCycleError as error:
+        raise NegativeCycleError([csr.vertex_ids[row] for row in error.cycle]) from None
+
+
+def _johnson_potentials(csr):
+    """
+    Bellman-Ford from a virtual source with a 0-weight edge to every row.
+
+    Returns:
+    list<number>: A potential h per row such that w(u, v) + h[u] - h[v] >= 0.
+    """
+    potential, _ = _run_spfa(csr, range(csr.num_vertices()))
+    return potential
+
+
+def _reweight(csr, potential):
+    """
+    Return Johnson's reweighted edge weights w(u, v) + h[u] - h[v], which
+    are all non-negative and keep every u-v path in the same order.
+    """
+    reweighted = [0] * csr.num_edges()
+    for row in range(csr.num_vertices()):
+        for edge in range(csr.indptr[row], csr.indptr[row + 1]):
+            # clamp float round-off; the true reweighted value is never negative
+            reweighted[edge] = max(0, csr.weights[edge] + potential[row] - potential[csr.indices[edge]])
+    return reweighted
+
+
+def bellman_ford_distances(graph, start_id):
+    """
+    Return the shortest path length from `start_id` to every vertex it can
+    reach. Unlike Dijkstra, negative edge weights are allowed.
+
+    Parameters:
+    graph (Graph): The graph to search. Unweighted edges have length 1.
+    start_id (string): The id of the start vertex.
+
+    Returns:
+    dict<string, number>: vertex id -> distance, for reachable vertices.
+
+    Raises:
+    NegativeCycleError: If a negative cycle is reachable from the start.
+    """
+    if not graph.contains_id(start_id):
+        raise KeyError("One or both vertices are not in the graph!")
+
+    csr = graph.get_adjacency()
+    distance, _ = _run_spfa(csr, [csr.get_index(start_id)])
+    return {csr.vertex_ids[row]: distance[row]
+            for row in range(len(distance)) if distance[row] != INFINITY}
+
+
+def bellman_ford_path(graph, start_id, target_id):
+    """
+    Return the shortest path from `start_id` to `target_id`, allowing
+    negative edge weights.
+
+    Returns:
+    tuple: (distance, path) where path is the list of vertex ids from start
+    to target, or (inf, None) if the target can't be reached.
+
+    Raises:
+    NegativeCycleError: If a negative cycle is reachable from the start.
+    """
+    if not graph.contains_id(start_id) or not graph.contains_id(target_id):
+        raise KeyError("One or both vertices are not in the graph!")
+
+    csr = graph.get_adjacency()
+    start, target = csr.get_index(start_id), csr.get_index(target_id)
+    distance, parent = _run_spfa(csr, [start])
+    if distance[target] == INFINITY:
+        return INFINITY, None
+
+    path = [target]
+    while path[-1] != start:
+        path.append(parent[path[-1]])
+    return distance[target], [csr.vertex_ids[row] for row in reversed(path)]
+
+
+def find_negative_cycle(graph):
+    """
+    Return the vertex ids around a negative-weight cycle (first id repeated
+    at the end), or None if the graph has no negative cycle.
+    """
+    try:
+        _johnson_potentials(graph.get_adjacency())
+    except NegativeCycleError as error:
+        return error.cycle
+    return None
+
+
+def _johnson_source(adjacency, source):
+    """Dijkstra on reweighted edges from `source`, then undo the reweighting."""
+    indptr, indices, weights, potential = adjacency
+    distance, _ = _dijkstra(indptr, indices, weights, source)
+    targets = [row for row in range(len(distance)) if distance[row] != INFINITY]
+    return source, targets, [distance[row] - potential[source] + potential[row] for row in targets]
+
+
+def johnson_all_pairs(graph, processes=1, chunksize=16):
+    """
+    Use Johnson's Algorithm to find all-pairs shortest path lengths on a
+    sparse graph that may have negative edge weights (but no negative cycles).
+
+    Bellman-Ford computes vertex potentials that make every edge weight
+    non-negative, then one heap-based Dijkstra runs per source. With more
+    than one process the per-source runs are spread across a process pool.
+    Results are yielded one source at a time, so no V x V matrix is built.
+
+    Parameters:
+    graph (Graph): The graph to search. Unweighted edges have length 1.
+    processes (integer): Number of worker processes. None means one per CPU.
+    chunksize (integer): Sources handed to a worker at a time.
+
+    Returns:
+    generator: Yields (source_id, {target_id: distance}) for every vertex,
+    in get_vertices() order. Only reachable targets are included.
+
+    Raises:
+    NegativeCycleError: If the graph contains a negative-weight cycle.
+    """
+    csr = graph.get_adjacency()
+    num_vertices = csr.num_vertices()
+    potential = _johnson_potentials(csr)
+    adjacency = (csr.indptr, csr.indices, _reweight(csr, potential), potential)
+
+    vertex_ids = csr.vertex_ids
+    if processes == 1:
+        results = (_johnson_source(adjacency, source) for source in range(num_vertices))
+        for source, targets, distances in results:
+            yield vertex_ids[source], {vertex_ids[row]: dist for row, dist in zip(targets, distances)}
+        return
+
+    with SharedPool(adjacency, processes) as pool:
+        results = pool.imap(_johnson_source, range(num_vertices), chunksize)
+        for source, targets, distances in results:
+            yield vertex_ids[source], {vertex_ids[row]: dist for row, dist in zip(targets, distances)}
+
+
+def _path_weight(csr, path):
+    """Return the total original weight of a path given as rows."""
+    total = 0
+    for current, following in zip(path, path[1:]):
+        for edge in range(csr.indptr[current], csr.indptr[current + 1]):
+            if csr.indices[edge] == following:
+                total += csr.weights[edge]
+                break
+    return total
+
+
+def _spur_path(indptr, indices, weights, to_target, next_hop, spur, target, blocked, banned):
+    """
+    Shortest path of rows from `spur` to `target` that avoids the `blocked`
+    rows and doesn't leave `spur` towards a row in `banned`, as a
+    (length, path) tuple, or None.
+
+    `to_target` and `next_hop` are the shortest-path tree into the target
+    over the whole graph, computed once and reused by every spur search:
+    if the tree path from `spur` avoids everything removed it is the answer
+    outright, and otherwise its distances are an exact lower bound that
+    steers an A* search straight at the target.
+    """
+    if to_target[spur] == INFINITY:
+        return None
+
+    if next_hop[spur] not in banned:
+        path = [spur]
+        row = next_hop[spur]
+        while not blocked[row]:
+            path.append(row)
+            if row == target:
+                return to_target[spur], path
+            row = next_hop[row]
+
+    # A* over the remaining graph; dicts keep the cost proportional to the
+    # part of the graph explored rather than to V
+    cost = {spur: 0}
+    parent = {spur: -1}
+    done = set()
+    heap = [(to_target[spur], 0, spur)]
+    while heap:
+        _, current_cost, current = heappop(heap)
+        if current in done:
+            continue
+        if current == target:
+            path = [current]
+            while parent[path[-1]] >= 0:
+                path.append(parent[path[-1]])
+            path.reverse()
+            return current_cost, path
+        done.add(current)
+
+        for edge in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[edge]
+            if blocked[neighbor] or to_target[neighbor] == INFINITY:
+                continue
+            if current == spur and neighbor in banned:
+                continue
+            new_cost = current_cost + weights[edge]
+            if new_cost < cost.get(neighbor, INFINITY):
+                cost[neighbor] = new_cost
+                parent[neighbor] = current
+                heappush(heap, (new_cost + to_target[neighbor], new_cost, neighbor))
+    return None
+
+
+def _yen(csr, start, target, k):
+    """Generator behind `k_shortest_paths`, working on rows."""
+    weights = csr.weights
+    potential = None
+    if csr.has_negative_weights():
+        # Dijkstra-based spur searches need non-negative weights; Johnson's
+        # reweighting shifts every start-target path by the same amount
+        potential = _johnson_potentials(csr)
+        weights = _reweight(csr, potential)
+    indptr, indices = csr.indptr, csr.indices
+
+    # one reverse search gives the tree into the target that every spur reuses
+    reverse = CSRAdjacency(csr.id_table, indptr, indices,
+                           array(csr.weights.typecode, weights), csr.is_directed).transpose()
+    to_target, next_hop = _dijkstra(reverse.indptr, reverse.indices, reverse.weights, target)
+    if to_target[start] == INFINITY:
+        return
+
+    first = [start]
+    while first[-1] != target:
+        first.append(next_hop[first[-1]])
+
+    accepted = [] # rows of every path yielded so far
+    candidates = [] # heap of (distance, tie breaker, deviation, path)
+    seen = {tuple(first)}
+    heappush(candidates, (_path_weight(csr, first), 0, 0, first))
+    blocked = bytearray(csr.num_vertices())
+
+    while candidates and (k is None or len(accepted) < k):
+        distance, _, deviation, path = heappop(candidates)
+        accepted.append(path)
+        yield distance, path
+
+        # original length of every prefix of the path
+        root_distance = [0]
+        for current, following in zip(path, path[1:]):
+            root_distance.append(root_distance[-1] + _path_weight(csr, [current, following]))
+
+        # Lawler's refinement: spurs before the deviation point repeat
+        # searches an earlier path already made, so start from there
+        for index in range(deviation, len(path) - 1):
+            spur = path[index]
+            root = path[:index + 1]
+            banned = {other[index + 1] for other in accepted
+                      if len(other) > index + 1 and other[:index + 1] == root}
+            for row in root[:-1]:
+                blocked[row] = 1
+            found = _spur_path(indptr, indices, weights, to_target, next_hop,
+                               spur, target, blocked, banned)
+            for row in root[:-1]:
+                blocked[row] = 0
+
+            if found is not None:
+                spur_distance, spur_path = found
+                if potential is not None:
+                    spur_distance += potential[target] - potential[spur]
+                candidate = root[:-1] + spur_path
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heappush(candidates, (root_distance[index] + spur_distance,
+                                          len(seen), index, candidate))
+
+
+def k_shortest_paths(graph, start_id, target_id, k=None):
+    """
+    Lazily enumerate loopless paths from `start_id` to `target_id` in order
+    of increasing length, using Yen's Algorithm. Each path is only searched
+    for when the caller asks for it.
+
+    Parameters:
+    graph (Graph): The graph to search. Unweighted edges have length 1.
+    start_id (string): The id of the start vertex.
+    target_id (string): The id of the target vertex.
+    k (integer): The most paths to produce. None means all of them.
+
+    Returns:
+    generator: Yields (distance, path) with path a list of vertex ids.
+
+    Raises:
+    NegativeCycleError: If the graph contains a negative-weight cycle.
+    """
+    if not graph.contains_id(start_id) or not graph.contains_id(target_id):
+        raise KeyError("One or both vertices are not in the graph!")
+
+    csr = graph.get_adjacency()
+    start, target = csr.get_index(start_id), csr.get_index(target_id)
+    return ((distance, [csr.vertex_ids[row] for row in path])
+            for distance, path in _yen(csr, start, target, k))
+
+
+def _equal_paths(csr, distance, start, target):
+    """Generator behind `all_shortest_paths`, yielding rows from start to target."""
+    reverse = csr.transpose()
+
+    def tight_predecessors(row):
+        for edge in range(reverse.indptr[row], reverse.indptr[row + 1]):
+            previous = reverse.indices[edge]
+            if distance[previous] + reverse.weights[edge] == distance[row]:
+                yield previous
+
+    if distance[target] == INFINITY:
+        return
+    if start == target:
+        yield [start]
+        return
+
+    # walk the tight edges backwards from the target, one path at a time
+    path = [target]
+    on_path = {target}
+    stack = [tight_predecessors(target)]
+    while stack:
+        previous = next(stack[-1], None)
+        if previous is None:
+            stack.pop()
+            on_path.discard(path.pop())
+        elif previous == start:
+            yield [start] + path[::-1]
+        elif previous not in on_path: # zero-weight cycles
+            path.append(previous)
+            on_path.add(previous)
+            stack.append(tight_predecessors(previous))
+
+
+def all_shortest_paths(graph, start_id, target_id):
+    """
+    Lazily enumerate every shortest path from `start_id` to `target_id`,
+    i.e. every path whose length ties the minimum.
+
+    One shortest-path search labels every vertex with its distance; paths
+    are then walked back from the target one at a time over the edges
+    that lie on some shortest path.
+
+    Parameters:
+    graph (Graph): The graph to search. Unweighted edges have length 1.
+    start_id (string): The id of the start vertex.
+    target_id (string): The id of the target vertex.
+
+    Returns:
+    generator: Yields each path as a list of vertex ids.
+
+    Raises:
+    NegativeCycleError: If a negative cycle is reachable from the start.
+    """
+    if not graph.contains_id(start_id) or not graph.contains_id(target_id):
+        raise KeyError("One or both vertices are not in the graph!")
+
+    csr = graph.get_adjacency()
+    start, target = csr.get_index(start_id), csr.get_index(target_id)
+    if csr.has_negative_weights():
+        distance, _ = _run_spfa(csr, [start])
+    else:
+        distance, _ = _dijkstra(csr.indptr, csr.indices, csr.weights, start)
+    return ([csr.vertex_ids[row] for row in path]
+            for path in _equal_paths(csr, distance, start, target))
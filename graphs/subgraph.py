@@ -0,0 +1,342 @@
+from graphs.csr import CSRAdjacency
+from graphs.graph import Graph
+from graphs.interning import VertexIdTable
+from graphs.weighted_graph import WeightedGraph
+
+
+class VertexView(object):
+    """
+    Read-only stand-in for a vertex of the underlying graph, whose neighbors
+    are filtered by the subgraph view that owns it.
+    """
+
+    def __init__(self, view, vertex_obj):
+        """
+        Initialize a vertex view.
+
+        Parameters:
+        view (SubgraphView): The view this vertex belongs to.
+        vertex_obj (Vertex): The vertex of the underlying graph.
+        """
+        self.__view = view
+        self.__vertex = vertex_obj
+
+    def get_id(self):
+        """Return the id of this vertex."""
+        return self.__vertex.get_id()
+
+    def get_neighbors(self):
+        """Return the neighbors of this vertex that are inside the view."""
+        if self.__view.is_weighted():
+            return [neighbor for (neighbor, weight) in self.get_neighbors_with_weights()]
+
+        vertex_id = self.get_id()
+        return [
+            self.__view.wrap_vertex(neighbor)
+            for neighbor in self.__vertex.get_neighbors()
+            if self.__view.keeps_edge(vertex_id, neighbor.get_id())
+        ]
+
+    def has_neighbor(self, vertex_id):
+        """Return True if the edge to the vertex with the given id is in the view."""
+        if not self.__vertex.has_neighbor(vertex_id):
+            return False
+        if self.__view.is_weighted():
+            return self.__view.keeps_edge(self.get_id(), vertex_id, self.__vertex.get_weight(vertex_id))
+        return self.__view.keeps_edge(self.get_id(), vertex_id)
+
+    def get_weight(self, vertex_id):
+        """Return the weight of the edge to the vertex with the given id."""
+        if not self.has_neighbor(vertex_id):
+            raise KeyError("Edge is not in the graph!")
+        return self.__vertex.get_weight(vertex_id)
+
+    def get_neighbors_with_weights(self):
+        """Return (neighbor, weight) tuples for the edges inside the view."""
+        vertex_id = self.get_id()
+        return [
+            (self.__view.wrap_vertex(neighbor), weight)
+            for (neighbor, weight) in self.__vertex.get_neighbors_with_weights()
+            if self.__view.keeps_edge(vertex_id, neighbor.get_id(), weight)
+        ]
+
+    def __str__(self):
+        """Output the list of neighbors of this vertex."""
+        neighbor_ids = [neighbor.get_id() for neighbor in self.get_neighbors()]
+        return f'{self.get_id()} adjacent to {neighbor_ids}'
+
+    def __repr__(self):
+        """Output the list of neighbors of this vertex."""
+        return self.__str__()
+
+
+class SubgraphView(Graph):
+    """ SubgraphView Class
+    A read-only view over part of a graph. Vertices and edges are filtered
+    on the fly, so nothing is copied, and every traversal defined on Graph
+    can be run on the view directly.
+
+    Traversals that need flat arrays share one cached id table and
+    adjacency until the underlying graph changes. The filters must give the
+    same answer each time they are called; call `refresh()` after changing
+    anything they depend on.
+    """
+
+    def __init__(self, graph, vertex_ids=None, vertex_filter=None, edge_filter=None):
+        """
+        Initialize a view over `graph`.
+
+        Parameters:
+        graph (Graph): The underlying graph (or another view).
+        vertex_ids (iterable<string>): If given, only these vertices are kept.
+        vertex_filter (function): If given, only vertices whose id makes
+            `vertex_filter(vertex_id)` true are kept.
+        edge_filter (function): If given, only edges for which
+            `edge_filter(from_id, to_id)` is true are kept. On weighted
+            graphs it is called as `edge_filter(from_id, to_id, weight)`.
+        """
+        self.__graph = graph
+        self.__vertex_filter = vertex_filter
+        self.__edge_filter = edge_filter
+        self.__vertex_views = {} # id -> VertexView, created on first use
+        self.__id_table = None # (version of the underlying graph, VertexIdTable)
+        self.__adjacency = None # (version of the underlying graph, CSRAdjacency)
+
+        self.__vertex_ids = None
+        if vertex_ids is not None:
+            self.__vertex_ids = {vertex_id: True for vertex_id in vertex_ids}
+
+    def get_graph(self):
+        """Return the graph this view is defined over."""
+        return self.__graph
+
+    @property
+    def is_directed(self):
+        """Return True if edges go in only one direction."""
+        return self.__graph.is_directed
+
+    def is_weighted(self):
+        """Return True if the underlying graph stores edge weights."""
+        return isinstance(self.__graph, WeightedGraph)
+
+    def contains_id(self, vertex_id):
+        """Return True if the vertex is in the underlying graph and in the view."""
+        if self.__vertex_ids is not None and vertex_id not in self.__vertex_ids:
+            return False
+        if self.__vertex_filter is not None and not self.__vertex_filter(vertex_id):
+            return False
+        return self.__graph.contains_id(vertex_id)
+
+    def keeps_edge(self, from_id, to_id, weight=None):
+        """Return True if the edge from `from_id` to `to_id` is in the view."""
+        if not self.contains_id(to_id):
+            return False
+        if self.__edge_filter is None:
+            return True
+        if self.is_weighted():
+            return self.__edge_filter(from_id, to_id, weight)
+        return self.__edge_filter(from_id, to_id)
+
+    def wrap_vertex(self, vertex_obj):
+        """Return the (cached) VertexView for a vertex of the underlying graph."""
+        vertex_id = vertex_obj.get_id()
+        if vertex_id not in self.__vertex_views:
+            self.__vertex_views[vertex_id] = VertexView(self, vertex_obj)
+        return self.__vertex_views[vertex_id]
+
+    def get_vertex(self, vertex_id):
+        """Return the vertex view if the vertex is in the view."""
+        if not self.contains_id(vertex_id):
+            return None
+        return self.wrap_vertex(self.__graph.get_vertex(vertex_id))
+
+    def get_vertices(self):
+        """
+        Return all vertices in the view.
+
+        Returns:
+        List<VertexView>: The vertices that pass the view's filters.
+        """
+        if self.__vertex_ids is not None:
+            return [
+                self.get_vertex(vertex_id)
+                for vertex_id in self.__vertex_ids
+                if self.contains_id(vertex_id)
+            ]
+
+        return [
+            self.wrap_vertex(vertex_obj)
+            for vertex_obj in self.__graph.get_vertices()
+            if self.contains_id(vertex_obj.get_id())
+        ]
+
+    def get_version(self):
+        """Return the version of the underlying graph."""
+        return self.__graph.get_version()
+
+    def refresh(self):
+        """Drop the cached id table and adjacency, e.g. after a filter's inputs change."""
+        self.__id_table = None
+        self.__adjacency = None
+
+    def get_id_table(self):
+        """
+        Return a table numbering the vertices in the view. It is cached
+        until the underlying graph changes.
+        """
+        version = self.get_version()
+        if self.__id_table is None or self.__id_table[0] != version:
+            self.__id_table = (version, VertexIdTable(vertex.get_id() for vertex in self.get_vertices()))
+        return self.__id_table[1]
+
+    def get_adjacency(self):
+        """
+        Return a CSRAdjacency of the view, indexed by the id table. It is
+        cached until the underlying graph changes.
+        """
+        version = self.get_version()
+        if self.__adjacency is None or self.__adjacency[0] != version:
+            self.__adjacency = (version, CSRAdjacency.from_graph(self))
+        return self.__adjacency[1]
+
+    def has_in_edge_index(self):
+        """Return True if the underlying graph indexes incoming edges."""
+        return self.__graph.has_in_edge_index()
+
+    def enable_in_edge_index(self):
+        """Views are read-only; enable the index on the underlying graph."""
+        raise TypeError('Cannot index a read-only subgraph view')
+
+    def get_in_neighbors_with_weights(self, vertex_id):
+        """Return (predecessor, weight) tuples for the edges inside the view."""
+        if not self.contains_id(vertex_id):
+            raise KeyError("Vertex is not in the graph!")
+        return [
+            (self.wrap_vertex(vertex_obj), weight)
+            for (vertex_obj, weight) in self.__graph.get_in_neighbors_with_weights(vertex_id)
+            if self.contains_id(vertex_obj.get_id())
+            and self.keeps_edge(vertex_obj.get_id(), vertex_id, weight)
+        ]
+
+    def get_in_neighbors(self, vertex_id):
+        """Return the predecessors of the given vertex that are inside the view."""
+        if self.is_weighted():
+            return [vertex for (vertex, weight) in self.get_in_neighbors_with_weights(vertex_id)]
+
+        if not self.contains_id(vertex_id):
+            raise KeyError("Vertex is not in the graph!")
+        return [
+            self.wrap_vertex(vertex_obj)
+            for vertex_obj in self.__graph.get_in_neighbors(vertex_id)
+            if self.contains_id(vertex_obj.get_id())
+            and self.keeps_edge(vertex_obj.get_id(), vertex_id)
+        ]
+
+    def add_vertex(self, vertex_id):
+        """Views are read-only."""
+        raise TypeError('Cannot add a vertex to a read-only subgraph view')
+
+    def add_edge(self, vertex_id1, vertex_id2, weight=None):
+        """Views are read-only."""
+        raise TypeError('Cannot add an edge to a read-only subgraph view')
+
+    def set_weight(self, vertex_id1, vertex_id2, weight):
+        """Views are read-only."""
+        raise TypeError('Cannot change an edge of a read-only subgraph view')
+
+    def track_shortest_paths(self, source_id):
+        """A view never changes on its own; materialize() it to track paths."""
+        raise TypeError('Cannot track shortest paths on a read-only subgraph view')
+
+    def memory_usage(self):
+        """A view holds no vertices or edges of its own; measure the underlying graph."""
+        raise TypeError('Cannot measure a subgraph view; call memory_usage() on its graph')
+
+    def materialize(self):
+        """Return a standalone copy of the vertices and edges in this view."""
+        return induced_subgraph(self, [vertex.get_id() for vertex in self.get_vertices()])
+
+    def __str__(self):
+        """Return a string representation of the view."""
+        return f'SubgraphView with vertices: {self.get_vertices()}'
+
+
+class WeightedSubgraphView(SubgraphView, WeightedGraph):
+    """ WeightedSubgraphView Class
+    A read-only view over part of a weighted graph, on which every
+    WeightedGraph algorithm can be run directly.
+    """
+
+    @property
+    def duplicate_edges(self):
+        """Return the duplicate edge policy of the underlying graph."""
+        return self.get_graph().duplicate_edges
+
+    def __iter__(self):
+        """Iterate over the vertex views."""
+        return iter(self.get_vertices())
+
+
+def subgraph_view(graph, vertex_ids=None, vertex_filter=None, edge_filter=None):
+    """
+    Return a read-only view over part of `graph` without copying it.
+
+    Parameters:
+    graph (Graph): The graph (weighted or not) to take a view of.
+    vertex_ids (iterable<string>): If given, only these vertices are kept.
+    vertex_filter (function): Keeps vertices for which `vertex_filter(id)` is true.
+    edge_filter (function): Keeps edges for which `edge_filter(from_id, to_id)`
+        (or `edge_filter(from_id, to_id, weight)` on weighted graphs) is true.
+
+    Returns:
+    SubgraphView: A WeightedSubgraphView for weighted graphs, else a SubgraphView.
+    """
+    if isinstance(graph, WeightedGraph):
+        return WeightedSubgraphView(graph, vertex_ids, vertex_filter, edge_filter)
+    return SubgraphView(graph, vertex_ids, vertex_filter, edge_filter)
+
+
+def induced_subgraph(graph, vertex_ids):
+    """
+    Copy the subgraph induced by `vertex_ids` into a new graph.
+
+    Adjacency entries are copied straight between vertex objects, so each
+    edge is visited once and no id lookups go through `add_edge`.
+
+    Parameters:
+    graph (Graph): The graph (or view) to copy from.
+    vertex_ids (iterable<string>): The ids of the vertices to keep. Ids that
+        are not in the graph are ignored.
+
+    Returns:
+    Graph: A new Graph or WeightedGraph with the kept vertices and every edge
+    between them. It keeps the source's `duplicate_edges` policy and, if the
+    source has one, its in-edge index.
+    """
+    is_weighted = isinstance(graph, WeightedGraph)
+    if is_weighted:
+        subgraph = WeightedGraph(is_directed=graph.is_directed, duplicate_edges=graph.duplicate_edges)
+    else:
+        subgraph = Graph(is_directed=graph.is_directed)
+
+    # id -> (vertex in the source graph, vertex in the copy)
+    kept = {}
+    for vertex_id in vertex_ids:
+        if vertex_id in kept or not graph.contains_id(vertex_id):
+            continue
+        subgraph.add_vertex(vertex_id)
+        kept[vertex_id] = (graph.get_vertex(vertex_id), subgraph.get_vertex(vertex_id))
+
+    for (vertex_obj, new_vertex_obj) in kept.values():
+        if is_weighted:
+            for neighbor, weight in vertex_obj.get_neighbors_with_weights():
+                if neighbor.get_id() in kept:
+                    new_vertex_obj.add_neighbor(kept[neighbor.get_id()][1], weight)
+        else:
+            for neighbor in vertex_obj.get_neighbors():
+                if neighbor.get_id() in kept:
+                    new_vertex_obj.add_neighbor(kept[neighbor.get_id()][1])
+
+    if graph.has_in_edge_index():
+        subgraph.enable_in_edge_index()
+    return subgraph
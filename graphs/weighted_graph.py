@@ -1,28 +1,65 @@
-from graphs.graph import Graph, Vertex
+from heapq import heappush, heappop
+import sys
+
+from graphs.csr import CSRAdjacency
+from graphs.dynamic_shortest_paths import ShortestPathTree
+from graphs.graph import Graph, Vertex, _memory_report
+from graphs.integer_shortest_paths import _run_engine
+from graphs.interning import VertexIdTable
+from graphs.shortest_paths import NegativeCycleError, find_negative_cycle, bellman_ford_path
 
 class WeightedVertex(Vertex):
     
-    def __init__(self, vertex_id):
+    def __init__(self, vertex_id, graph=None):
         """
         Initialize a vertex and its neighbors dictionary.
         
         Parameters:
         vertex_id (string): A unique identifier to identify this vertex.
+        graph (WeightedGraph): The graph the vertex belongs to, told about
+            every change so its cached adjacency is rebuilt.
         """
         self.id = vertex_id
         self.neighbors_dict = {} # id -> (obj, weight)
+        self.graph = graph
 
-    def add_neighbor(self, vertex_obj, weight):
+    def add_neighbor(self, vertex_obj, weight, duplicate_edges='first'):
         """
         Add a neighbor by storing it in the neighbors dictionary.
         Parameters:
         vertex_obj (Vertex): An instance of Vertex to be stored as a neighbor.
         weight (number): The weight of this edge.
+        duplicate_edges (string): What to keep if it's already a neighbor:
+            the 'first' weight, the 'last' weight, or the 'min' weight.
         """
-        if vertex_obj.get_id() in self.neighbors_dict.keys():
-            return # it's already a neighbor
+        existing = self.neighbors_dict.get(vertex_obj.get_id())
+        if existing is not None:
+            if duplicate_edges == 'first':
+                return # it's already a neighbor
+            if duplicate_edges == 'min' and existing[1] <= weight:
+                return
 
         self.neighbors_dict[vertex_obj.get_id()] = (vertex_obj, weight)
+        if self.graph is not None:
+            self.graph.mark_changed()
+
+    def has_neighbor(self, vertex_id):
+        """Return True if there is an edge to the vertex with the given id."""
+        return vertex_id in self.neighbors_dict
+
+    def get_weight(self, vertex_id):
+        """Return the weight of the edge to the vertex with the given id."""
+        if vertex_id not in self.neighbors_dict:
+            raise KeyError("Edge is not in the graph!")
+        return self.neighbors_dict[vertex_id][1]
+
+    def set_weight(self, vertex_id, weight):
+        """Change the weight of the existing edge to the vertex with the given id."""
+        if vertex_id not in self.neighbors_dict:
+            raise KeyError("Edge is not in the graph!")
+        self.neighbors_dict[vertex_id] = (self.neighbors_dict[vertex_id][0], weight)
+        if self.graph is not None:
+            self.graph.mark_changed()
 
     def get_neighbors(self):
         """Return the neighbors of this vertex."""
@@ -36,6 +73,23 @@ class WeightedVertex(Vertex):
         """Return the id of this vertex."""
         return self.id
 
+    def memory_usage(self):
+        """
+        Return the bytes held by this vertex, by component (see
+        `Graph.memory_usage`). Weights count towards the tuples unless
+        they are small ints, which Python shares.
+        """
+        weight_tuples = 0
+        for entry in self.neighbors_dict.values():
+            weight_tuples += sys.getsizeof(entry)
+            if not (type(entry[1]) is int and -5 <= entry[1] <= 256):
+                weight_tuples += sys.getsizeof(entry[1])
+        return {
+            'vertex_objects': sys.getsizeof(self),
+            'neighbor_dicts': sys.getsizeof(self.neighbors_dict),
+            'weight_tuples': weight_tuples,
+        }
+
     def __str__(self):
         """Output the list of neighbors of this vertex."""
         neighbor_ids = [neighbor.get_id() for neighbor in self.get_neighbors()]
@@ -50,15 +104,32 @@ class WeightedVertex(Vertex):
 class WeightedGraph(Graph):
 
     INFINITY = float('inf')
+    DUPLICATE_EDGES = ('first', 'last', 'min')
 
-    def __init__(self, is_directed=True):
+    def __init__(self, is_directed=True, track_in_edges=False, duplicate_edges='first'):
         """
         Initialize a graph object with an empty vertex dictionary.
         Parameters:
         is_directed (boolean): Whether the graph is directed (edges go in only one direction).
+        track_in_edges (boolean): Whether to keep an index of incoming edges.
+        duplicate_edges (string): What `add_edge` does when the edge is already
+            there: keep the 'first' weight (the default), overwrite it with the
+            'last' weight, or keep the 'min' weight seen for the pair.
         """
+        if duplicate_edges not in self.DUPLICATE_EDGES:
+            raise ValueError(f'duplicate_edges must be one of {self.DUPLICATE_EDGES}')
         self.vertex_dict = {}
         self.is_directed = is_directed
+        self.duplicate_edges = duplicate_edges
+        self.in_neighbors_dict = {} if track_in_edges else None # id -> {id -> (obj, weight)}
+        self.id_table = VertexIdTable() # id <-> dense int, shared by all algorithms
+        self.version = 0 # bumped on every change, so cached adjacency can be rebuilt
+        self.adjacency = None # (version, CSRAdjacency)
+        self.shortest_path_trees = {} # source id -> ShortestPathTree kept current by add_edge
+
+    def is_weighted(self):
+        """Return True if edges carry weights."""
+        return True
 
     def add_vertex(self, vertex_id):
         """
@@ -71,8 +142,12 @@ class WeightedGraph(Graph):
         """
         if vertex_id in self.vertex_dict.keys():
             return False # it's already there
-        vertex_obj = WeightedVertex(vertex_id)
+        vertex_obj = WeightedVertex(vertex_id, self)
         self.vertex_dict[vertex_id] = vertex_obj
+        self.id_table.intern(vertex_id)
+        self.version += 1
+        if self.in_neighbors_dict is not None:
+            self.in_neighbors_dict[vertex_id] = {}
         return True
 
     def get_vertex(self, vertex_id):
@@ -95,18 +170,200 @@ class WeightedGraph(Graph):
             return False
         vertex_obj1 = self.get_vertex(vertex_id1)
         vertex_obj2 = self.get_vertex(vertex_id2)
-        vertex_obj1.add_neighbor(vertex_obj2, weight)
+        if self.shortest_path_trees:
+            old_weights = (vertex_obj1.neighbors_dict.get(vertex_id2, (None, None))[1],
+                           vertex_obj2.neighbors_dict.get(vertex_id1, (None, None))[1])
+        vertex_obj1.add_neighbor(vertex_obj2, weight, self.duplicate_edges)
         if not self.is_directed:
-            vertex_obj2.add_neighbor(vertex_obj1, weight)
+            vertex_obj2.add_neighbor(vertex_obj1, weight, self.duplicate_edges)
+        self.version += 1
+
+        if self.shortest_path_trees:
+            self.__report_edge(vertex_id1, vertex_id2, old_weights[0])
+            if not self.is_directed:
+                self.__report_edge(vertex_id2, vertex_id1, old_weights[1])
+
+        if self.in_neighbors_dict is not None:
+            # mirror whatever the out-adjacency kept for this pair
+            self.in_neighbors_dict[vertex_id2][vertex_id1] = (
+                vertex_obj1, vertex_obj1.get_weight(vertex_id2))
+            if not self.is_directed:
+                self.in_neighbors_dict[vertex_id1][vertex_id2] = (
+                    vertex_obj2, vertex_obj2.get_weight(vertex_id1))
+
+    def __report_edge(self, vertex_id1, vertex_id2, old_weight):
+        """Tell every tracked tree what `add_edge` did to one direction of an edge."""
+        new_weight = self.vertex_dict[vertex_id1].get_weight(vertex_id2)
+        if new_weight != old_weight:
+            for tree in self.shortest_path_trees.values():
+                tree.edge_changed(vertex_id1, vertex_id2, old_weight, new_weight)
+
+    def track_shortest_paths(self, source_id):
+        """
+        Start maintaining a shortest-path tree from `source_id`. Every later
+        `add_edge` or `set_weight` updates it locally, so distances from a
+        hub stay answerable in O(1) as edges stream in.
+
+        Returns:
+        ShortestPathTree: The tree, with `get_distance` and `get_path`.
+        Tracking the same source again returns the existing tree.
+        """
+        if source_id not in self.shortest_path_trees:
+            self.shortest_path_trees[source_id] = ShortestPathTree(self, source_id)
+        return self.shortest_path_trees[source_id]
+
+    def untrack_shortest_paths(self, source_id):
+        """Stop maintaining the shortest-path tree from `source_id`."""
+        self.shortest_path_trees.pop(source_id, None)
+
+    def get_weight(self, vertex_id1, vertex_id2):
+        """
+        Return the weight of the edge from `vertex_id1` to `vertex_id2` in O(1).
+
+        Raises:
+        KeyError: If either vertex or the edge is not in the graph.
+        """
+        vertex_obj1 = self.get_vertex(vertex_id1)
+        if vertex_obj1 is None or not self.contains_id(vertex_id2):
+            raise KeyError("One or both vertices are not in the graph!")
+        return vertex_obj1.get_weight(vertex_id2)
+
+    def set_weight(self, vertex_id1, vertex_id2, weight):
+        """
+        Change the weight of the existing edge from `vertex_id1` to
+        `vertex_id2` (both ways on undirected graphs) in O(1).
+
+        A cached adjacency is not rebuilt: the new cache shares its edges
+        and only copies the weights array before patching it, so an
+        adjacency returned by `get_adjacency` earlier never changes.
+
+        Raises:
+        KeyError: If either vertex or the edge is not in the graph.
+        """
+        vertex_obj1 = self.get_vertex(vertex_id1)
+        vertex_obj2 = self.get_vertex(vertex_id2)
+        if vertex_obj1 is None or vertex_obj2 is None:
+            raise KeyError("One or both vertices are not in the graph!")
+        old_weight = vertex_obj1.get_weight(vertex_id2)
+        # checked first, since the vertices mark the graph changed
+        is_current = self.adjacency is not None and self.adjacency[0] == self.version
+        vertex_obj1.set_weight(vertex_id2, weight)
+        if not self.is_directed:
+            vertex_obj2.set_weight(vertex_id1, weight)
+        for tree in self.shortest_path_trees.values():
+            tree.edge_changed(vertex_id1, vertex_id2, old_weight, weight)
+            if not self.is_directed:
+                tree.edge_changed(vertex_id2, vertex_id1, old_weight, weight)
+
+        if self.in_neighbors_dict is not None:
+            self.in_neighbors_dict[vertex_id2][vertex_id1] = (vertex_obj1, weight)
+            if not self.is_directed:
+                self.in_neighbors_dict[vertex_id1][vertex_id2] = (vertex_obj2, weight)
+
+        self.version += 1
+        if is_current:
+            adjacency = self.adjacency[1].copy_weights()
+            index1, index2 = adjacency.get_index(vertex_id1), adjacency.get_index(vertex_id2)
+            adjacency.set_weight(index1, index2, weight)
+            if not self.is_directed:
+                adjacency.set_weight(index2, index1, weight)
+            self.adjacency = (self.version, adjacency)
 
     def get_vertices(self):
         """Return all the vertices in the graph"""
         return list(self.vertex_dict.values())
 
+    def contains_id(self, vertex_id):
+        """Return True if a vertex with the given id is in the graph."""
+        return vertex_id in self.vertex_dict
+
+    def get_id_table(self):
+        """Return the table mapping this graph's vertex ids to dense integers."""
+        return self.id_table
+
+    def get_version(self):
+        """Return a counter that changes whenever the vertices or edges do."""
+        return self.version
+
+    def mark_changed(self):
+        """Note that vertices or edges changed, so the cached adjacency is rebuilt on next use."""
+        self.version += 1
+
+    def get_adjacency(self):
+        """
+        Return a CSRAdjacency of the graph, indexed by the id table. It is
+        cached until the graph, or one of its vertices, changes.
+        """
+        if self.adjacency is None or self.adjacency[0] != self.version:
+            self.adjacency = (self.version, CSRAdjacency.from_graph(self))
+        return self.adjacency[1]
+
+    def memory_usage(self):
+        """Return an estimate of the bytes the graph holds, by component (see `Graph.memory_usage`)."""
+        adjacency = self.adjacency[1] if self.adjacency is not None else None
+        return _memory_report(self.vertex_dict, self.in_neighbors_dict, self.id_table, adjacency)
+
+    def has_in_edge_index(self):
+        """Return True if incoming edges are indexed as they are added."""
+        return self.in_neighbors_dict is not None
+
+    def enable_in_edge_index(self):
+        """
+        Build the incoming-edge index from the current edges in O(V+E), and
+        keep it up to date in `add_edge` from now on.
+        """
+        in_neighbors_dict = {vertex.get_id(): {} for vertex in self.get_vertices()}
+        for vertex in self.get_vertices():
+            for neighbor, weight in vertex.get_neighbors_with_weights():
+                in_neighbors_dict[neighbor.get_id()][vertex.get_id()] = (vertex, weight)
+        self.in_neighbors_dict = in_neighbors_dict
+
+    def get_in_neighbors_with_weights(self, vertex_id):
+        """
+        Return (predecessor, weight) tuples for the edges pointing to the given
+        vertex. O(in-degree) with the incoming-edge index, O(V+E) without it.
+        """
+        if not self.contains_id(vertex_id):
+            raise KeyError("Vertex is not in the graph!")
+
+        if not self.is_directed:
+            return self.get_vertex(vertex_id).get_neighbors_with_weights()
+
+        if self.in_neighbors_dict is not None:
+            return list(self.in_neighbors_dict[vertex_id].values())
+
+        return [
+            (vertex, weight)
+            for vertex in self.get_vertices()
+            for neighbor, weight in vertex.get_neighbors_with_weights()
+            if neighbor.get_id() == vertex_id
+        ]
+
+    def get_in_neighbors(self, vertex_id):
+        """Return the vertices that have an edge pointing to the given vertex."""
+        return [vertex for (vertex, weight) in self.get_in_neighbors_with_weights(vertex_id)]
+
+    def transpose(self):
+        """
+        Return a new weighted graph with every edge reversed, built in O(V+E).
+        """
+        transposed = WeightedGraph(is_directed=self.is_directed, duplicate_edges=self.duplicate_edges)
+        for vertex in self.get_vertices():
+            transposed.add_vertex(vertex.get_id())
+
+        for vertex in self.get_vertices():
+            for neighbor, weight in vertex.get_neighbors_with_weights():
+                transposed.get_vertex(neighbor.get_id()).add_neighbor(
+                    transposed.get_vertex(vertex.get_id()), weight)
+
+        if self.has_in_edge_index():
+            transposed.enable_in_edge_index()
+        return transposed
+
     def __iter__(self):
         """Iterate over the vertex objects in the graph, to use sytax:
         for vertex in graph"""
-        return iter(self.vertex_dict.values())
+        return iter(self.get_vertices())
 
     def union(self, parent_map, vertex_id1, vertex_id2):
         """Combine vertex_id1 and vertex_id2 into the same group."""
@@ -126,38 +383,39 @@ class WeightedGraph(Graph):
         Use Kruskal's Algorithm to return a list of edges, as tuples of 
         (start_id, dest_id, weight) in the graph's minimum spanning tree.
         """
-        # TODO: Create a list of all edges in the graph, sort them by weight 
-        # from smallest to largest
-        edges = []
-
-        for vertex in self.get_vertices():
-            for neighbor, weight in vertex.get_neighbors_with_weights():
-                edges.append((vertex.get_id(), neighbor.get_id(), weight))
-        edges = sorted(edges, key=lambda item: item[2])
-        
-        # Create a dictionary `parent_map` to map vertex -> its "parent". 
-        # Initialize it so that each vertex is its own parent.
-        parent_map = {x[0]:x[0] for x in edges}
-
-        # TODO: Create an empty list to hold the solution (i.e. all edges in the 
-        # final spanning tree)
+        adjacency = self.get_adjacency()
+        indptr, indices, weights = adjacency.indptr, adjacency.indices, adjacency.weights
+        num_vertices = adjacency.num_vertices()
+
+        # Sort every edge (by index) by weight from smallest to largest; the
+        # sort is stable, so equal weights keep their insertion order
+        edges = sorted(
+            ((row, indices[edge], weights[edge])
+             for row in range(num_vertices)
+             for edge in range(indptr[row], indptr[row + 1])),
+            key=lambda item: item[2])
+
+        # Each vertex index starts out as its own parent
+        parent_map = list(range(num_vertices))
+
+        def find(index):
+            while parent_map[index] != index:
+                parent_map[index] = parent_map[parent_map[index]]
+                index = parent_map[index]
+            return index
+
+        # Take the smallest edges whose ends are in different sets (so they
+        # can't create a cycle), until the tree has V-1 edges
         solution_list = list()
+        for (vertex_1, vertex_2, weight) in edges:
+            if len(solution_list) == num_vertices - 1:
+                break
+            root_1, root_2 = find(vertex_1), find(vertex_2)
+            if root_1 != root_2:
+                solution_list.append(
+                    (adjacency.vertex_ids[vertex_1], adjacency.vertex_ids[vertex_2], weight))
+                parent_map[root_1] = root_2
 
-        # TODO: While the spanning tree holds < V-1 edges, get the smallest 
-        # edge. If the two vertices connected by the edge are in different sets 
-        # (i.e. calling `find()` gets two different roots), then it will not 
-        # create a cycle, so add it to the solution set and call `union()` on 
-        # the two vertices.
-        while len(solution_list) <= len(edges) - 1:
-            current_edge = edges.pop(0)
-            (vertex_1, vertex_2, weight) = current_edge
-            if self.find(parent_map, vertex_1) != self.find(parent_map, vertex_2):
-                solution_list.append(current_edge)
-                self.union(parent_map, vertex_1, vertex_2)
-            else:
-                continue
-
-        # TODO: Return the solution list.
         return solution_list
 
     def minimum_spanning_tree_prim(self):
@@ -166,102 +424,101 @@ class WeightedGraph(Graph):
         graph's spanning tree.
         Assume that the graph is connected.
         """
-        # TODO: Create a dictionary `vertex_to_weight` and initialize all
-        # vertices to INFINITY - hint: use `float('inf')`
-        vertex_to_weight = dict()
-        for vertex_obj in self.vertex_dict.values():
-            vertex_to_weight[vertex_obj] = float('inf')
+        adjacency = self.get_adjacency()
+        indptr, indices, weights = adjacency.indptr, adjacency.indices, adjacency.weights
+        num_vertices = adjacency.num_vertices()
+        if num_vertices == 0:
+            return 0
 
-        # TODO: Choose one vertex and set its weight to 0
-        start_vertex = self.get_vertices()[0]
-        vertex_to_weight[start_vertex] = 0
+        in_tree = bytearray(num_vertices)
         MST_weight = 0
+        tree_size = 0
+
+        # Heap of (weight of the edge that would add this vertex, vertex index),
+        # starting with the first vertex at weight 0
+        heap = [(0, 0)]
+        while heap:
+            weight, current = heappop(heap)
+            if in_tree[current]:
+                continue
+            in_tree[current] = 1
+            MST_weight += weight
+            tree_size += 1
 
-        # TODO: While `vertex_to_weight` is not empty:
-        while vertex_to_weight:
-        # 1. Get the minimum-weighted remaining vertex, remove it from the
-        #    dictionary, & add its weight to the total MST weight
-        # 2. Update that vertex's neighbors, if edge weights are smaller than
-        #    previous weights
-            min_weighted_vertex = min(vertex_to_weight.items(), key=lambda x: x[1])
-            current_vertex = min_weighted_vertex[0]
-            vertex_to_weight.pop(current_vertex, None)
-            MST_weight += min_weighted_vertex[1]
-            
-            for vertex in current_vertex.get_neighbors_with_weights():
-                neighbor, weight = vertex
-                if neighbor in vertex_to_weight:
-                    if weight < vertex_to_weight[neighbor]:
-                        vertex_to_weight[neighbor] = weight
-
-        # TODO: Return total weight of MST
+            for edge in range(indptr[current], indptr[current + 1]):
+                if not in_tree[indices[edge]]:
+                    heappush(heap, (weights[edge], indices[edge]))
+
+        if tree_size < num_vertices:
+            return float('inf') # not connected
         return MST_weight
 
     def find_shortest_path(self, start_id, target_id):
         """
         Use Dijkstra's Algorithm to return the total weight of the shortest path
         from a start vertex to a destination.
-        """
-        vertex_to_distance = dict()
-
-        for vertex_obj in self.vertex_dict.values():
-            vertex_to_distance[vertex_obj] = float('inf')
-
-        start_vertex = self.vertex_dict[start_id]
-        vertex_to_distance[start_vertex] = 0
 
-        while len(vertex_to_distance) > 0:
+        The priority queue is picked from the weight range (see
+        `select_engine` in graphs.integer_shortest_paths): bucket queues for
+        non-negative integer weights, a binary heap otherwise.
 
-            min_distance = min(vertex_to_distance.values())
-            min_vertex = None
-
-            for vertex in vertex_to_distance:
-                if vertex_to_distance[vertex] == min_distance:
-                    min_vertex = vertex
-
-            weight_of_neighbor = (
-                list(min_vertex.neighbors_dict.values())
-            )
-
-            if min_vertex.id == target_id:
-                return vertex_to_distance[min_vertex]
+        Dijkstra is wrong with negative edge weights, so graphs that have any
+        are searched with Bellman-Ford (SPFA) instead, which raises
+        NegativeCycleError if a negative cycle is reachable from the start.
+        """
+        if not self.contains_id(start_id) or not self.contains_id(target_id):
+            raise KeyError("One or both vertices are not in the graph!")
 
-            for neighbor, weight in weight_of_neighbor:
-                if neighbor in vertex_to_distance:
-                    current_distance = vertex_to_distance[neighbor]
-                    new_distance = weight + vertex_to_distance[min_vertex]
-                    if new_distance < current_distance:
-                        vertex_to_distance[neighbor] = new_distance
+        adjacency = self.get_adjacency()
+        if adjacency.has_negative_weights():
+            distance, _ = bellman_ford_path(self, start_id, target_id)
+            return distance
 
-            del vertex_to_distance[min_vertex]
-            
-        return None
+        target = adjacency.get_index(target_id)
+        distance, _ = _run_engine(adjacency, adjacency.get_index(start_id), target)
+        return distance[target]
 
     def floyd_warshall(self):
         """
         Return the All-Pairs-Shortest-Paths dictionary, containing the shortest
         paths from each vertex to each other vertex.
-        """
-        all_vertices = self.get_vertices()
-        all_vertex_id = [vertex.get_id() for vertex in all_vertices]
 
-        vertex_index_map = {}
-        for index in range(len(all_vertex_id)):
-            vertex_id = all_vertex_id[index]
-            vertex_index_map[vertex_id] = index
+        This is O(V^3); for sparse graphs use `johnson_all_pairs` in
+        graphs.shortest_paths instead.
 
-        distances_graph = [[float("inf") for _ in all_vertex_id] for _ in all_vertex_id]
-
-        for vertex in all_vertices:
-            vertex_index = vertex_index_map[vertex.get_id()]
-            distances_graph[vertex_index][vertex_index] = 0
-            for neighbor, weight in vertex.get_neighbors():
-                neighbor_index = vertex_index_map[neighbor.get_id()]
-                distances_graph[vertex_index][neighbor_index] = weight
+        Raises:
+        NegativeCycleError: If the graph contains a negative-weight cycle.
+        """
+        adjacency = self.get_adjacency()
+        indptr, indices, weights = adjacency.indptr, adjacency.indices, adjacency.weights
+        all_vertex_id = adjacency.vertex_ids
+        num_vertices = len(all_vertex_id)
 
-        for k in range(len(all_vertex_id)):
-            for i in range(len(all_vertex_id)):
-                for j in range(len(all_vertex_id)):
-                    distances_graph[i][j] = min(distances_graph[i][j], distances_graph[i][k] + distances_graph[k][j])
+        distances_graph = [[float("inf")] * num_vertices for _ in range(num_vertices)]
 
-        
\ No newline at end of file
+        for vertex_index in range(num_vertices):
+            distances_graph[vertex_index][vertex_index] = 0
+            for edge in range(indptr[vertex_index], indptr[vertex_index + 1]):
+                neighbor_index = indices[edge]
+                distances_graph[vertex_index][neighbor_index] = min(
+                    weights[edge], distances_graph[vertex_index][neighbor_index])
+
+        for k in range(num_vertices):
+            row_k = distances_graph[k]
+            for i in range(num_vertices):
+                row_i = distances_graph[i]
+                distance_i_k = row_i[k]
+                if distance_i_k == float("inf"):
+                    continue
+                for j in range(num_vertices):
+                    if distance_i_k + row_k[j] < row_i[j]:
+                        row_i[j] = distance_i_k + row_k[j]
+
+        for index in range(num_vertices):
+            if distances_graph[index][index] < 0:
+                raise NegativeCycleError(find_negative_cycle(self))
+
+        return {
+            all_vertex_id[i]: {all_vertex_id[j]: distances_graph[i][j] for j in range(num_vertices)}
+            for i in range(num_vertices)
+        }
@@ -1,11 +1,28 @@
+"""
+Load a graph once and answer a batch of queries against it.
+
+Queries are read one per line from a file or stdin, either as words
+(`path A E`, `khop A 2`, `components`, `toposort`) or as JSON objects
+({"op": "path", "source": "A", "target": "E", "id": 7}). Each answer is
+written as a line of JSON with its result or error and how long it took;
+a summary goes to stderr.
+
+Usage: python main.py GRAPH [QUERIES] [--format auto|text|snapshot]
+                         [--processes N] [--save-snapshot PATH]
+
+Without a GRAPH, runs a small demo.
+"""
+import argparse
+import sys
+import time
+
 from graphs.graph import Graph
 from util.file_reader import read_graph_from_file
 # from graphs.weighted_graph import WeightedGraph
 
 
-# Driver code
-if __name__ == '__main__':
-
+def demo():
+    """Build a small directed graph and show what it can do."""
     # Create the graph
 
     graph = Graph(is_directed=True)
@@ -53,6 +70,52 @@ if __name__ == '__main__':
     vertices_2_away = graph.find_vertices_n_away('A', 2)
     print(vertices_2_away)
 
-    # graph = read_graph_from_file('test_files/graph_small_directed.txt')
 
-    # print(graph)
\ No newline at end of file
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('graph', nargs='?', help='text edge list or binary snapshot to load')
+    parser.add_argument('queries', nargs='?', help='file of queries, one per line (default: stdin)')
+    parser.add_argument('--format', default='auto', choices=('auto', 'text', 'snapshot'),
+                        help='how GRAPH is stored (default: detect)')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='worker processes answering queries (0 = one per CPU)')
+    parser.add_argument('--chunksize', type=int, default=16, help='queries sent to a worker at a time')
+    parser.add_argument('--save-snapshot', metavar='PATH',
+                        help='also write the loaded graph as a binary snapshot, for faster loading next time')
+    args = parser.parse_args(argv)
+
+    if args.graph is None:
+        demo()
+        return 0
+
+    # the query machinery is only imported when there's a batch to run
+    from util.graph_log import write_snapshot
+    from util.query_runner import load_graph, run_queries, to_json_line
+
+    start = time.perf_counter()
+    graph = load_graph(args.graph, args.format)
+    load_seconds = time.perf_counter() - start
+    if args.save_snapshot:
+        write_snapshot(graph, args.save_snapshot)
+
+    queries = open(args.queries) if args.queries else sys.stdin
+    num_queries = num_errors = 0
+    start = time.perf_counter()
+    try:
+        for record in run_queries(graph, queries, args.processes or None, args.chunksize):
+            print(to_json_line(record))
+            num_queries += 1
+            num_errors += 'error' in record
+    finally:
+        if queries is not sys.stdin:
+            queries.close()
+    query_seconds = time.perf_counter() - start
+
+    rate = num_queries / query_seconds if query_seconds else 0.0
+    print(f'loaded graph in {load_seconds:.3f}s; answered {num_queries} queries '
+          f'({num_errors} failed) in {query_seconds:.3f}s, {rate:.0f} queries/s', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
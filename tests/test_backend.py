@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import graphs
+import util
+from graphs import backend
+from graphs.graph import Graph
+
+
+def run_python(code, **environ):
+    """Run code in a fresh interpreter from the repo root and return its stdout."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True,
+                          check=True, env=dict(os.environ, **environ)).stdout.strip()
+
+
+class TestBackend(unittest.TestCase):
+
+    def test_lazy_exports(self):
+        self.assertIs(graphs.Graph, Graph)
+        from graphs.clustering import triangle_count
+        self.assertIs(graphs.triangle_count, triangle_count)
+        self.assertIn('pagerank', dir(graphs))
+        self.assertIn('GraphLog', util.__all__)
+        with self.assertRaises(AttributeError):
+            graphs.no_such_name
+
+    def test_imports_stay_light(self):
+        loaded = run_python(
+            'import sys\n'
+            'import graphs, util\n'
+            'from graphs.weighted_graph import WeightedGraph\n'
+            'from util.file_reader import read_graph_from_file\n'
+            'print(sorted(name for name in ("numpy", "multiprocessing", "graphs.centrality") if name in sys.modules))')
+        self.assertEqual(loaded, '[]')
+
+    def test_backend_override(self):
+        with mock.patch.dict(os.environ, {backend.BACKEND_ENV: 'python'}):
+            self.assertEqual(backend.get_backend(), 'python')
+            self.assertIsNone(backend.import_numpy())
+        with mock.patch.dict(os.environ, {backend.BACKEND_ENV: 'fortran'}):
+            with self.assertRaises(ValueError):
+                backend.get_backend()
+
+        # the pure-Python fallback gives the same answers
+        code = ('from graphs import Graph, triangle_count, parallel_connected_components\n'
+                'graph = Graph(is_directed=False)\n'
+                'for vertex_id in "ABCDE": graph.add_vertex(vertex_id)\n'
+                'for pair in ("AB", "BC", "CA", "DE"): graph.add_edge(*pair)\n'
+                'print(triangle_count(graph), parallel_connected_components(graph, processes=1))')
+        self.assertEqual(run_python(code, GRAPHS_BACKEND='python'), "1 [['A', 'B', 'C'], ['D', 'E']]")
+
+
+if __name__ == '__main__':
+    unittest.main()
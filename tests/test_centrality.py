@@ -0,0 +1,98 @@
+import unittest
+from unittest import mock
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+from graphs import centrality
+
+
+class TestCentrality(unittest.TestCase):
+
+    def make_star(self):
+        """A hub 'H' with edges to and from each of 'A', 'B', 'C'."""
+        graph = Graph(is_directed=False)
+        for vertex_id in 'HABC':
+            graph.add_vertex(vertex_id)
+        for vertex_id in 'ABC':
+            graph.add_edge('H', vertex_id)
+        return graph
+
+    def test_pagerank_star(self):
+        scores = centrality.pagerank(self.make_star())
+
+        self.assertAlmostEqual(sum(scores.values()), 1.0)
+        self.assertGreater(scores['H'], scores['A'])
+        self.assertAlmostEqual(scores['A'], scores['B'])
+
+    def test_pagerank_without_numpy(self):
+        graph = self.make_star()
+        expected = centrality.pagerank(graph, tol=1e-10, max_iter=300)
+        with mock.patch.object(centrality, '_import_numpy', return_value=None):
+            scores = centrality.pagerank(graph, tol=1e-10, max_iter=300)
+
+        for vertex_id in expected:
+            self.assertAlmostEqual(scores[vertex_id], expected[vertex_id])
+
+    def test_pagerank_weighted_and_personalized(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in 'ABC':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 9)
+        graph.add_edge('A', 'C', 1)
+
+        scores = centrality.pagerank(graph)
+        self.assertGreater(scores['B'], scores['C'])
+        self.assertAlmostEqual(
+            centrality.pagerank(graph, weighted=False)['B'],
+            centrality.pagerank(graph, weighted=False)['C'])
+
+        personalized = centrality.pagerank(graph, personalization={'C': 1})
+        self.assertGreater(personalized['C'], personalized['B'])
+
+    def test_pagerank_warm_start(self):
+        graph = self.make_star()
+        scores = centrality.pagerank(graph, tol=1e-10, max_iter=300)
+
+        # starting from the answer converges on the first iteration
+        warm = centrality.pagerank(graph, tol=1e-6, max_iter=1, initial=scores)
+        self.assertAlmostEqual(warm['H'], scores['H'])
+
+        with self.assertRaises(RuntimeError):
+            centrality.pagerank(graph, tol=1e-12, max_iter=1)
+
+    def test_degree_centrality(self):
+        graph = Graph(is_directed=True)
+        for vertex_id in 'ABC':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B')
+        graph.add_edge('A', 'C')
+
+        self.assertEqual(centrality.degree_centrality(graph)['A'], 1.0)
+        self.assertEqual(centrality.degree_centrality(graph, direction='in')['A'], 0.0)
+        self.assertEqual(centrality.degree_centrality(graph, direction='in')['B'], 0.5)
+
+    def test_betweenness_path(self):
+        graph = WeightedGraph(is_directed=False)
+        for vertex_id in 'ABCD':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 1)
+        graph.add_edge('B', 'C', 1)
+        graph.add_edge('C', 'D', 1)
+        graph.add_edge('A', 'D', 10)
+
+        scores = centrality.betweenness_centrality(graph, normalized=False)
+        self.assertEqual(scores, {'A': 0.0, 'B': 2.0, 'C': 2.0, 'D': 0.0})
+
+        unweighted = centrality.betweenness_centrality(graph, normalized=False, weighted=False)
+        self.assertEqual(unweighted, {'A': 0.5, 'B': 0.5, 'C': 0.5, 'D': 0.5})
+
+    def test_betweenness_process_pool(self):
+        graph = self.make_star()
+        serial = centrality.betweenness_centrality(graph)
+        parallel = centrality.betweenness_centrality(graph, processes=2)
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial['H'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from unittest import mock
+from graphs.graph import Graph
+from graphs import clustering
+
+
+class TestClustering(unittest.TestCase):
+
+    def make_graph(self):
+        """Triangles ABC and BCD sharing edge BC, plus a pendant E on D."""
+        graph = Graph(is_directed=False)
+        for vertex_id in 'ABCDE':
+            graph.add_vertex(vertex_id)
+        for vertex_id1, vertex_id2 in ['AB', 'AC', 'BC', 'BD', 'CD', 'DE']:
+            graph.add_edge(vertex_id1, vertex_id2)
+        return graph
+
+    def test_triangles(self):
+        graph = self.make_graph()
+        expected = {'A': 1, 'B': 2, 'C': 2, 'D': 1, 'E': 0}
+        self.assertEqual(clustering.triangles(graph), expected)
+        self.assertEqual(clustering.triangle_count(graph), 2)
+        self.assertEqual(clustering.triangles(graph, processes=2), expected)
+
+        with mock.patch.object(clustering, '_import_numpy', return_value=None):
+            self.assertEqual(clustering.triangles(graph), expected)
+
+    def test_clustering_coefficient(self):
+        coefficients = clustering.clustering_coefficient(self.make_graph())
+        self.assertEqual(coefficients['A'], 1.0)
+        self.assertAlmostEqual(coefficients['B'], 2 / 3)
+        self.assertAlmostEqual(coefficients['D'], 1 / 3)
+        self.assertEqual(coefficients['E'], 0.0)
+        self.assertAlmostEqual(clustering.average_clustering(self.make_graph()), (1 + 2 / 3 + 2 / 3 + 1 / 3) / 5)
+        # 2 triangles, 1 + 3 + 3 + 3 + 0 connected triples
+        self.assertAlmostEqual(clustering.transitivity(self.make_graph()), 6 / 10)
+
+    def test_direction_and_loops_ignored(self):
+        graph = Graph(is_directed=True)
+        for vertex_id in 'ABC':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B')
+        graph.add_edge('B', 'A')
+        graph.add_edge('B', 'C')
+        graph.add_edge('A', 'C')
+        graph.add_edge('C', 'C')
+        self.assertEqual(clustering.triangles(graph), {'A': 1, 'B': 1, 'C': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+from graphs import convert
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import scipy
+except ImportError:
+    scipy = None
+
+
+def edge_set(graph):
+    """Return the set of (from_id, to_id, weight) in a graph."""
+    edges = set()
+    for vertex in graph.get_vertices():
+        if graph.is_weighted():
+            for neighbor, weight in vertex.get_neighbors_with_weights():
+                edges.add((vertex.get_id(), neighbor.get_id(), weight))
+        else:
+            for neighbor in vertex.get_neighbors():
+                edges.add((vertex.get_id(), neighbor.get_id(), 1))
+    return edges
+
+
+class TestConvert(unittest.TestCase):
+
+    def make_weighted_graph(self, is_directed):
+        graph = WeightedGraph(is_directed=is_directed)
+        for vertex_id in ['A', 'B', 'C', 'D']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 4)
+        graph.add_edge('B', 'C', 1.5)
+        graph.add_edge('C', 'A', 2)
+        return graph
+
+    def test_from_edge_lists(self):
+        graph = convert.from_edge_arrays([0, 1], [1, 2], is_directed=False)
+
+        self.assertIsInstance(graph, Graph)
+        self.assertEqual(len(graph.get_vertices()), 3)
+        self.assertEqual(graph.find_shortest_path('2', '0'), ['2', '1', '0'])
+
+        with self.assertRaises(ValueError):
+            convert.from_edge_arrays([0, 1], [1])
+        with self.assertRaises(ValueError):
+            convert.from_edge_arrays([0, -1], [1, 0])
+        with self.assertRaises(ValueError):
+            convert.from_edge_arrays([0, 1], [1, 2], vertex_ids=['A', 'B'])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_edge_arrays_round_trip(self):
+        for is_directed in (True, False):
+            graph = self.make_weighted_graph(is_directed)
+            sources, targets, weights, vertex_ids = convert.to_edge_arrays(graph)
+
+            self.assertEqual(vertex_ids, ['A', 'B', 'C', 'D'])
+            self.assertEqual(len(sources), 3 if is_directed else 6)
+
+            copy = convert.from_edge_arrays(sources, targets, weights, vertex_ids, is_directed)
+            self.assertEqual(edge_set(copy), edge_set(graph))
+        self.assertEqual(weights.dtype, numpy.float64)
+
+        # integer weights stay integers both ways
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 4)
+        graph.add_edge('B', 'C', 2)
+        sources, targets, weights, vertex_ids = convert.to_edge_arrays(graph)
+        self.assertEqual(weights.dtype, numpy.int64)
+        copy = convert.from_edge_arrays(sources, targets, weights, vertex_ids)
+        self.assertIsInstance(copy.get_weight('A', 'B'), int)
+        self.assertIsInstance(copy.find_shortest_path('A', 'C'), int)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_adjacency_matrix_round_trip(self):
+        graph = Graph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'C')
+
+        matrix, vertex_ids = convert.to_adjacency_matrix(graph)
+        self.assertEqual(matrix.tolist(), [[0, 0, 1], [0, 0, 0], [0, 0, 0]])
+
+        copy = convert.from_adjacency_matrix(matrix, vertex_ids, weighted=False)
+        self.assertIsInstance(copy, Graph)
+        self.assertFalse(copy.is_weighted())
+        self.assertEqual(edge_set(copy), edge_set(graph))
+
+    @unittest.skipIf(scipy is None, 'SciPy is not installed')
+    def test_scipy_csr_round_trip(self):
+        graph = self.make_weighted_graph(is_directed=True)
+        matrix, vertex_ids = convert.to_scipy_csr(graph)
+
+        self.assertEqual(matrix.shape, (4, 4))
+        self.assertEqual(matrix[1, 2], 1.5)
+        self.assertEqual(matrix.nnz, 3)
+
+        copy = convert.from_scipy_csr(matrix, vertex_ids)
+        self.assertEqual(edge_set(copy), edge_set(graph))
+        self.assertEqual(copy.find_shortest_path('A', 'C'), 5.5)
+
+        # the matrix is a copy; editing it leaves the graph alone
+        matrix.data[0] = 100
+        self.assertEqual(graph.find_shortest_path('A', 'C'), 5.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from graphs.subgraph import subgraph_view
+from graphs.weighted_graph import WeightedGraph
+
+
+class TestShortestPathTree(unittest.TestCase):
+
+    def make_graph(self, is_directed=True, duplicate_edges='first'):
+        graph = WeightedGraph(is_directed=is_directed, duplicate_edges=duplicate_edges)
+        for vertex_id in 'ABCDEF':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 4)
+        graph.add_edge('B', 'C', 4)
+        graph.add_edge('C', 'D', 1)
+        return graph
+
+    def test_insertions(self):
+        graph = self.make_graph()
+        tree = graph.track_shortest_paths('A')
+        self.assertIs(graph.track_shortest_paths('A'), tree)
+        self.assertEqual(tree.get_distance('D'), 9)
+        self.assertEqual(tree.get_distance('E'), float('inf'))
+
+        graph.add_edge('A', 'C', 1) # shortcut: C and everything after it move closer
+        self.assertFalse(tree.stale)
+        self.assertEqual(tree.get_distances(), {'A': 0, 'B': 4, 'C': 1, 'D': 2})
+        self.assertEqual(tree.get_path('D'), ['A', 'C', 'D'])
+
+        graph.add_edge('D', 'E', 3) # reaches a new vertex
+        graph.add_edge('B', 'E', 9) # longer than what's there: nothing changes
+        self.assertEqual(tree.get_path('E'), ['A', 'C', 'D', 'E'])
+        self.assertIsNone(tree.get_path('F'))
+
+        graph.untrack_shortest_paths('A')
+        self.assertEqual(graph.shortest_path_trees, {})
+
+    def test_weight_changes(self):
+        graph = self.make_graph(is_directed=False, duplicate_edges='last')
+        tree = graph.track_shortest_paths('D')
+        graph.add_edge('C', 'B', 10) # 'last' raises a tree edge: rebuilt on demand
+        self.assertTrue(tree.stale)
+        self.assertEqual(tree.get_distance('A'), 15)
+
+        graph.set_weight('B', 'C', 2)
+        self.assertEqual(tree.get_distance('A'), 7)
+
+        graph = self.make_graph()
+        tree = graph.track_shortest_paths('A')
+        graph.set_weight('C', 'D', -1) # negative weights fall back to Bellman-Ford
+        self.assertEqual(tree.get_distances(), {'A': 0, 'B': 4, 'C': 8, 'D': 7})
+        graph.add_edge('A', 'D', 2)
+        self.assertEqual(tree.get_path('D'), ['A', 'D'])
+
+    def test_views_are_read_only(self):
+        with self.assertRaises(TypeError):
+            subgraph_view(self.make_graph()).track_shortest_paths('A')
+        with self.assertRaises(KeyError):
+            self.make_graph().track_shortest_paths('Z')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from unittest import mock
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+from graphs import flow
+
+
+class TestFlow(unittest.TestCase):
+
+    def make_network(self):
+        """The classic CLRS network, with a maximum flow of 23."""
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in ['s', 'v1', 'v2', 'v3', 'v4', 't']:
+            graph.add_vertex(vertex_id)
+        for vertex_id1, vertex_id2, capacity in [('s', 'v1', 16), ('s', 'v2', 13), ('v2', 'v1', 4),
+                                                 ('v1', 'v3', 12), ('v3', 'v2', 9), ('v2', 'v4', 14),
+                                                 ('v4', 'v3', 7), ('v3', 't', 20), ('v4', 't', 4)]:
+            graph.add_edge(vertex_id1, vertex_id2, capacity)
+        return graph
+
+    def test_maximum_flow(self):
+        graph = self.make_network()
+        for min_arcs in (flow.NUMPY_MIN_ARCS, 0): # pure Python, then NumPy levels
+            with mock.patch.object(flow, 'NUMPY_MIN_ARCS', min_arcs):
+                value, flows = flow.maximum_flow(graph, 's', 't')
+            self.assertEqual(value, 23)
+            self.assertEqual(flows['v3']['t'] + flows['v4']['t'], 23)
+            for vertex_id1, targets in flows.items():
+                for vertex_id2, sent in targets.items():
+                    self.assertLessEqual(sent, graph.get_weight(vertex_id1, vertex_id2))
+            for vertex_id in ['v1', 'v2', 'v3', 'v4']:
+                into = sum(targets.get(vertex_id, 0) for targets in flows.values())
+                self.assertEqual(into, sum(flows.get(vertex_id, {}).values()))
+
+        self.assertEqual(flow.maximum_flow(graph, 't', 's'), (0, {}))
+        with self.assertRaises(ValueError):
+            flow.maximum_flow(graph, 's', 's')
+        with self.assertRaises(KeyError):
+            flow.maximum_flow(graph, 's', 'x')
+
+    def test_minimum_cut(self):
+        value, (source_side, sink_side), cut_edges = flow.minimum_cut(self.make_network(), 's', 't')
+        self.assertEqual(value, 23)
+        self.assertEqual(sorted(source_side), ['s', 'v1', 'v2', 'v4'])
+        self.assertEqual(sorted(sink_side), ['t', 'v3'])
+        self.assertEqual(sorted(cut_edges), [('v1', 'v3'), ('v4', 't'), ('v4', 'v3')])
+
+    def test_unit_capacities(self):
+        # two edge-disjoint routes between A and D in an undirected square
+        graph = Graph(is_directed=False)
+        for vertex_id in 'ABCD':
+            graph.add_vertex(vertex_id)
+        for vertex_id1, vertex_id2 in ['AB', 'BD', 'AC', 'CD', 'BC']:
+            graph.add_edge(vertex_id1, vertex_id2)
+        value, flows = flow.maximum_flow(graph, 'A', 'D')
+        self.assertEqual(value, 2)
+        self.assertEqual(flows['A'], {'B': 1, 'C': 1})
+
+        negative = self.make_network()
+        negative.set_weight('s', 'v1', -1)
+        with self.assertRaises(ValueError):
+            flow.maximum_flow(negative, 's', 't')
+
+
+if __name__ == '__main__':
+    unittest.main()
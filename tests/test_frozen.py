@@ -0,0 +1,96 @@
+import unittest
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+from graphs.frozen import FrozenGraph, WeightedFrozenGraph
+from util.file_reader import read_graph_from_file
+
+
+class TestFrozenGraph(unittest.TestCase):
+
+    def make_weighted(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in 'ABCDE':
+            graph.add_vertex(vertex_id)
+        for vertex_id1, vertex_id2, weight in [('A', 'B', 4), ('A', 'C', 1), ('C', 'B', 2),
+                                               ('B', 'D', 1.5), ('C', 'D', 5), ('D', 'E', 3)]:
+            graph.add_edge(vertex_id1, vertex_id2, weight)
+        return graph
+
+    def test_queries_match(self):
+        graph = read_graph_from_file('test_files/graph_medium_undirected.txt')
+        frozen = graph.compact()
+        self.assertIsInstance(frozen, FrozenGraph)
+        self.assertFalse(frozen.is_directed)
+        self.assertEqual(frozen.find_shortest_path('A', 'E'), graph.find_shortest_path('A', 'E'))
+        self.assertEqual(frozen.get_connected_components(), graph.get_connected_components())
+        self.assertEqual(frozen.find_vertices_n_away('A', 2), graph.find_vertices_n_away('A', 2))
+        self.assertEqual(frozen.is_bipartite(), graph.is_bipartite())
+        self.assertIsNone(frozen.get_vertex('Z'))
+
+    def test_weighted_queries_match(self):
+        graph = self.make_weighted()
+        frozen = graph.compact()
+        self.assertIsInstance(frozen, WeightedFrozenGraph)
+        self.assertEqual(frozen.find_shortest_path('A', 'E'), graph.find_shortest_path('A', 'E'))
+        self.assertEqual(frozen.get_weight('B', 'D'), 1.5)
+        self.assertEqual(sorted(vertex.get_id() for vertex in frozen.get_in_neighbors('B')), ['A', 'C'])
+        self.assertTrue(frozen.get_vertex('A').has_neighbor('C'))
+        self.assertFalse(frozen.get_vertex('C').has_neighbor('A'))
+
+        # later changes to the graph don't reach the frozen copy
+        graph.set_weight('B', 'D', 10)
+        graph.add_vertex('F')
+        self.assertEqual(frozen.get_weight('B', 'D'), 1.5)
+        self.assertFalse(frozen.contains_id('F'))
+
+    def test_read_only_and_thaw(self):
+        frozen = self.make_weighted().compact()
+        with self.assertRaises(TypeError):
+            frozen.add_vertex('F')
+        with self.assertRaises(TypeError):
+            frozen.add_edge('A', 'E', 1)
+        with self.assertRaises(TypeError):
+            frozen.set_weight('A', 'B', 1)
+
+        thawed = frozen.thaw()
+        self.assertIsInstance(thawed, WeightedGraph)
+        thawed.add_edge('A', 'E', 1)
+        self.assertEqual(thawed.find_shortest_path('A', 'E'), 1)
+        self.assertEqual(frozen.find_shortest_path('A', 'E'), self.make_weighted().find_shortest_path('A', 'E'))
+
+        # thawing keeps the duplicate edge policy and the in-edge index
+        graph = WeightedGraph(is_directed=True, duplicate_edges='min')
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+        graph.add_edge('A', 'B', 5)
+        graph.enable_in_edge_index()
+        frozen = graph.compact()
+        self.assertTrue(frozen.has_in_edge_index())
+        thawed = frozen.thaw()
+        self.assertEqual(thawed.duplicate_edges, 'min')
+        self.assertEqual(frozen.transpose().thaw().duplicate_edges, 'min')
+        self.assertTrue(thawed.has_in_edge_index())
+        thawed.add_edge('A', 'B', 2)
+        thawed.add_edge('A', 'B', 7)
+        self.assertEqual(thawed.get_weight('A', 'B'), 2)
+        self.assertEqual([vertex.get_id() for vertex in thawed.get_in_neighbors('B')], ['A'])
+
+    def test_memory_usage(self):
+        graph = Graph(is_directed=False)
+        for vertex_id in range(100):
+            graph.add_vertex(vertex_id)
+        for vertex_id in range(99):
+            graph.add_edge(vertex_id, vertex_id + 1)
+        report = graph.memory_usage()
+        self.assertEqual(report['total'], sum(size for component, size in report.items() if component != 'total'))
+        self.assertGreater(report['neighbor_dicts'], 0)
+        self.assertEqual(report['weight_tuples'], 0)
+
+        weighted = self.make_weighted()
+        self.assertGreater(weighted.memory_usage()['weight_tuples'], 0)
+        for mutable in (graph, weighted):
+            self.assertLess(mutable.compact().memory_usage()['total'], mutable.memory_usage()['total'])
+
+
+if __name__ == '__main__':
+    unittest.main()
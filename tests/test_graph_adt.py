@@ -1,5 +1,6 @@
 import unittest
 from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
 from util.file_reader import read_graph_from_file
 # from gradescope_utils.autograder_utils.decorators import weight, visibility
 
@@ -97,5 +98,97 @@ class TestReadGraphFromFile(unittest.TestCase):
         vertices_3_away = graph.find_vertices_n_away('A', 3)
         self.assertEqual(vertices_3_away, ['F'])
 
+class TestInEdges(unittest.TestCase):
+
+    def make_graph(self, track_in_edges):
+        graph = Graph(is_directed=True, track_in_edges=track_in_edges)
+        for vertex_id in 'ABCDE':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        graph.add_edge('B','C')
+        graph.add_edge('C','A')
+        graph.add_edge('C','D')
+        graph.add_edge('D','E')
+        graph.add_edge('E','D')
+        return graph
+
+    def test_in_neighbors(self):
+        for track_in_edges in (True, False):
+            graph = self.make_graph(track_in_edges)
+            self.assertEqual(graph.has_in_edge_index(), track_in_edges)
+
+            in_neighbors = [vertex.get_id() for vertex in graph.get_in_neighbors('D')]
+            self.assertEqual(sorted(in_neighbors), ['C', 'E'])
+            self.assertEqual(graph.get_in_degree('A'), 1)
+            self.assertEqual(graph.get_in_degree('B'), 1)
+
+    def test_enable_in_edge_index(self):
+        graph = self.make_graph(track_in_edges=False)
+        graph.enable_in_edge_index()
+        graph.add_edge('A','D')
+
+        in_neighbors = [vertex.get_id() for vertex in graph.get_in_neighbors('D')]
+        self.assertEqual(sorted(in_neighbors), ['A', 'C', 'E'])
+
+    def test_transpose(self):
+        graph = self.make_graph(track_in_edges=False)
+        transposed = graph.transpose()
+
+        neighbors = [vertex.get_id() for vertex in transposed.get_vertex('A').get_neighbors()]
+        self.assertEqual(neighbors, ['C'])
+        self.assertEqual(len(transposed.get_vertex('E').get_neighbors()), 1)
+
+    def test_strongly_connected_components(self):
+        for track_in_edges in (True, False):
+            graph = self.make_graph(track_in_edges)
+            components = graph.strongly_connected_components()
+            self.assertEqual(
+                sorted(sorted(component) for component in components),
+                [['A', 'B', 'C'], ['D', 'E']])
+
+class TestIdTable(unittest.TestCase):
+
+    def test_ids_are_interned_in_order(self):
+        graph = Graph(is_directed=True)
+        for vertex_id in ['X', 'Y', 'Z']:
+            graph.add_vertex(vertex_id)
+
+        id_table = graph.get_id_table()
+        self.assertEqual(len(id_table), 3)
+        self.assertEqual(id_table.get_index('Y'), 1)
+        self.assertEqual(id_table.get_id(2), 'Z')
+        with self.assertRaises(KeyError):
+            id_table.get_index('W')
+
+    def test_adjacency_is_cached_until_changed(self):
+        graph = Graph(is_directed=True)
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+
+        adjacency = graph.get_adjacency()
+        self.assertIs(graph.get_adjacency(), adjacency)
+        self.assertIsNone(graph.find_shortest_path('A', 'B'))
+
+        graph.add_edge('A', 'B')
+        self.assertIsNot(graph.get_adjacency(), adjacency)
+        self.assertEqual(graph.find_shortest_path('A', 'B'), ['A', 'B'])
+
+        # changing a vertex directly also invalidates the cache
+        graph.add_vertex('C')
+        graph.get_adjacency()
+        graph.get_vertex('B').add_neighbor(graph.get_vertex('C'))
+        self.assertEqual(graph.find_path_dfs_iter('A', 'C'), ['A', 'B', 'C'])
+
+        weighted = WeightedGraph(is_directed=True)
+        for vertex_id in 'ABC':
+            weighted.add_vertex(vertex_id)
+        weighted.add_edge('A', 'B', 1)
+        self.assertEqual(weighted.find_shortest_path('A', 'B'), 1)
+        weighted.get_vertex('A').set_weight('B', 4)
+        weighted.get_vertex('B').add_neighbor(weighted.get_vertex('C'), 2)
+        self.assertEqual(weighted.find_shortest_path('A', 'B'), 4)
+        self.assertEqual(weighted.find_shortest_path('A', 'C'), 6)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import unittest
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+from util.graph_log import GraphLog
+
+
+def edge_set(graph):
+    """Return the set of (from_id, to_id, weight) in a graph."""
+    if graph.is_weighted():
+        return {(vertex.get_id(), neighbor.get_id(), weight)
+                for vertex in graph.get_vertices()
+                for neighbor, weight in vertex.get_neighbors_with_weights()}
+    return {(vertex.get_id(), neighbor.get_id(), 1)
+            for vertex in graph.get_vertices() for neighbor in vertex.get_neighbors()}
+
+
+class TestGraphLog(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_replay_after_restart(self):
+        with GraphLog(self.directory, Graph(is_directed=True)) as log:
+            for vertex_id in 'ABC':
+                log.add_vertex(vertex_id)
+            log.add_edge('A', 'B')
+            log.add_edge('B', 'C')
+            expected = edge_set(log.graph)
+
+        with GraphLog(self.directory) as log:
+            self.assertTrue(log.graph.is_directed)
+            self.assertEqual(sorted(vertex.get_id() for vertex in log.graph.get_vertices()), ['A', 'B', 'C'])
+            self.assertEqual(edge_set(log.graph), expected)
+            self.assertEqual(log.records_since_snapshot, 5)
+
+    def test_snapshot_then_tail(self):
+        log = GraphLog(self.directory, WeightedGraph(is_directed=False, duplicate_edges='min'),
+                       snapshot_every=4)
+        for vertex_id in 'ABCD':
+            log.add_vertex(vertex_id) # the fourth record triggers a snapshot
+        log.add_edge('A', 'B', 5)
+        log.add_edge('A', 'B', 3)
+        log.set_weight('A', 'B', 4)
+        log.add_edge('C', 'D', 1)
+        log.close()
+        # the second snapshot covered everything, so only an empty segment is left
+        self.assertEqual(sorted(name for name in os.listdir(self.directory) if name.startswith('log.')),
+                         ['log.00000003'])
+
+        log = GraphLog(self.directory)
+        log.add_edge('B', 'C', 2)
+        log.close()
+
+        graph = GraphLog(self.directory).graph
+        self.assertEqual(graph.duplicate_edges, 'min')
+        self.assertEqual(graph.get_weight('B', 'A'), 4)
+        self.assertEqual(graph.find_shortest_path('A', 'D'), 7)
+
+    def test_torn_record_is_dropped(self):
+        with GraphLog(self.directory, sync_every=1) as log:
+            log.add_vertex('A')
+            log.add_vertex('B')
+            segment_path = log.file.name
+
+        with open(segment_path, 'ab') as segment:
+            segment.write(b'\x40\x00\x00\x00garbage') # a record cut short by a crash
+
+        with GraphLog(self.directory) as log:
+            self.assertEqual(len(log.graph.get_vertices()), 2)
+            log.add_edge('A', 'B')
+        with GraphLog(self.directory) as log:
+            self.assertTrue(log.graph.has_edge('B', 'A'))
+
+    def test_failed_call_is_not_logged(self):
+        with GraphLog(self.directory, WeightedGraph()) as log:
+            log.add_vertex('A')
+            with self.assertRaises(KeyError):
+                log.set_weight('A', 'Z', 1)
+            with self.assertRaises(KeyError):
+                log.add_edge('A', 'Z', 1)
+            with self.assertRaises(KeyError):
+                log.add_edge('Z', 'A', 1)
+        with GraphLog(self.directory) as log:
+            self.assertEqual(log.records_since_snapshot, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
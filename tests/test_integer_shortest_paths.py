@@ -0,0 +1,51 @@
+import unittest
+from graphs.weighted_graph import WeightedGraph
+from graphs.integer_shortest_paths import select_engine, single_source_distances
+
+
+class TestIntegerShortestPaths(unittest.TestCase):
+
+    def make_graph(self, weight_scale=1):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in 'ABCDEFG':
+            graph.add_vertex(vertex_id)
+        for vertex_id1, vertex_id2, weight in [('A', 'B', 4), ('A', 'C', 1), ('C', 'B', 2),
+                                               ('B', 'D', 5), ('C', 'D', 8), ('D', 'E', 0),
+                                               ('E', 'F', 3), ('B', 'F', 9)]:
+            graph.add_edge(vertex_id1, vertex_id2, weight * weight_scale)
+        return graph
+
+    def test_engines_match_heap(self):
+        expected = {'A': 0, 'B': 3, 'C': 1, 'D': 8, 'E': 8, 'F': 11}
+        for engine in ('auto', 'heap', 'dial', 'radix', 'delta'):
+            self.assertEqual(single_source_distances(self.make_graph(), 'A', engine), expected)
+        self.assertEqual(single_source_distances(self.make_graph(), 'A', 'delta', delta=2), expected)
+        self.assertEqual(single_source_distances(self.make_graph(), 'A', 'delta', processes=2), expected)
+
+        large = self.make_graph(weight_scale=10 ** 6)
+        self.assertEqual(single_source_distances(large, 'A', 'radix')['F'], 11 * 10 ** 6)
+
+    def test_select_engine(self):
+        self.assertEqual(select_engine(self.make_graph().get_adjacency()), 'dial')
+        self.assertEqual(select_engine(self.make_graph(10 ** 6).get_adjacency()), 'radix')
+        self.assertEqual(select_engine(self.make_graph(0.5).get_adjacency()), 'heap')
+        self.assertEqual(select_engine(self.make_graph().get_adjacency(), processes=2), 'delta')
+
+        graph = self.make_graph()
+        self.assertEqual(graph.find_shortest_path('A', 'F'), 11)
+        self.assertEqual(graph.find_shortest_path('F', 'A'), float('inf'))
+        graph.set_weight('E', 'F', 0.5)
+        self.assertEqual(select_engine(graph.get_adjacency()), 'heap')
+        self.assertEqual(graph.find_shortest_path('A', 'F'), 8.5)
+
+    def test_bad_engine(self):
+        with self.assertRaises(ValueError):
+            single_source_distances(self.make_graph(), 'A', 'fibonacci')
+        with self.assertRaises(ValueError):
+            single_source_distances(self.make_graph(0.5), 'A', 'dial')
+        with self.assertRaises(KeyError):
+            single_source_distances(self.make_graph(), 'Z')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+from graphs.landmarks import LandmarkOracle
+from graphs.integer_shortest_paths import shortest_path
+
+
+class TestLandmarkOracle(unittest.TestCase):
+
+    def make_grid(self, side=6):
+        graph = WeightedGraph(is_directed=False)
+        for row in range(side * side):
+            graph.add_vertex(row)
+        for row in range(side * side):
+            if row % side + 1 < side:
+                graph.add_edge(row, row + 1, 1 + row % 3)
+            if row + side < side * side:
+                graph.add_edge(row, row + side, 1 + row % 4)
+        return graph
+
+    def test_bounds_and_exact_paths(self):
+        graph = self.make_grid()
+        for strategy in ('farthest', 'degree', 'random'):
+            oracle = LandmarkOracle(graph, num_landmarks=4, strategy=strategy)
+            self.assertEqual(len(oracle.get_landmarks()), 4)
+            for start_id in range(0, 36, 5):
+                for target_id in range(36):
+                    distance, path = shortest_path(graph, start_id, target_id)
+                    lower, upper = oracle.distance_bounds(start_id, target_id)
+                    self.assertLessEqual(lower, distance)
+                    self.assertGreaterEqual(upper, distance)
+                    self.assertEqual(oracle.estimate_distance(start_id, target_id), upper)
+                    self.assertEqual(oracle.shortest_path(start_id, target_id)[0], distance)
+
+        oracle = LandmarkOracle(graph, num_landmarks=2)
+        # a landmark on the path makes the estimate exact
+        landmark = oracle.get_landmarks()[0]
+        self.assertEqual(oracle.estimate_distance(landmark, 14), shortest_path(graph, landmark, 14)[0])
+        self.assertEqual(oracle.memory_usage(), 2 * 36 * 8)
+
+    def test_directed_and_unreachable(self):
+        graph = Graph(is_directed=True)
+        for vertex_id in 'ABCDE':
+            graph.add_vertex(vertex_id)
+        for vertex_id1, vertex_id2 in ['AB', 'BC', 'CA', 'CD']:
+            graph.add_edge(vertex_id1, vertex_id2)
+        oracle = LandmarkOracle(graph, num_landmarks=2, processes=2)
+
+        self.assertEqual(oracle.shortest_path('A', 'D'), (3, ['A', 'B', 'C', 'D']))
+        self.assertEqual(oracle.shortest_path('D', 'A'), (float('inf'), None))
+        self.assertEqual(oracle.shortest_path('A', 'E'), (float('inf'), None))
+        self.assertEqual(oracle.distance_bounds('B', 'B'), (0, 0))
+        lower, upper = oracle.distance_bounds('B', 'A')
+        self.assertTrue(lower <= 2 <= upper)
+        # E is a component of its own, so it gets a landmark
+        self.assertIn('E', oracle.get_landmarks())
+
+        with self.assertRaises(KeyError):
+            oracle.distance_bounds('A', 'Z')
+        with self.assertRaises(ValueError):
+            LandmarkOracle(graph, strategy='central')
+
+
+if __name__ == '__main__':
+    unittest.main()
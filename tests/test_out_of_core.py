@@ -0,0 +1,122 @@
+import os
+import shutil
+import tempfile
+import unittest
+from graphs.graph import Graph
+from graphs.out_of_core import (
+    write_csr_file, write_sorted_edge_file, CSRFileSource, SortedEdgeFileSource,
+    BlockCache, ExternalTraversal)
+from util.file_reader import read_graph_from_file
+
+
+class TestOutOfCore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.graph = read_graph_from_file('test_files/graph_medium_undirected.txt')
+        self.csr_path = os.path.join(self.directory, 'graph.csr')
+        self.edge_path = os.path.join(self.directory, 'graph.edges')
+        write_csr_file(self.graph, self.csr_path)
+        write_sorted_edge_file(self.graph, self.edge_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_block_cache_evicts_least_recently_used(self):
+        loads = []
+        cache = BlockCache(lambda number: loads.append(number) or number, capacity=2)
+        for number in [0, 1, 0, 2, 1]:
+            cache.get(number)
+
+        self.assertEqual(loads, [0, 1, 2, 1])
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+    def test_csr_file_source(self):
+        source = CSRFileSource(self.csr_path, rows_per_block=2, cache_blocks=1)
+        try:
+            self.assertEqual(source.num_vertices(), 6)
+            self.assertEqual(source.get_id(source.get_index('D')), 'D')
+            neighbors = sorted(source.get_id(index) for index in source.neighbors(source.get_index('D')))
+            self.assertEqual(neighbors, ['B', 'C', 'E', 'F'])
+            with self.assertRaises(KeyError):
+                source.get_index('Z')
+
+            traversal = ExternalTraversal(source, max_in_memory=2, spill_dir=self.directory)
+            for distance in range(4):
+                self.assertEqual(
+                    sorted(traversal.find_vertices_n_away('A', distance)),
+                    sorted(self.graph.find_vertices_n_away('A', distance)))
+            self.assertEqual(list(traversal.dfs('A'))[0], 'A')
+            self.assertEqual(len(list(traversal.dfs('A'))), 6)
+        finally:
+            source.close()
+
+    def test_sorted_edge_file_source(self):
+        source = SortedEdgeFileSource(self.edge_path, edges_per_block=3, cache_blocks=2)
+        try:
+            index_of = self.graph.get_id_table().get_index
+            self.assertEqual(sorted(source.neighbors(index_of('D'))),
+                             sorted(index_of(vertex_id) for vertex_id in 'BCEF'))
+            self.assertEqual(len(source.neighbors(99)), 0)
+
+            traversal = ExternalTraversal(source)
+            depths = dict(traversal.bfs(index_of('A')))
+            self.assertEqual(depths[index_of('F')], 3)
+            self.assertEqual(len(depths), 6)
+        finally:
+            source.close()
+
+    def test_resume_from_checkpoint(self):
+        checkpoint_path = os.path.join(self.directory, 'bfs.checkpoint')
+        source = CSRFileSource(self.csr_path)
+        try:
+            traversal = ExternalTraversal(source, checkpoint_path, checkpoint_every=1)
+            expected = list(ExternalTraversal(source).bfs('A'))
+
+            # stop partway through, as if the process had crashed
+            run = traversal.bfs('A')
+            seen = [next(run) for _ in range(3)]
+            del run
+
+            # the last vertex handed out wasn't checkpointed yet, so it repeats
+            resumed = list(ExternalTraversal(source, checkpoint_path).resume())
+            self.assertEqual(resumed[0], seen[-1])
+            self.assertEqual(seen[:-1] + resumed, expected)
+            self.assertFalse(os.path.exists(checkpoint_path))
+        finally:
+            source.close()
+
+    def test_resume_spilled_frontier(self):
+        # a star spills its BFS level and DFS stack to segment files
+        graph = Graph(is_directed=False)
+        for vertex_id in range(40):
+            graph.add_vertex(str(vertex_id))
+        for vertex_id in range(1, 40):
+            graph.add_edge('0', str(vertex_id))
+        csr_path = os.path.join(self.directory, 'star.csr')
+        checkpoint_path = os.path.join(self.directory, 'star.checkpoint')
+        write_csr_file(graph, csr_path)
+        source = CSRFileSource(csr_path)
+        try:
+            for start in ('bfs', 'dfs'):
+                options = {'max_in_memory': 4, 'spill_dir': self.directory}
+                expected = list(getattr(ExternalTraversal(source, **options), start)('0'))
+                run = getattr(ExternalTraversal(source, checkpoint_path, 5, **options), start)('0')
+                seen = [next(run) for _ in range(7)]
+                del run
+                self.assertTrue(os.listdir(checkpoint_path + '.segments'))
+
+                # crash again before the next checkpoint: its segments must still be there
+                run = ExternalTraversal(source, checkpoint_path, 5, **options).resume()
+                self.assertEqual([next(run), next(run)], expected[5:7])
+                del run
+                resumed = list(ExternalTraversal(source, checkpoint_path, 5, **options).resume())
+                self.assertEqual(seen[:5] + resumed, expected)
+                self.assertFalse(os.path.exists(checkpoint_path + '.segments'))
+        finally:
+            source.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
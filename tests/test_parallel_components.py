@@ -0,0 +1,41 @@
+import unittest
+from graphs.graph import Graph
+from graphs.parallel_components import parallel_component_labels, parallel_connected_components
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestParallelComponents(unittest.TestCase):
+
+    def make_graph(self, is_directed=False):
+        """Components {0..5 chain}, {6, 7}, {8} and {9..11 cycle}, added out of order."""
+        graph = Graph(is_directed=is_directed)
+        for row in range(12):
+            graph.add_vertex(str(row))
+        for from_row, to_row in [(4, 5), (0, 1), (3, 2), (7, 6), (1, 2), (3, 4),
+                                 (9, 10), (10, 11), (11, 9), (8, 8)]:
+            graph.add_edge(str(from_row), str(to_row))
+        return graph
+
+    def test_labels_are_smallest_row(self):
+        labels, vertex_ids = parallel_component_labels(self.make_graph(), processes=1)
+        self.assertEqual(labels.tolist(), [0, 0, 0, 0, 0, 0, 6, 6, 8, 9, 9, 9])
+        self.assertEqual(vertex_ids[6], '6')
+
+    def test_matches_serial(self):
+        for is_directed in (False, True):
+            graph = self.make_graph(is_directed)
+            for processes in (1, 2):
+                self.assertEqual(parallel_connected_components(graph, processes),
+                                 graph.get_connected_components())
+
+    def test_empty_graph(self):
+        self.assertEqual(parallel_connected_components(Graph(), processes=2), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from graphs.graph import Graph
+from graphs.partition import (
+    Partition, bfs_partition, label_propagation_partition, multilevel_partition,
+    sharded_connected_components, sharded_bfs_distances)
+
+
+class TestPartition(unittest.TestCase):
+
+    def make_grid(self, size, is_directed=False):
+        """A size x size grid, with vertex ids 'row,column'."""
+        graph = Graph(is_directed=is_directed)
+        for row in range(size):
+            for column in range(size):
+                graph.add_vertex(f'{row},{column}')
+        for row in range(size):
+            for column in range(size):
+                if column + 1 < size:
+                    graph.add_edge(f'{row},{column}', f'{row},{column + 1}')
+                if row + 1 < size:
+                    graph.add_edge(f'{row},{column}', f'{row + 1},{column}')
+        return graph
+
+    def test_partition_tables(self):
+        graph = Graph(is_directed=False)
+        for vertex_id in 'ABCD':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        graph.add_edge('B','C')
+        graph.add_edge('C','D')
+        partition = Partition(graph, [0, 0, 1, 1], 2)
+
+        self.assertEqual(partition.get_parts(), [['A', 'B'], ['C', 'D']])
+        self.assertEqual(partition.get_part('C'), 1)
+        self.assertEqual(partition.cut_size(), 1)
+        self.assertEqual(partition.get_boundary_table(), [{'B': [1]}, {'C': [0]}])
+
+        shard = partition.get_shard(1)
+        self.assertEqual(sorted(vertex.get_id() for vertex in shard.get_vertices()), ['C', 'D'])
+        self.assertEqual([vertex.get_id() for vertex in shard.get_vertex('C').get_neighbors()], ['D'])
+
+    def test_balanced_parts(self):
+        graph = self.make_grid(12)
+        for partitioner in (bfs_partition, label_propagation_partition, multilevel_partition):
+            partition = partitioner(graph, 4, seed=0)
+            self.assertEqual(sum(partition.get_part_sizes()), 144)
+            self.assertLessEqual(partition.get_imbalance(), 1.05)
+            # much better than a random split, which cuts about 3/4 of the 264 edges
+            self.assertLess(partition.cut_size(), 100)
+
+        self.assertLessEqual(multilevel_partition(graph, 4, seed=0).cut_size(),
+                             bfs_partition(graph, 4).cut_size())
+        with self.assertRaises(ValueError):
+            bfs_partition(graph, 0)
+
+    def test_sharded_components(self):
+        graph = self.make_grid(6)
+        graph.add_vertex('X')
+        graph.add_vertex('Y')
+        graph.add_edge('X','Y')
+        partition = multilevel_partition(graph, 3, seed=1)
+
+        for processes in (1, 2):
+            self.assertEqual(sharded_connected_components(partition, processes),
+                             graph.get_connected_components())
+
+    def test_sharded_bfs(self):
+        graph = self.make_grid(6, is_directed=True)
+        partition = label_propagation_partition(graph, 3, seed=2)
+
+        for processes in (1, 2):
+            depths = sharded_bfs_distances(partition, '0,0', processes)
+            self.assertEqual(len(depths), 36)
+            self.assertEqual(depths['5,5'], 10)
+            self.assertEqual(sorted(vertex_id for vertex_id, depth in depths.items() if depth == 2),
+                             sorted(graph.find_vertices_n_away('0,0', 2)))
+        self.assertEqual(sharded_bfs_distances(partition, '5,5'), {'5,5': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
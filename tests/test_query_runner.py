@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from graphs.weighted_graph import WeightedGraph
+from util.graph_log import write_snapshot
+from util.query_runner import load_graph, parse_query, run_queries
+
+
+class TestQueryRunner(unittest.TestCase):
+
+    def test_parse_query(self):
+        self.assertEqual(parse_query('path A E'), {'op': 'path', 'source': 'A', 'target': 'E'})
+        self.assertEqual(parse_query('{"op": "khop", "source": "A", "k": 2, "id": 7}'),
+                         {'op': 'khop', 'source': 'A', 'k': 2, 'id': 7})
+        for line in ('path A', 'bogus', '{"op": "path", "source": "A"}', '{not json'):
+            with self.assertRaises(ValueError):
+                parse_query(line)
+
+    def test_run_queries(self):
+        graph = load_graph('test_files/graph_medium_undirected.txt')
+        lines = ['path A F', '# comment', '', 'khop A 2', 'path A Z', '{"op": "components", "id": "c"}']
+        for processes in (1, 2):
+            records = list(run_queries(graph, lines, processes))
+            self.assertEqual([record['id'] for record in records], [1, 4, 5, 'c'])
+            self.assertEqual(records[0]['result'], {'distance': 3, 'path': ['A', 'C', 'E', 'F']})
+            self.assertEqual(sorted(records[1]['result']), ['D', 'E'])
+            self.assertIn('KeyError', records[2]['error'])
+            self.assertEqual(records[3]['result'], [['A', 'B', 'C', 'D', 'E', 'F']])
+            self.assertTrue(all(record['seconds'] >= 0 for record in records))
+
+        # k must be a whole number of hops
+        lines = ['khop A -1', '{"op": "khop", "source": "A", "k": 1.5}', '{"op": "khop", "source": "A", "k": 2}']
+        records = list(run_queries(graph, lines))
+        self.assertIn('ValueError', records[0]['error'])
+        self.assertIn('ValueError', records[1]['error'])
+        self.assertEqual(sorted(records[2]['result']), ['D', 'E'])
+
+    def test_weighted_snapshot(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in 'ABC':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 5)
+        graph.add_edge('B', 'C', 1)
+        graph.add_edge('A', 'C', 9)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.snap')
+            write_snapshot(graph, path)
+            loaded = load_graph(path)
+        records = list(run_queries(loaded, ['path A C', 'path C A', 'toposort']))
+        self.assertEqual(records[0]['result'], {'distance': 6, 'path': ['A', 'B', 'C']})
+        self.assertIsNone(records[1]['result'])
+        self.assertEqual(records[2]['result'], ['A', 'B', 'C'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+from graphs.shortest_paths import (
+    johnson_all_pairs, find_negative_cycle, bellman_ford_distances, bellman_ford_path,
+    k_shortest_paths, NegativeCycleError)
+
+
+class TestJohnson(unittest.TestCase):
+
+    def make_graph(self):
+        """A directed graph with negative edges but no negative cycle."""
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in 'ABCDE':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B', 4)
+        graph.add_edge('A','C', 2)
+        graph.add_edge('C','B', -3)
+        graph.add_edge('B','D', 2)
+        graph.add_edge('D','E', -1)
+        graph.add_edge('C','E', 5)
+        return graph
+
+    def test_johnson_matches_floyd_warshall(self):
+        graph = self.make_graph()
+        expected = graph.floyd_warshall()
+
+        for processes in (1, 2):
+            results = dict(johnson_all_pairs(graph, processes=processes))
+            self.assertEqual(list(results), ['A', 'B', 'C', 'D', 'E'])
+            for source, distances in results.items():
+                reachable = {target: distance
+                    for target, distance in expected[source].items()
+                    if distance != float('inf')}
+                self.assertEqual(distances, reachable)
+
+        self.assertEqual(results['A']['E'], 0)
+
+    def test_johnson_unweighted(self):
+        graph = Graph(is_directed=False)
+        for vertex_id in 'ABC':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        graph.add_edge('B','C')
+
+        results = dict(johnson_all_pairs(graph))
+        self.assertEqual(results['A'], {'A': 0, 'B': 1, 'C': 2})
+
+    def test_negative_cycle(self):
+        graph = self.make_graph()
+        graph.add_edge('E','C', -2)
+
+        with self.assertRaises(NegativeCycleError) as error:
+            list(johnson_all_pairs(graph))
+        cycle = error.exception.cycle
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(sorted(set(cycle)), ['B', 'C', 'D', 'E'])
+
+        self.assertEqual(find_negative_cycle(graph), cycle)
+        self.assertIsNone(find_negative_cycle(self.make_graph()))
+        with self.assertRaises(NegativeCycleError):
+            graph.floyd_warshall()
+
+
+class TestBellmanFord(unittest.TestCase):
+
+    def make_graph(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in 'ABCDEF':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B', 4)
+        graph.add_edge('A','C', 2)
+        graph.add_edge('C','B', -3)
+        graph.add_edge('B','D', 2)
+        graph.add_edge('D','E', -1)
+        return graph
+
+    def test_distances_and_path(self):
+        graph = self.make_graph()
+        self.assertEqual(bellman_ford_distances(graph, 'A'),
+                         {'A': 0, 'B': -1, 'C': 2, 'D': 1, 'E': 0})
+        self.assertEqual(bellman_ford_path(graph, 'A', 'E'), (0, ['A', 'C', 'B', 'D', 'E']))
+        self.assertEqual(bellman_ford_path(graph, 'A', 'F'), (float('inf'), None))
+
+        # find_shortest_path switches away from Dijkstra for negative weights
+        self.assertEqual(graph.find_shortest_path('A', 'B'), -1)
+        with self.assertRaises(KeyError):
+            bellman_ford_distances(graph, 'Z')
+
+    def test_negative_cycle_only_if_reachable(self):
+        graph = self.make_graph()
+        graph.add_edge('F','A', 1)
+        graph.add_edge('E','F', -5)
+
+        with self.assertRaises(NegativeCycleError) as error:
+            bellman_ford_distances(graph, 'B')
+        self.assertEqual(error.exception.cycle[0], error.exception.cycle[-1])
+        with self.assertRaises(NegativeCycleError):
+            graph.find_shortest_path('A', 'E')
+
+        graph = self.make_graph()
+        graph.add_vertex('G')
+        graph.add_edge('F','G', -2)
+        graph.add_edge('G','F', 1)
+        self.assertEqual(bellman_ford_distances(graph, 'A')['E'], 0)
+
+
+class TestPathEnumeration(unittest.TestCase):
+
+    def make_graph(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in 'CDEFGH':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('C','D', 3)
+        graph.add_edge('C','E', 2)
+        graph.add_edge('D','F', 4)
+        graph.add_edge('E','D', 1)
+        graph.add_edge('E','F', 2)
+        graph.add_edge('E','G', 3)
+        graph.add_edge('F','G', 2)
+        graph.add_edge('F','H', 1)
+        graph.add_edge('G','H', 2)
+        return graph
+
+    def test_yen_k_shortest(self):
+        graph = self.make_graph()
+        paths = list(graph.find_k_shortest_paths('C', 'H', k=3))
+        self.assertEqual(paths, [
+            (5, ['C', 'E', 'F', 'H']),
+            (7, ['C', 'E', 'G', 'H']),
+            (8, ['C', 'D', 'F', 'H'])])
+
+        every_path = list(graph.find_k_shortest_paths('C', 'H'))
+        self.assertEqual(len(every_path), 7)
+        self.assertEqual([distance for distance, _ in every_path],
+                         sorted(distance for distance, _ in every_path))
+        self.assertEqual(list(graph.find_k_shortest_paths('H', 'C')), [])
+
+    def test_yen_is_lazy(self):
+        paths = k_shortest_paths(self.make_graph(), 'C', 'H')
+        self.assertEqual(next(paths), (5, ['C', 'E', 'F', 'H']))
+        with self.assertRaises(KeyError):
+            k_shortest_paths(self.make_graph(), 'C', 'Z')
+
+    def test_yen_negative_weights(self):
+        graph = self.make_graph()
+        graph.add_edge('D','H', -4)
+        self.assertEqual(sorted(graph.find_k_shortest_paths('C', 'H', k=3)),
+                         [(-1, ['C', 'D', 'H']), (-1, ['C', 'E', 'D', 'H']), (5, ['C', 'E', 'F', 'H'])])
+
+    def test_all_shortest_paths(self):
+        graph = Graph(is_directed=False)
+        for vertex_id in 'ABCDE':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        graph.add_edge('A','C')
+        graph.add_edge('B','D')
+        graph.add_edge('C','D')
+        graph.add_edge('D','E')
+
+        self.assertEqual(sorted(graph.find_all_shortest_paths('A', 'E')),
+                         [['A', 'B', 'D', 'E'], ['A', 'C', 'D', 'E']])
+        self.assertEqual(list(graph.find_all_shortest_paths('A', 'A')), [['A']])
+
+        weighted = self.make_graph()
+        self.assertEqual(sorted(weighted.find_all_shortest_paths('C', 'D')),
+                         [['C', 'D'], ['C', 'E', 'D']])
+
+
+if __name__ == '__main__':
+    unittest.main()
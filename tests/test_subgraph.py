@@ -0,0 +1,139 @@
+import unittest
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+from graphs.subgraph import subgraph_view, induced_subgraph
+from util.file_reader import read_graph_from_file
+
+
+class TestSubgraphView(unittest.TestCase):
+
+    def test_view_excludes_vertices(self):
+        graph = read_graph_from_file('test_files/graph_medium_undirected.txt')
+        view = subgraph_view(graph, vertex_filter=lambda vertex_id: vertex_id != 'C')
+
+        self.assertEqual(len(view.get_vertices()), 5)
+        self.assertFalse(view.contains_id('C'))
+        self.assertIsNone(view.get_vertex('C'))
+        self.assertEqual(view.find_shortest_path('A', 'E'), ['A', 'B', 'D', 'E'])
+        # the underlying graph is untouched
+        self.assertEqual(len(graph.find_shortest_path('A', 'E')), 3)
+
+    def test_view_with_edge_filter(self):
+        graph = Graph(is_directed=True)
+        for vertex_id in 'ABC':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B')
+        graph.add_edge('B', 'C')
+        graph.add_edge('A', 'C')
+
+        view = subgraph_view(graph, edge_filter=lambda from_id, to_id: (from_id, to_id) != ('A', 'C'))
+        self.assertEqual(view.find_shortest_path('A', 'C'), ['A', 'B', 'C'])
+        self.assertEqual(view.find_vertices_n_away('A', 2), ['C'])
+        self.assertTrue(graph.has_edge('A', 'C'))
+        self.assertFalse(view.has_edge('A', 'C'))
+        self.assertTrue(view.has_edge('A', 'B'))
+
+    def test_view_adjacency_is_cached_until_changed(self):
+        graph = Graph(is_directed=True)
+        for vertex_id in 'ABC':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B')
+        graph.add_edge('B', 'C')
+
+        calls = []
+
+        def vertex_filter(vertex_id):
+            calls.append(vertex_id)
+            return vertex_id != 'C'
+
+        view = subgraph_view(graph, vertex_filter=vertex_filter)
+        adjacency = view.get_adjacency()
+        self.assertIs(view.get_id_table(), adjacency.id_table)
+        self.assertEqual(adjacency.num_vertices(), 2)
+        del calls[:]
+        self.assertIs(view.get_adjacency(), adjacency)
+        self.assertEqual(calls, [])
+
+        # changing the underlying graph, or refreshing, rebuilds it
+        graph.add_vertex('D')
+        changed = view.get_adjacency()
+        self.assertIsNot(changed, adjacency)
+        self.assertEqual(changed.num_vertices(), 3)
+        view.refresh()
+        self.assertIsNot(view.get_adjacency(), changed)
+
+    def test_weighted_view_shortest_path(self):
+        graph = WeightedGraph(is_directed=False)
+        for vertex_id in 'ABCD':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 1)
+        graph.add_edge('B', 'D', 1)
+        graph.add_edge('A', 'C', 5)
+        graph.add_edge('C', 'D', 5)
+
+        self.assertEqual(graph.find_shortest_path('A', 'D'), 2)
+        view = subgraph_view(graph, vertex_ids=['A', 'C', 'D'])
+        self.assertEqual(view.find_shortest_path('A', 'D'), 10)
+
+        light = subgraph_view(graph, edge_filter=lambda from_id, to_id, weight: weight < 5)
+        self.assertEqual(len(light.get_vertex('A').get_neighbors()), 1)
+        self.assertEqual(light.get_weight('A', 'B'), 1)
+        with self.assertRaises(KeyError):
+            light.get_weight('A', 'C')
+        with self.assertRaises(TypeError):
+            light.set_weight('A', 'B', 2)
+
+    def test_view_is_read_only(self):
+        graph = Graph()
+        graph.add_vertex('A')
+        view = subgraph_view(graph)
+
+        with self.assertRaises(TypeError):
+            view.add_vertex('B')
+        with self.assertRaises(TypeError):
+            view.add_edge('A', 'A')
+
+
+class TestInducedSubgraph(unittest.TestCase):
+
+    def test_induced_subgraph(self):
+        graph = read_graph_from_file('test_files/graph_medium_undirected.txt')
+        subgraph = induced_subgraph(graph, ['A', 'B', 'D', 'X'])
+
+        self.assertIsInstance(subgraph, Graph)
+        self.assertFalse(subgraph.is_directed)
+        self.assertEqual(len(subgraph.get_vertices()), 3)
+        self.assertEqual(len(subgraph.get_vertex('B').get_neighbors()), 2)
+        self.assertEqual(len(subgraph.get_vertex('D').get_neighbors()), 1)
+
+    def test_materialize_weighted_view(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in 'ABC':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 2)
+        graph.add_edge('B', 'C', 7)
+
+        copy = subgraph_view(graph, edge_filter=lambda from_id, to_id, weight: weight < 5).materialize()
+
+        self.assertIsInstance(copy, WeightedGraph)
+        self.assertEqual(copy.get_vertex('A').get_neighbors_with_weights()[0][1], 2)
+        self.assertEqual(copy.get_vertex('B').get_neighbors(), [])
+
+    def test_copy_keeps_graph_options(self):
+        graph = WeightedGraph(is_directed=True, duplicate_edges='min')
+        for vertex_id in 'ABC':
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 5)
+        graph.add_edge('B', 'C', 1)
+        graph.enable_in_edge_index()
+
+        for copy in (induced_subgraph(graph, 'AB'), subgraph_view(graph, vertex_ids='AB').materialize()):
+            self.assertEqual(copy.duplicate_edges, 'min')
+            self.assertTrue(copy.has_in_edge_index())
+            self.assertEqual([vertex.get_id() for vertex in copy.get_in_neighbors('B')], ['A'])
+            copy.add_edge('A', 'B', 3)
+            self.assertEqual(copy.get_weight('A', 'B'), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+"""
+Graph input/output helpers. Public names are imported lazily, as in
+`graphs`, so importing the package stays cheap.
+"""
+import importlib
+
+# public name -> submodule that defines it
+_EXPORTS = {
+    'read_graph_from_file': 'file_reader',
+    'GraphLog': 'graph_log',
+    'read_snapshot': 'graph_log',
+    'write_snapshot': 'graph_log',
+    'load_graph': 'query_runner',
+    'run_queries': 'query_runner',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule behind a public name on first use."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'{__name__}.{_EXPORTS[name]}'), name)
+    globals()[name] = value # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
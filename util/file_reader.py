@@ -31,7 +31,10 @@ def read_graph_from_file(filename):
             graph.add_vertex(_)
 
         for line in f:
-            graph.add_edge(line[1], line[3])
+            line = line.strip()
+            if line: # edges are written (id1,id2)
+                vertex_id1, vertex_id2 = line.strip('()').split(',')[:2]
+                graph.add_edge(vertex_id1, vertex_id2)
             
         return graph
 
@@ -0,0 +1,300 @@
+import os
+import pickle
+import struct
+import time
+import zlib
+
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+
+SNAPSHOT_MAGIC = b'GLOGSNP1'
+SEGMENT_MAGIC = b'GLOGSEG1'
+RECORD_HEADER = struct.Struct('<II') # payload length, crc32 of payload
+
+ADD_VERTEX = 0
+ADD_EDGE = 1
+SET_WEIGHT = 2
+
+
+class GraphLog(object):
+    """
+    Durable graph state kept as a compact snapshot plus an append-only
+    binary log of the `add_vertex`, `add_edge` and `set_weight` calls made
+    since the snapshot.
+
+    Restarting loads the snapshot in one bulk read and replays only the log
+    tail, so recovery time tracks recent changes rather than the number of
+    edges ever added. Log records are written through a buffer and fsynced
+    in batches; `sync()` forces one. Each record carries a checksum, so a
+    record torn by a crash is detected and dropped on the next start.
+
+    The directory holds `snapshot` and log segments `log.<number>`. Taking a
+    snapshot starts a new segment and deletes the ones it covers.
+    """
+
+    def __init__(self, directory, graph=None, sync_every=1024, sync_interval=1.0, snapshot_every=None):
+        """
+        Open (or create) the log in `directory` and recover its graph.
+
+        Parameters:
+        directory (string): Where the snapshot and log segments live.
+        graph (Graph): The empty graph to start from if the directory holds
+            no snapshot yet; its type and options are kept. Defaults to an
+            undirected Graph.
+        sync_every (integer): Fsync after this many records.
+        sync_interval (float): Also fsync on the next record once this many
+            seconds have passed since the last fsync. None disables it.
+        snapshot_every (integer): Take a snapshot automatically after this
+            many records. None means only when `snapshot()` is called.
+        """
+        self.directory = directory
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        self.unsynced = 0 # records written since the last fsync
+        self.records_since_snapshot = 0
+        self.last_sync = time.monotonic()
+        self.file = None
+
+        os.makedirs(directory, exist_ok=True)
+        snapshot_path = os.path.join(directory, 'snapshot')
+        if os.path.exists(snapshot_path):
+            self.graph, self.segment = _read_snapshot(snapshot_path)
+        else:
+            self.graph = graph if graph is not None else Graph(is_directed=False)
+            self.segment = 0
+            self.snapshot()
+            return
+
+        # replay every segment written since the snapshot, oldest first
+        segments = sorted(number for number in _segment_numbers(directory) if number >= self.segment)
+        for number in segments:
+            self.records_since_snapshot += self.__replay(self.__segment_path(number))
+        if segments:
+            self.segment = segments[-1]
+        self.__open_segment()
+
+    def __segment_path(self, number):
+        return os.path.join(self.directory, f'log.{number:08d}')
+
+    def __open_segment(self):
+        """Open the current segment for appending, writing its header if new."""
+        path = self.__segment_path(self.segment)
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(SEGMENT_MAGIC)
+            self.sync()
+
+    def __replay(self, path):
+        """
+        Apply every intact record in a segment to the graph. A torn record
+        at the end is cut off so new records append cleanly.
+
+        Returns:
+        integer: The number of records applied.
+        """
+        applied = 0
+        with open(path, 'r+b') as segment:
+            data = segment.read()
+            if data[:len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+                raise ValueError(f'{path} is not a graph log segment')
+
+            offset = len(SEGMENT_MAGIC)
+            while offset + RECORD_HEADER.size <= len(data):
+                length, checksum = RECORD_HEADER.unpack_from(data, offset)
+                payload = data[offset + RECORD_HEADER.size:offset + RECORD_HEADER.size + length]
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    break
+                self.__apply(pickle.loads(payload))
+                offset += RECORD_HEADER.size + length
+                applied += 1
+
+            if offset < len(data):
+                segment.truncate(offset)
+        return applied
+
+    def __apply(self, record):
+        """Make the graph call a record stands for."""
+        operation, arguments = record[0], record[1:]
+        if operation == ADD_VERTEX:
+            self.graph.add_vertex(*arguments)
+        elif operation == ADD_EDGE:
+            self.graph.add_edge(*arguments)
+        elif operation == SET_WEIGHT:
+            self.graph.set_weight(*arguments)
+        else:
+            raise ValueError(f'Unknown graph log operation {operation}')
+
+    def __append(self, record):
+        """Apply a record to the graph, then log it (so failed calls aren't logged)."""
+        self.__apply(record)
+        payload = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+        self.file.write(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+        self.file.write(payload)
+
+        self.unsynced += 1
+        self.records_since_snapshot += 1
+        if self.snapshot_every is not None and self.records_since_snapshot >= self.snapshot_every:
+            self.snapshot()
+        elif self.unsynced >= self.sync_every or (
+                self.sync_interval is not None and time.monotonic() - self.last_sync >= self.sync_interval):
+            self.sync()
+
+    def add_vertex(self, vertex_id):
+        """Add a vertex to the graph and log it."""
+        self.__append((ADD_VERTEX, vertex_id))
+
+    def add_edge(self, vertex_id1, vertex_id2, weight=None):
+        """
+        Add an edge to the graph and log it. `weight` is for weighted graphs.
+
+        Raises:
+        KeyError: If either vertex is not in the graph. WeightedGraph.add_edge
+            only returns False then, which would log a call that did nothing.
+        """
+        if not self.graph.contains_id(vertex_id1) or not self.graph.contains_id(vertex_id2):
+            raise KeyError("One or both vertices are not in the graph!")
+        if self.graph.is_weighted():
+            self.__append((ADD_EDGE, vertex_id1, vertex_id2, weight))
+        else:
+            self.__append((ADD_EDGE, vertex_id1, vertex_id2))
+
+    def set_weight(self, vertex_id1, vertex_id2, weight):
+        """Change an edge weight in the graph and log it."""
+        self.__append((SET_WEIGHT, vertex_id1, vertex_id2, weight))
+
+    def sync(self):
+        """Flush buffered records and fsync them to disk."""
+        if self.file is not None:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def snapshot(self):
+        """
+        Write the whole graph to a new snapshot, start a fresh log segment
+        and delete the segments the snapshot now covers.
+        """
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+        self.segment += 1
+        _write_snapshot(self.graph, self.segment, os.path.join(self.directory, 'snapshot'))
+        self.records_since_snapshot = 0
+
+        for number in _segment_numbers(self.directory):
+            if number < self.segment:
+                os.remove(self.__segment_path(number))
+        self.__open_segment()
+
+    def close(self):
+        """Fsync outstanding records and close the log."""
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_snapshot(graph, path):
+    """
+    Write `graph` to a standalone binary snapshot file: flat CSR arrays
+    that `read_snapshot` loads back much faster than parsing a text edge
+    list. The file is also a valid `snapshot` for a GraphLog directory.
+    """
+    _write_snapshot(graph, 0, path)
+
+
+def read_snapshot(path):
+    """Load the graph stored in a snapshot file (see `write_snapshot`)."""
+    graph, _ = _read_snapshot(path)
+    return graph
+
+
+def _segment_numbers(directory):
+    """Return the numbers of the log segments in `directory`."""
+    return [int(name[4:]) for name in os.listdir(directory)
+            if name.startswith('log.') and name[4:].isdigit()]
+
+
+def _write_snapshot(graph, segment, path):
+    """
+    Atomically write the graph as flat CSR arrays, along with the number of
+    the first log segment that is not part of it.
+    """
+    csr = graph.get_adjacency()
+    state = {
+        'is_directed': graph.is_directed,
+        'is_weighted': graph.is_weighted(),
+        'duplicate_edges': getattr(graph, 'duplicate_edges', 'first'),
+        'track_in_edges': graph.has_in_edge_index(),
+        'segment': segment,
+        'vertex_ids': csr.vertex_ids,
+        'indptr': csr.indptr,
+        'indices': csr.indices,
+        'weights': csr.weights,
+    }
+    body = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as snapshot:
+        snapshot.write(SNAPSHOT_MAGIC)
+        snapshot.write(struct.pack('<I', zlib.crc32(body)))
+        snapshot.write(body)
+        snapshot.flush()
+        os.fsync(snapshot.fileno())
+    os.replace(temporary_path, path)
+
+    # make the rename itself durable
+    if hasattr(os, 'O_DIRECTORY'):
+        directory = os.open(os.path.dirname(path) or '.', os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def _read_snapshot(path):
+    """
+    Load a snapshot written by `_write_snapshot`.
+
+    Returns:
+    tuple: (graph, number of the first log segment to replay)
+    """
+    with open(path, 'rb') as snapshot:
+        data = snapshot.read()
+    if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        raise ValueError(f'{path} is not a graph snapshot')
+    checksum, = struct.unpack_from('<I', data, len(SNAPSHOT_MAGIC))
+    body = data[len(SNAPSHOT_MAGIC) + 4:]
+    if zlib.crc32(body) != checksum:
+        raise ValueError(f'{path} is corrupt')
+    state = pickle.loads(body)
+
+    if state['is_weighted']:
+        graph = WeightedGraph(is_directed=state['is_directed'], duplicate_edges=state['duplicate_edges'])
+    else:
+        graph = Graph(is_directed=state['is_directed'])
+    for vertex_id in state['vertex_ids']:
+        graph.add_vertex(vertex_id)
+
+    # every stored edge goes straight onto its vertex, one direction at a time,
+    # exactly as the CSR arrays list them
+    vertices = [graph.get_vertex(vertex_id) for vertex_id in state['vertex_ids']]
+    indptr, indices, weights = state['indptr'], state['indices'], state['weights']
+    for row, vertex_obj in enumerate(vertices):
+        for slot in range(indptr[row], indptr[row + 1]):
+            if state['is_weighted']:
+                vertex_obj.add_neighbor(vertices[indices[slot]], weights[slot])
+            else:
+                vertex_obj.add_neighbor(vertices[indices[slot]])
+
+    if state['track_in_edges']:
+        graph.enable_in_edge_index()
+    return graph, state['segment']
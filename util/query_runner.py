@@ -0,0 +1,160 @@
+import json
+import time
+
+from graphs._pool import SharedPool
+from graphs.integer_shortest_paths import shortest_path
+from util.file_reader import read_graph_from_file
+from util.graph_log import SNAPSHOT_MAGIC, read_snapshot
+
+GRAPH_FORMATS = ('auto', 'text', 'snapshot')
+
+# query operation -> names of its arguments, in the order the text form gives them
+OPERATIONS = {
+    'path': ('source', 'target'),
+    'khop': ('source', 'k'),
+    'components': (),
+    'toposort': (),
+}
+
+
+def load_graph(path, graph_format='auto'):
+    """
+    Load a graph from a text edge list (see `read_graph_from_file`) or a
+    binary snapshot (see `write_snapshot`).
+
+    Parameters:
+    path (string): The file to load.
+    graph_format (string): 'text', 'snapshot', or 'auto' (the default) to
+        tell them apart by the snapshot's magic bytes.
+    """
+    if graph_format not in GRAPH_FORMATS:
+        raise ValueError(f'graph_format must be one of {GRAPH_FORMATS}')
+    if graph_format == 'auto':
+        with open(path, 'rb') as f:
+            is_snapshot = f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+        graph_format = 'snapshot' if is_snapshot else 'text'
+    if graph_format == 'snapshot':
+        return read_snapshot(path)
+    return read_graph_from_file(path)
+
+
+def parse_query(line):
+    """
+    Parse one query line, either a JSON object such as
+    {"op": "path", "source": "A", "target": "E"} or the same query as words:
+    `path A E`, `khop A 2`, `components`, `toposort`.
+
+    Returns:
+    dict: The query, with 'op' and the operation's arguments.
+
+    Raises:
+    ValueError: If the line isn't a valid query.
+    """
+    line = line.strip()
+    if line.startswith('{'):
+        query = json.loads(line)
+    else:
+        words = line.split() or ['']
+        query = {'op': words[0]}
+        names = OPERATIONS.get(words[0])
+        if names is not None and len(words) - 1 != len(names):
+            raise ValueError(f"'{words[0]}' takes {len(names)} arguments")
+        query.update(zip(names or (), words[1:]))
+
+    if query.get('op') not in OPERATIONS:
+        raise ValueError(f'Unknown operation; expected one of {sorted(OPERATIONS)}')
+    missing = [name for name in OPERATIONS[query['op']] if name not in query]
+    if missing:
+        raise ValueError(f"'{query['op']}' is missing {', '.join(missing)}")
+    return query
+
+
+def _hop_count(k):
+    """
+    Return the 'k' of a khop query as a non-negative int. It may be an int
+    or, from the text form, a string of digits.
+
+    Raises:
+    ValueError: If k is not a whole number or is negative.
+    """
+    if isinstance(k, str):
+        k = k.strip()
+        k = int(k) if k.lstrip('+-').isdigit() else None
+    elif isinstance(k, float) and k.is_integer():
+        k = int(k)
+    if not isinstance(k, int) or isinstance(k, bool) or k < 0:
+        raise ValueError("'k' must be a non-negative integer")
+    return k
+
+
+def run_query(graph, query):
+    """Answer one parsed query; returns its JSON-ready result."""
+    operation = query['op']
+    if operation == 'path':
+        distance, path = shortest_path(graph, query['source'], query['target'])
+        if path is None:
+            return None
+        return {'distance': distance, 'path': path}
+    if operation == 'khop':
+        return graph.find_vertices_n_away(query['source'], _hop_count(query['k']))
+    if operation == 'components':
+        return graph.get_connected_components()
+    return graph.topological_sort()
+
+
+def answer(graph, number, line):
+    """
+    Parse and run query line `number`, timing it. Failures are reported in
+    the answer instead of raised, so one bad query doesn't stop a batch.
+
+    Returns:
+    dict: {'id', 'op', 'result' or 'error', 'seconds'}. The id is the
+    query's own 'id' if it gave one, else its line number.
+    """
+    start = time.perf_counter()
+    record = {'id': number}
+    try:
+        query = parse_query(line)
+        record['id'] = query.get('id', number)
+        record['op'] = query['op']
+        record['result'] = run_query(graph, query)
+    except (KeyError, TypeError, ValueError) as error:
+        record['error'] = f'{type(error).__name__}: {error.args[0] if error.args else error}'
+    record['seconds'] = time.perf_counter() - start
+    return record
+
+
+def _answer_item(graph, item):
+    """Pool task: answer one (line number, line) pair."""
+    return answer(graph, *item)
+
+
+def run_queries(graph, lines, processes=1, chunksize=16):
+    """
+    Answer a stream of query lines in order. Blank lines and lines starting
+    with '#' are skipped.
+
+    Parameters:
+    graph (Graph): The graph every query runs against.
+    lines (iterable<string>): The query lines, e.g. an open file.
+    processes (integer): Worker processes to spread the queries over. 1
+        answers them in this process and None means one per CPU.
+    chunksize (integer): Queries handed to a worker at a time.
+
+    Returns:
+    generator: Yields one answer dict per query (see `answer`).
+    """
+    items = ((number, line) for number, line in enumerate(lines, 1)
+             if line.strip() and not line.lstrip().startswith('#'))
+    if processes == 1:
+        for item in items:
+            yield answer(graph, *item)
+        return
+
+    with SharedPool(graph, processes) as pool:
+        yield from pool.imap(_answer_item, items, chunksize)
+
+
+def to_json_line(record):
+    """Encode an answer as one line of JSON."""
+    return json.dumps(record, default=str, allow_nan=False)